@@ -0,0 +1,49 @@
+"""
+Benchmark comparing the object-per-node DoublyLinkedList with the
+struct-of-arrays ArrayLinkedList: memory per element, build time and a full
+sequential scan.
+
+Run from the repository root:
+    python -m benchmarks.bench_array_linked_list --size 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.data_structures.fundamentals.linked_lists.array_linked_list import ArrayLinkedList
+from src.data_structures.fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList
+
+def bench(cls, size: int) -> None:
+    """Builds a list of `size` small ints and reports memory and timings."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    lst = cls()
+    for i in range(size):
+        lst.append(i & 0xFF)  # small cached ints, so only the list itself is measured
+    build_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in lst:
+        pass
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gc.collect()
+    gc_time = time.perf_counter() - start
+
+    print(f"{cls.__name__:18s} n={size:>10,d} {memory / size:7.1f} bytes/elem "
+          f"build={build_time:6.2f}s scan={scan_time:6.2f}s full gc={gc_time * 1e3:8.1f}ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    bench(DoublyLinkedList, args.size)
+    bench(ArrayLinkedList, args.size)
+
+if __name__ == "__main__":
+    main()
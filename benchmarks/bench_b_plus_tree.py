@@ -0,0 +1,91 @@
+"""
+Benchmark comparing BPlusTree with the pointer-based AVLTree on insertion,
+lookups and range scans, plus the file-backed store: bulk load, reopening an
+existing index, and cold lookups counted in page reads.
+
+Run from the repository root:
+    python -m benchmarks.bench_b_plus_tree --size 200000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.data_structures.advanced.b_plus_tree import BPlusTree, MmapPageStore
+from src.data_structures.trees.avl_tree import AVLTree
+
+def bench_memory(size: int, lookups) -> None:
+    """Times random inserts, lookups and a range scan in memory."""
+    keys = random.sample(range(size * 10), size)
+    for name, factory in [("AVLTree", AVLTree), ("BPlusTree(32)", lambda: BPlusTree(order=32)),
+                          ("BPlusTree(128)", lambda: BPlusTree(order=128))]:
+        structure = factory()
+        start = time.perf_counter()
+        if isinstance(structure, AVLTree):
+            for key in keys:
+                structure.insert(key)
+        else:
+            for key in keys:
+                structure.insert(key, key)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in lookups:
+            structure.search(key)
+        search_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        count = sum(1 for _ in structure.iter_range(size, size * 5))
+        range_time = time.perf_counter() - start
+        print(f"    {name:15s} insert={insert_time / size * 1e6:7.2f} us/op "
+              f"search={search_time / len(lookups) * 1e6:6.2f} us/op "
+              f"range({count})={range_time * 1e3:7.2f} ms")
+
+class CountingStore(MmapPageStore):
+    """An mmap store that counts page reads that miss the decoded-page cache."""
+    misses = 0
+
+    def read(self, page_id):
+        if page_id not in self._cache:
+            CountingStore.misses += 1
+        return super().read(page_id)
+
+def bench_mmap(size: int, lookups) -> None:
+    """Times bulk loading, reopening and cold lookups on a file-backed tree."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.bpt")
+        start = time.perf_counter()
+        with BPlusTree(MmapPageStore(path)) as tree:
+            tree.bulk_load((key, key * 2) for key in range(0, size * 2, 2))
+            height = tree.height()
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tree = BPlusTree(CountingStore(path, cache_pages=0))
+        open_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in lookups:
+            tree.get(key)
+        search_time = time.perf_counter() - start
+        tree.close()
+        print(f"    mmap bulk_load={load_time:.2f} s ({os.path.getsize(path) / 2**20:.1f} MiB, "
+              f"height {height}) open={open_time * 1e6:.0f} us")
+        print(f"    cold lookups={search_time / len(lookups) * 1e6:.2f} us/op, "
+              f"{CountingStore.misses / len(lookups):.1f} page reads/op")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    lookups = [random.randrange(args.size * 10) for _ in range(args.lookups)]
+    print(f"In memory, {args.size} random keys:")
+    bench_memory(args.size, lookups)
+    print(f"File-backed, {args.size} keys:")
+    bench_mmap(args.size, [key // 5 for key in lookups])
+
+if __name__ == "__main__":
+    main()
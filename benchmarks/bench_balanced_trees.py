@@ -0,0 +1,70 @@
+"""
+Benchmark comparing the plain BinarySearchTree against the self-balancing
+AVLTree and RedBlackTree on a sorted stream of keys.
+
+Sorted input is the worst case for an unbalanced BST: every insert appends to
+the rightmost path, so the tree degenerates into a linked list with O(n)
+search and O(n^2) total build time. The plain BST is therefore measured on
+a much smaller stream and its per-operation cost is reported for comparison.
+
+Run from the repository root:
+    python -m benchmarks.bench_balanced_trees --size 1000000
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.trees.avl_tree import AVLTree
+from src.data_structures.trees.binary_search_tree import BinarySearchTree
+from src.data_structures.trees.red_black_tree import RedBlackTree
+
+def height(node) -> int:
+    """Computes the height of a tree iteratively."""
+    best = 0
+    stack = [(node, 1)] if node is not None else []
+    while stack:
+        current, depth = stack.pop()
+        best = max(best, depth)
+        if current.left is not None:
+            stack.append((current.left, depth + 1))
+        if current.right is not None:
+            stack.append((current.right, depth + 1))
+    return best
+
+def bench(tree_class, size: int, lookups: int) -> None:
+    """Inserts `size` sorted keys, then times random searches."""
+    tree = tree_class()
+    start = time.perf_counter()
+    for key in range(size):
+        tree.insert(key)
+    insert_time = time.perf_counter() - start
+
+    probes = [random.randrange(size) for _ in range(lookups)]
+    start = time.perf_counter()
+    for key in probes:
+        tree.search(key)
+    search_time = time.perf_counter() - start
+
+    print(f"{tree_class.__name__:18s} n={size:>9,d} height={height(tree.root):>6d} "
+          f"insert={insert_time / size * 1e6:9.2f} us/op "
+          f"search={search_time / lookups * 1e6:9.2f} us/op")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000,
+                        help="number of sorted keys for the balanced trees")
+    parser.add_argument("--bst-size", type=int, default=20_000,
+                        help="number of sorted keys for the plain BST "
+                             "(building it takes quadratic time)")
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    bench(BinarySearchTree, args.bst_size, args.lookups)
+    bench(AVLTree, args.bst_size, args.lookups)
+    bench(RedBlackTree, args.bst_size, args.lookups)
+    bench(AVLTree, args.size, args.lookups)
+    bench(RedBlackTree, args.size, args.lookups)
+
+if __name__ == "__main__":
+    main()
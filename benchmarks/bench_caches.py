@@ -0,0 +1,90 @@
+"""
+Benchmark of the LRU, LFU and TTL caches on a skewed (Zipf-like) workload,
+compared with an OrderedDict LRU and a hand-rolled LRU that finds entries by
+scanning a DoublyLinkedList.
+
+Run from the repository root:
+    python -m benchmarks.bench_caches --capacity 1000 --requests 200000
+"""
+import argparse
+import random
+import time
+from collections import OrderedDict
+
+from src.data_structures.fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList
+from src.data_structures.hashing.caches import LFUCache, LRUCache, TTLCache
+
+class ScanningLRU:
+    """An LRU cache that locates entries with DoublyLinkedList.find (O(n) per hit)."""
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.values = {}
+        self.order = DoublyLinkedList()
+        self.hits = self.misses = 0
+
+    def get(self, key, default=None):
+        if key not in self.values:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.move_to_end(self.order.find(key))
+        return self.values[key]
+
+    def put(self, key, value):
+        if key in self.values:
+            self.order.delete(key)
+        elif len(self.values) >= self.capacity:
+            del self.values[self.order.remove_node(self.order.head)]
+        self.order.append(key)
+        self.values[key] = value
+
+class OrderedDictLRU:
+    """The classic OrderedDict-based LRU cache."""
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key, default=None):
+        if key not in self.data:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.data.move_to_end(key)
+        return self.data[key]
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.capacity:
+            self.data.popitem(last=False)
+
+def bench(name: str, cache, workload) -> None:
+    """Runs a read-through workload: get, and put on a miss."""
+    start = time.perf_counter()
+    for key in workload:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    elapsed = time.perf_counter() - start
+    hit_rate = cache.hits / (cache.hits + cache.misses)
+    print(f"    {name:14s} {elapsed / len(workload) * 1e6:7.2f} us/request  hit rate={hit_rate:.3f}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacity", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    universe = args.capacity * 20
+    workload = [int(universe * rng.random() ** 3) for _ in range(args.requests)]
+    print(f"{args.requests} requests, capacity {args.capacity}:")
+    # The scanning cache is too slow for the full workload; it gets the first 5%.
+    bench("ScanningLRU", ScanningLRU(args.capacity), workload[:args.requests // 20])
+    bench("OrderedDictLRU", OrderedDictLRU(args.capacity), workload)
+    bench("LRUCache", LRUCache(args.capacity), workload)
+    bench("LFUCache", LFUCache(args.capacity), workload)
+    bench("TTLCache", TTLCache(ttl=60, max_entries=args.capacity), workload)
+
+if __name__ == "__main__":
+    main()
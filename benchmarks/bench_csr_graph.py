@@ -0,0 +1,88 @@
+"""
+Benchmark of CSRGraph against a dict-of-sets adjacency: memory per edge,
+build time, and the time of a full breadth-first traversal and of summing
+every degree.
+
+Run from the repository root:
+    python -m benchmarks.bench_csr_graph --vertices 200000 --edges 2000000
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from collections import deque
+
+from src.data_structures.graphs.csr_graph import GraphBuilder
+
+def measure(build):
+    """Returns what `build()` returns, the seconds it took and the bytes it kept."""
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    # Tracing slows allocation down, so memory is measured on a second build.
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, kept
+
+def bfs(num_vertices, source, neighbors):
+    """Visits every vertex reachable from `source`; returns how many there were."""
+    seen = bytearray(num_vertices)
+    seen[source] = 1
+    queue = deque([source])
+    count = 1
+    while queue:
+        for v in neighbors(queue.popleft()):
+            if not seen[v]:
+                seen[v] = 1
+                count += 1
+                queue.append(v)
+    return count
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vertices", type=int, default=200_000)
+    parser.add_argument("--edges", type=int, default=2_000_000)
+    args = parser.parse_args()
+    n, m = args.vertices, args.edges
+
+    rng = random.Random(1)
+    sources = [rng.randrange(n) for _ in range(m)]
+    targets = [rng.randrange(n) for _ in range(m)]
+
+    def build_dict():
+        adjacency = {v: set() for v in range(n)}
+        for u, v in zip(sources, targets):
+            adjacency[u].add(v)
+        return adjacency
+
+    def build_csr():
+        builder = GraphBuilder(n)
+        for u, v in zip(sources, targets):
+            builder.add_edge(u, v)
+        return builder.freeze()
+
+    adjacency, dict_time, dict_bytes = measure(build_dict)
+    graph, csr_time, csr_bytes = measure(build_csr)
+
+    print(f"Random graph, {n} vertices, {m} edges:")
+    print(f"    {'':16s} {'build s':>8s} {'bytes/edge':>11s} {'BFS s':>8s} {'degrees s':>10s}")
+    for name, build_time, kept, neighbors, degree in [
+            ("dict of sets", dict_time, dict_bytes, adjacency.__getitem__,
+             lambda v: len(adjacency[v])),
+            ("CSRGraph", csr_time, csr_bytes, graph.neighbors, graph.degree)]:
+        start = time.perf_counter()
+        bfs(n, 0, neighbors)
+        bfs_time = time.perf_counter() - start
+        start = time.perf_counter()
+        sum(degree(v) for v in range(n))
+        degree_time = time.perf_counter() - start
+        print(f"    {name:16s} {build_time:8.2f} {kept / m:11.1f} {bfs_time:8.2f} {degree_time:10.3f}")
+    print(f"    CSRGraph arrays: {graph.nbytes / m:.1f} bytes/edge")
+
+if __name__ == "__main__":
+    main()
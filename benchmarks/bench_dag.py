@@ -0,0 +1,90 @@
+"""
+Benchmark of strongly connected components, topological sorting and the
+incremental topological order on large synthetic graphs.
+
+Times Tarjan's and Kosaraju's algorithms and the condensation on a random
+graph and on a single long chain, Kahn's algorithm on a random DAG, and
+edge-by-edge insertion into IncrementalTopologicalOrder against re-running
+Kahn's algorithm after every insertion.
+
+Run from the repository root:
+    python -m benchmarks.bench_dag --vertices 500000 --edges 1500000
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.graphs.connectivity import condensation, kosaraju_scc, tarjan_scc
+from src.data_structures.graphs.csr_graph import CSRGraph, GraphBuilder
+from src.data_structures.graphs.topological import (
+    IncrementalTopologicalOrder, topological_generations, topological_sort,
+)
+
+def timed(name: str, run) -> None:
+    """Prints how long `run()` takes and a summary of its result."""
+    start = time.perf_counter()
+    summary = run()
+    print(f"    {name:28s} {time.perf_counter() - start:7.2f} s   {summary}")
+
+def random_dag_edges(n: int, m: int, rng: random.Random):
+    """Returns m random edges, each from a lower to a higher vertex."""
+    edges = []
+    for _ in range(m):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            edges.append((min(a, b), max(a, b)))
+    return edges
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vertices", type=int, default=500_000)
+    parser.add_argument("--edges", type=int, default=1_500_000)
+    parser.add_argument("--incremental", type=int, default=20_000)
+    args = parser.parse_args()
+    n, m = args.vertices, args.edges
+    rng = random.Random(9)
+
+    builder = GraphBuilder(n)
+    for _ in range(m):
+        builder.add_edge(rng.randrange(n), rng.randrange(n))
+    graph = builder.freeze()
+    print(f"Random graph, {n} vertices, {m} edges:")
+    timed("tarjan_scc", lambda: f"{tarjan_scc(graph)[0]} components")
+    timed("kosaraju_scc", lambda: f"{kosaraju_scc(graph)[0]} components")
+    timed("condensation", lambda: f"{condensation(graph)[0].num_edges} DAG edges")
+
+    chain = CSRGraph.from_edges((v, v + 1) for v in range(n - 1))
+    print(f"Chain of {n} vertices (recursion depth {n}):")
+    timed("tarjan_scc", lambda: f"{tarjan_scc(chain)[0]} components")
+    timed("topological_sort", lambda: f"{len(topological_sort(chain))} vertices")
+
+    dag = CSRGraph.from_edges(random_dag_edges(n, m, rng), n)
+    print(f"Random DAG, {n} vertices, {dag.num_edges} edges:")
+    timed("topological_sort", lambda: f"{len(topological_sort(dag))} vertices")
+    timed("topological_generations", lambda: f"{sum(1 for _ in topological_generations(dag))} generations")
+
+    k = args.incremental
+    small = max(2, k // 2)
+    edges = random_dag_edges(small, k, rng)
+    rng.shuffle(edges)
+    relabel = list(range(small))
+    rng.shuffle(relabel)  # So that most edges start out pointing backward.
+    edges = [(relabel[u], relabel[v]) for u, v in edges]
+    print(f"Inserting {len(edges)} DAG edges one by one, {small} vertices:")
+
+    def incremental():
+        order = IncrementalTopologicalOrder(small)
+        for u, v in edges:
+            order.add_edge(u, v)
+        return f"{order.num_edges} edges"
+    timed("IncrementalTopologicalOrder", incremental)
+
+    sample = edges[-50:]
+    start = time.perf_counter()
+    for i in range(len(sample)):
+        topological_sort(CSRGraph.from_edges(edges[:len(edges) - len(sample) + i + 1], small))
+    estimate = (time.perf_counter() - start) / len(sample) * len(edges) / 2
+    print(f"    {'Kahn after every insertion':28s} {estimate:7.2f} s   (estimated from {len(sample)} runs)")
+
+if __name__ == "__main__":
+    main()
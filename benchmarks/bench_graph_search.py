@@ -0,0 +1,67 @@
+"""
+Benchmark of the graph search algorithms on a synthetic road network: a
+grid of junctions joined to their horizontal and vertical neighbours by
+roads of random length, with a few roads removed.
+
+Times a full BFS, DFS and Dijkstra from one vertex, then random
+point-to-point queries answered by Dijkstra with an early exit, A* with a
+Manhattan-distance heuristic and bidirectional Dijkstra.
+
+Run from the repository root:
+    python -m benchmarks.bench_graph_search --side 500 --queries 20
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.graphs.csr_graph import GraphBuilder
+from src.data_structures.graphs.search import (
+    astar, bfs, bidirectional_dijkstra, dfs, dijkstra, manhattan_heuristic, shortest_path,
+)
+
+def road_grid(side: int, rng: random.Random):
+    """Builds a side x side grid road network and the coordinates of its junctions."""
+    builder = GraphBuilder(side * side, directed=False, weighted=True)
+    for y in range(side):
+        for x in range(side):
+            v = y * side + x
+            if x + 1 < side and rng.random() < 0.95:
+                builder.add_edge(v, v + 1, rng.uniform(1.0, 3.0))
+            if y + 1 < side and rng.random() < 0.95:
+                builder.add_edge(v, v + side, rng.uniform(1.0, 3.0))
+    coordinates = [(x, y) for y in range(side) for x in range(side)]
+    return builder.freeze(), coordinates
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--side", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    start = time.perf_counter()
+    graph, coordinates = road_grid(args.side, rng)
+    print(f"Grid road network, {graph.num_vertices} junctions, {graph.num_edges // 2} roads "
+          f"(built in {time.perf_counter() - start:.2f} s):")
+
+    for name, run in [("BFS", lambda: sum(1 for _ in bfs(graph, 0))),
+                      ("DFS", lambda: sum(1 for _ in dfs(graph, 0))),
+                      ("Dijkstra", lambda: len(dijkstra(graph, 0)[0]))]:
+        start = time.perf_counter()
+        reached = run()
+        print(f"    full {name:8s} {time.perf_counter() - start:8.3f} s   {reached} vertices reached")
+
+    pairs = [(rng.randrange(graph.num_vertices), rng.randrange(graph.num_vertices))
+             for _ in range(args.queries)]
+    print(f"  {args.queries} random point-to-point queries:")
+    for name, query in [
+            ("Dijkstra, early exit", lambda s, t: shortest_path(graph, s, t)),
+            ("A*, Manhattan", lambda s, t: astar(graph, s, t, manhattan_heuristic(coordinates, t))),
+            ("bidirectional Dijkstra", lambda s, t: bidirectional_dijkstra(graph, s, t))]:
+        start = time.perf_counter()
+        total = sum(query(s, t)[0] for s, t in pairs)
+        elapsed = time.perf_counter() - start
+        print(f"    {name:24s} {elapsed / len(pairs) * 1e3:8.1f} ms/query   total length {total:.1f}")
+
+if __name__ == "__main__":
+    main()
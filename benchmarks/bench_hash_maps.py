@@ -0,0 +1,104 @@
+"""
+Benchmark comparing RobinHoodHashMap with a chained-hashing map and the
+built-in dict on int and str keys: inserts, hit and miss lookups, deletes,
+and the slowest single insert (the resize pause).
+
+Run from the repository root:
+    python -m benchmarks.bench_hash_maps --size 200000
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.hashing.robin_hood_map import RobinHoodHashMap
+
+class ChainedHashMap:
+    """A textbook separate-chaining map that rehashes everything when it grows."""
+    def __init__(self, max_load: float = 1.0):
+        self.max_load = max_load
+        self.buckets = [[] for _ in range(8)]
+        self.count = 0
+
+    def __setitem__(self, key, value):
+        bucket = self.buckets[hash(key) % len(self.buckets)]
+        for i, (k, _) in enumerate(bucket):
+            if k == key:
+                bucket[i] = (key, value)
+                return
+        bucket.append((key, value))
+        self.count += 1
+        if self.count > self.max_load * len(self.buckets):
+            old = self.buckets
+            self.buckets = [[] for _ in range(2 * len(old))]
+            for chain in old:
+                for k, v in chain:
+                    self.buckets[hash(k) % len(self.buckets)].append((k, v))
+
+    def get(self, key, default=None):
+        for k, v in self.buckets[hash(key) % len(self.buckets)]:
+            if k == key:
+                return v
+        return default
+
+    def __delitem__(self, key):
+        bucket = self.buckets[hash(key) % len(self.buckets)]
+        for i, (k, _) in enumerate(bucket):
+            if k == key:
+                del bucket[i]
+                self.count -= 1
+                return
+        raise KeyError(key)
+
+def bench(factory, name: str, keys, missing) -> None:
+    """Times inserts (tracking the slowest one), lookups and deletes."""
+    mapping = factory()
+    clock = time.perf_counter
+    worst = 0.0
+    start = clock()
+    for key in keys:
+        before = clock()
+        mapping[key] = key
+        elapsed = clock() - before
+        if elapsed > worst:
+            worst = elapsed
+    insert_time = clock() - start
+
+    start = clock()
+    for key in keys:
+        mapping.get(key)
+    hit_time = clock() - start
+
+    start = clock()
+    for key in missing:
+        mapping.get(key)
+    miss_time = clock() - start
+
+    start = clock()
+    for key in keys:
+        del mapping[key]
+    delete_time = clock() - start
+
+    n = len(keys)
+    print(f"    {name:18s} insert={insert_time / n * 1e6:6.2f} us/op "
+          f"hit={hit_time / n * 1e6:5.2f} miss={miss_time / n * 1e6:5.2f} "
+          f"delete={delete_time / n * 1e6:5.2f} us/op  worst insert={worst * 1e3:7.2f} ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    int_keys = random.sample(range(args.size * 10), args.size)
+    int_missing = [-key - 1 for key in int_keys]
+    str_keys = [f"key-{key}" for key in int_keys]
+    str_missing = [f"missing-{key}" for key in int_keys]
+    factories = [("dict", dict), ("ChainedHashMap", ChainedHashMap),
+                 ("RobinHood(0.85)", RobinHoodHashMap),
+                 ("RobinHood(0.6)", lambda: RobinHoodHashMap(max_load=0.6))]
+    for label, keys, missing in [("int", int_keys, int_missing), ("str", str_keys, str_missing)]:
+        print(f"{args.size} {label} keys:")
+        for name, factory in factories:
+            bench(factory, name, keys, missing)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark of the heaps package: DAryHeap for several arities against heapq
+for heapify, push and pop, then a Dijkstra-style decrease-key workload run
+on IndexedPriorityQueue and on heapq with lazy deletion of stale entries.
+
+Run from the repository root:
+    python -m benchmarks.bench_heaps --size 200000
+"""
+import argparse
+import heapq
+import random
+import time
+
+from src.data_structures.heaps.d_ary_heap import DAryHeap
+from src.data_structures.heaps.indexed_priority_queue import IndexedPriorityQueue
+
+def report(name: str, operations: int, elapsed: float) -> None:
+    """Prints throughput in thousands of operations per second."""
+    print(f"    {name:24s} {operations / elapsed / 1e3:9.0f} K ops/s")
+
+def time_phases(heapify, push, pop, values):
+    """Returns the seconds taken to heapify, push every value and pop them all."""
+    start = time.perf_counter()
+    heapify(list(values))
+    heapify_time = time.perf_counter() - start
+    heap = heapify([])
+    start = time.perf_counter()
+    for value in values:
+        push(heap, value)
+    push_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(len(values)):
+        pop(heap)
+    return heapify_time, push_time, time.perf_counter() - start
+
+def bench_heap_operations(size: int) -> None:
+    """Times heapify, push and pop on random floats."""
+    values = [random.random() for _ in range(size)]
+
+    def heapq_heapify(items):
+        heapq.heapify(items)
+        return items
+
+    timings = {"heapq": time_phases(heapq_heapify, heapq.heappush, heapq.heappop, values)}
+    for d in (2, 3, 4, 8):
+        timings[f"DAryHeap d={d}"] = time_phases(
+            lambda items, d=d: DAryHeap(items, d=d), DAryHeap.push, DAryHeap.pop, values)
+
+    for phase, label in enumerate(["heapify", "push", "pop"]):
+        print(f"  {label}:")
+        for name, phases in timings.items():
+            report(name, size, phases[phase])
+
+def bench_decrease_key(size: int, updates: int) -> None:
+    """Times repeatedly lowering random priorities, then draining the queue."""
+    rng = random.Random(1)
+    plan = [(rng.randrange(size), rng.random()) for _ in range(updates)]
+    operations = size + updates + size
+
+    for d in (2, 4):
+        pq = IndexedPriorityQueue(d=d)
+        start = time.perf_counter()
+        handles = [pq.push(1.0 + key, key) for key in range(size)]
+        for key, fraction in plan:
+            handle = handles[key]
+            if handle in pq:
+                pq.decrease_key(handle, handle.priority * fraction)
+        while pq:
+            pq.pop()
+        report(f"IndexedPQ d={d}", operations, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    best = [1.0 + key for key in range(size)]
+    heap = [(priority, key) for key, priority in enumerate(best)]
+    for key, fraction in plan:
+        best[key] *= fraction
+        heapq.heappush(heap, (best[key], key))
+    while heap:
+        priority, key = heapq.heappop(heap)
+        if priority != best[key]:
+            continue  # A stale entry left behind by a later decrease.
+    report("heapq lazy deletion", operations, time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--updates", type=int, default=400_000)
+    args = parser.parse_args()
+
+    print(f"Heap operations, {args.size} random floats:")
+    bench_heap_operations(args.size)
+    print(f"Decrease-key workload, {args.size} entries, {args.updates} updates:")
+    bench_decrease_key(args.size, args.updates)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark comparing indexed and scanning linked lists on membership tests
+and delete-by-value.
+
+A scanning list compares values one node at a time, so every `in` or delete
+costs O(n). An indexed list answers both from its value -> node index.
+
+Run from the repository root:
+    python -m benchmarks.bench_indexed_lists --sizes 10000 1000000
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.fundamentals.linked_lists.circular_linked_list import CircularLinkedList
+from src.data_structures.fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList
+from src.data_structures.fundamentals.linked_lists.singly_linked_list import SinglyLinkedList
+
+def bench(cls, size: int, indexed: bool, queries: int) -> None:
+    """Times `queries` membership tests and deletes on a list of `size` ints."""
+    lst = cls(indexed=indexed)
+    start = time.perf_counter()
+    lst.extend(range(size))
+    build_time = time.perf_counter() - start
+
+    rng = random.Random(0)
+    # Half of the probes miss, which is the worst case for a scan.
+    probes = [rng.randrange(2 * size) for _ in range(queries)]
+    start = time.perf_counter()
+    for value in probes:
+        value in lst
+    contains_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for value in probes:
+        lst.delete(value)
+    delete_time = time.perf_counter() - start
+
+    mode = "indexed" if indexed else "scanning"
+    print(f"{cls.__name__:18s} {mode:8s} n={size:>9,d} build={build_time / size * 1e6:6.2f} us/elem "
+          f"in={contains_time / queries * 1e6:11.2f} us/op "
+          f"delete={delete_time / queries * 1e6:11.2f} us/op")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200,
+                        help="membership tests and deletes per run (kept small for the scans)")
+    args = parser.parse_args()
+    for size in args.sizes:
+        for cls in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList):
+            for indexed in (False, True):
+                bench(cls, size, indexed, args.queries)
+
+if __name__ == "__main__":
+    main()
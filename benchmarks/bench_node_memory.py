@@ -0,0 +1,79 @@
+"""
+Benchmark reporting the memory cost per element of the linked lists and the
+binary search trees.
+
+Each structure is measured twice: once with its slotted Node class and once
+with a subclass that has no __slots__ declaration, which restores the
+per-instance __dict__ (and __weakref__) layout the nodes used to have.
+
+Run from the repository root:
+    python -m benchmarks.bench_node_memory --size 200000
+"""
+import argparse
+import gc
+import tracemalloc
+from contextlib import contextmanager
+
+from src.data_structures.fundamentals.linked_lists import (
+    circular_linked_list,
+    doubly_linked_list,
+    singly_linked_list,
+)
+from src.data_structures.trees import avl_tree, binary_search_tree, red_black_tree
+
+@contextmanager
+def dict_nodes(module):
+    """Temporarily replaces a module's Node with an unslotted subclass."""
+    slotted = module.Node
+    module.Node = type("DictNode", (slotted,), {})
+    try:
+        yield
+    finally:
+        module.Node = slotted
+
+def measure(build, size: int) -> float:
+    """Returns the bytes allocated per element by `build(size)`."""
+    gc.collect()
+    tracemalloc.start()
+    structure = build(size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current / size
+
+def build_list(cls):
+    def build(size):
+        lst = cls()
+        for i in range(size):
+            lst.append(i)
+        return lst
+    return build
+
+def build_tree(cls):
+    def build(size):
+        return cls.from_sorted(range(size))
+    return build
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("SinglyLinkedList", singly_linked_list, build_list(singly_linked_list.SinglyLinkedList)),
+        ("DoublyLinkedList", doubly_linked_list, build_list(doubly_linked_list.DoublyLinkedList)),
+        ("CircularLinkedList", circular_linked_list,
+         build_list(circular_linked_list.CircularLinkedList)),
+        ("BinarySearchTree", binary_search_tree, build_tree(binary_search_tree.BinarySearchTree)),
+        ("AVLTree", avl_tree, build_tree(avl_tree.AVLTree)),
+        ("RedBlackTree", red_black_tree, build_tree(red_black_tree.RedBlackTree)),
+    ]
+    print(f"{'structure':20s} {'__dict__ nodes':>15s} {'slotted nodes':>15s}   (bytes/element)")
+    for name, module, build in cases:
+        with dict_nodes(module):
+            before = measure(build, args.size)
+        after = measure(build, args.size)
+        print(f"{name:20s} {before:15.1f} {after:15.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark of the queues package: RingBuffer against collections.deque and a
+list, then producer/consumer throughput of BlockingQueue against queue.Queue
+and of AsyncQueue against asyncio.Queue, one item at a time and in batches.
+
+Run from the repository root:
+    python -m benchmarks.bench_queues --items 1000000
+"""
+import argparse
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from src.data_structures.fundamentals.queues.async_queue import AsyncQueue
+from src.data_structures.fundamentals.queues.blocking_queue import BlockingQueue
+from src.data_structures.fundamentals.queues.ring_buffer import RingBuffer
+
+def report(name: str, items: int, elapsed: float) -> None:
+    """Prints throughput in millions of items per second."""
+    print(f"    {name:28s} {items / elapsed / 1e6:6.2f} M items/s")
+
+def bench_fifo(items: int) -> None:
+    """Times pushing and popping through a single-threaded FIFO."""
+    window = 1000
+    for name, factory, push, pop in [
+            ("list append/pop(0)", list, list.append, lambda q: q.pop(0)),
+            ("deque append/popleft", deque, deque.append, deque.popleft),
+            ("RingBuffer append/popleft", lambda: RingBuffer(window), RingBuffer.append,
+             RingBuffer.popleft)]:
+        fifo = factory()
+        start = time.perf_counter()
+        for value in range(items):
+            push(fifo, value)
+            if value >= window - 1:
+                pop(fifo)
+        report(name, items, time.perf_counter() - start)
+
+    ring = RingBuffer(window)
+    batch = list(range(window // 2))
+    start = time.perf_counter()
+    for _ in range(items // len(batch)):
+        ring.put_many(batch)
+        ring.get_many(len(batch))
+    report("RingBuffer put/get_many", items, time.perf_counter() - start)
+
+def bench_threads(items: int, batch: int) -> None:
+    """Times one producer thread feeding one consumer thread."""
+    def run(name, put, get_count):
+        received = [0]
+
+        def consumer():
+            while received[0] < items:
+                received[0] += get_count()
+
+        thread = threading.Thread(target=consumer)
+        start = time.perf_counter()
+        thread.start()
+        put()
+        thread.join()
+        report(name, items, time.perf_counter() - start)
+
+    stdlib = queue.Queue(maxsize=1024)
+    run("queue.Queue put/get", lambda: [stdlib.put(v) for v in range(items)],
+        lambda: stdlib.get() is not None)
+    ours = BlockingQueue(1024)
+    run("BlockingQueue put/get", lambda: [ours.put(v) for v in range(items)],
+        lambda: ours.get() is not None)
+    batched = BlockingQueue(1024)
+    run(f"BlockingQueue batches of {batch}",
+        lambda: [batched.put_many(range(s, min(s + batch, items))) for s in range(0, items, batch)],
+        lambda: len(batched.get_many(batch)))
+
+def bench_asyncio(items: int, batch: int) -> None:
+    """Times one producer task feeding one consumer task."""
+    async def run(name, producer, consumer):
+        start = time.perf_counter()
+        await asyncio.gather(producer(), consumer())
+        report(name, items, time.perf_counter() - start)
+
+    async def main():
+        stdlib = asyncio.Queue(maxsize=1024)
+
+        async def stdlib_producer():
+            for value in range(items):
+                await stdlib.put(value)
+
+        async def stdlib_consumer():
+            for _ in range(items):
+                await stdlib.get()
+
+        await run("asyncio.Queue put/get", stdlib_producer, stdlib_consumer)
+
+        ours = AsyncQueue(1024)
+
+        async def producer():
+            for value in range(items):
+                await ours.put(value)
+
+        async def consumer():
+            for _ in range(items):
+                await ours.get()
+
+        await run("AsyncQueue put/get", producer, consumer)
+
+        async def batch_producer():
+            for start in range(0, items, batch):
+                await ours.put_many(range(start, min(start + batch, items)))
+
+        async def batch_consumer():
+            received = 0
+            while received < items:
+                received += len(await ours.get_many(batch))
+
+        await run(f"AsyncQueue batches of {batch}", batch_producer, batch_consumer)
+
+    asyncio.run(main())
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args()
+
+    print(f"Single-threaded FIFO, {args.items} items:")
+    bench_fifo(args.items)
+    print(f"Producer/consumer threads, {args.items // 4} items:")
+    bench_threads(args.items // 4, args.batch)
+    print(f"Producer/consumer asyncio tasks, {args.items // 4} items:")
+    bench_asyncio(args.items // 4, args.batch)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of CircularLinkedList as a round-robin rotation, against
+collections.deque: building the ring, cycling through it with advance, and
+retiring entries with pop_current.
+
+Run from the repository root:
+    python -m benchmarks.bench_round_robin --size 1000000
+"""
+import argparse
+import time
+from collections import deque
+
+from src.data_structures.fundamentals.linked_lists.circular_linked_list import CircularLinkedList
+
+def report(name: str, operations: int, elapsed: float) -> None:
+    """Prints throughput in millions of operations per second."""
+    print(f"    {name:38s} {operations / elapsed / 1e6:6.2f} M ops/s")
+
+def bench(size: int, steps: int) -> None:
+    """Times each phase on a ring of `size` entries."""
+    start = time.perf_counter()
+    ring = CircularLinkedList()
+    for value in range(size):
+        ring.append(value)
+    report("CircularLinkedList append", size, time.perf_counter() - start)
+    start = time.perf_counter()
+    queue = deque()
+    for value in range(size):
+        queue.append(value)
+    report("deque append", size, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        ring.advance()
+    report("CircularLinkedList advance", steps, time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(steps):
+        queue.append(queue.popleft())
+    report("deque popleft/append", steps, time.perf_counter() - start)
+    start = time.perf_counter()
+    ring.rotate(size - 1)
+    report("CircularLinkedList rotate(size - 1)", size - 1, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    while ring:
+        ring.advance()
+        ring.pop_current()
+    report("CircularLinkedList advance/pop_current", size, time.perf_counter() - start)
+    start = time.perf_counter()
+    while queue:
+        queue.append(queue.popleft())
+        queue.popleft()
+    report("deque rotate/popleft", size, time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    print(f"Round-robin over {args.size} entries, {args.steps} steps:")
+    bench(args.size, args.steps)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark comparing SkipList with the tree-based ordered sets on random and
+sorted insertion, search and range scans, plus a concurrent run where reader
+threads scan a thread-safe skip list while a writer inserts.
+
+Run from the repository root:
+    python -m benchmarks.bench_skip_list --size 200000
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.data_structures.advanced.skip_list import SkipList
+from src.data_structures.trees.avl_tree import AVLTree
+from src.data_structures.trees.binary_search_tree import BinarySearchTree
+from src.data_structures.trees.red_black_tree import RedBlackTree
+
+def bench(factory, name: str, keys, lookups) -> None:
+    """Times inserting `keys`, searching `lookups` and one range scan."""
+    structure = factory()
+    start = time.perf_counter()
+    for key in keys:
+        structure.insert(key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in lookups:
+        structure.search(key)
+    search_time = time.perf_counter() - start
+
+    lo = len(keys) // 4
+    start = time.perf_counter()
+    count = sum(1 for _ in structure.iter_range(lo, lo + 1000))
+    range_time = time.perf_counter() - start
+
+    print(f"    {name:18s} insert={insert_time / len(keys) * 1e6:8.2f} us/op "
+          f"search={search_time / len(lookups) * 1e6:7.2f} us/op "
+          f"range({count})={range_time * 1e3:6.2f} ms")
+
+def concurrent(size: int, readers: int) -> None:
+    """Measures reader scan throughput while one writer keeps inserting."""
+    skip = SkipList(thread_safe=True)
+    for key in range(0, 2 * size, 2):
+        skip.insert(key)
+    stop = threading.Event()
+    scans = [0] * readers
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            lo = rng.randrange(2 * size)
+            for _ in skip.iter_range(lo, lo + 200):
+                pass
+            scans[slot] += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for key in range(1, 2 * size, 2):
+        skip.insert(key)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print(f"    writer inserted {size:,d} keys in {elapsed:.2f}s while {readers} readers "
+          f"completed {sum(scans):,d} lock-free range scans")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    shuffled = list(range(args.size))
+    rng.shuffle(shuffled)
+    lookups = [rng.randrange(args.size) for _ in range(args.lookups)]
+
+    print(f"random keys, n={args.size:,d}")
+    for factory, name in ((SkipList, "SkipList"), (BinarySearchTree, "BinarySearchTree"),
+                          (AVLTree, "AVLTree"), (RedBlackTree, "RedBlackTree")):
+        bench(factory, name, shuffled, lookups)
+
+    print(f"sorted keys, n={args.size:,d} (the plain BST is skipped: quadratic)")
+    for factory, name in ((SkipList, "SkipList"), (AVLTree, "AVLTree"),
+                          (RedBlackTree, "RedBlackTree")):
+        bench(factory, name, range(args.size), lookups)
+
+    print("concurrent readers")
+    concurrent(args.size // 4, args.readers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of ArrayStack against a Python list and a SinglyLinkedList used as
+a stack: push/pop throughput one at a time and in batches, then the memory
+held by a stack of integers.
+
+Run from the repository root:
+    python -m benchmarks.bench_stacks --size 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.data_structures.fundamentals.linked_lists.singly_linked_list import SinglyLinkedList
+from src.data_structures.fundamentals.stacks.array_stack import ArrayStack, MinMaxStack
+
+def report(name: str, items: int, elapsed: float) -> None:
+    """Prints throughput in millions of items per second."""
+    print(f"    {name:32s} {items / elapsed / 1e6:6.2f} M items/s")
+
+def linked_pop(stack: SinglyLinkedList) -> None:
+    """Pops the head of a linked list used as a stack."""
+    stack.delete(stack.head.data)
+
+def linked_stack(size: int) -> SinglyLinkedList:
+    """Builds a linked list stack holding 0 .. size - 1."""
+    stack = SinglyLinkedList()
+    for value in range(size):
+        stack.prepend(value)
+    return stack
+
+def bench_push_pop(size: int, depth: int) -> None:
+    """Times pushing `depth` items and popping them again, repeatedly."""
+    rounds = max(1, size // depth)
+    for name, factory, push, pop in [
+            ("list append/pop", list, list.append, list.pop),
+            ("SinglyLinkedList prepend/delete", SinglyLinkedList, SinglyLinkedList.prepend, linked_pop),
+            ("ArrayStack push/pop", ArrayStack, ArrayStack.push, ArrayStack.pop),
+            ("ArrayStack('q') push/pop", lambda: ArrayStack(typecode="q"), ArrayStack.push,
+             ArrayStack.pop),
+            ("MinMaxStack push/pop", MinMaxStack, MinMaxStack.push, MinMaxStack.pop)]:
+        stack = factory()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for value in range(depth):
+                push(stack, value)
+            for _ in range(depth):
+                pop(stack)
+        report(name, rounds * depth, time.perf_counter() - start)
+
+    batch = list(range(depth))
+    for name, stack in [("ArrayStack push/pop_many", ArrayStack()),
+                        ("ArrayStack('q') push/pop_many", ArrayStack(typecode="q"))]:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            stack.push_many(batch)
+            stack.pop_many(depth)
+        report(name, rounds * depth, time.perf_counter() - start)
+
+def bench_memory(size: int) -> None:
+    """Reports the bytes per element held by each stack."""
+    for name, build in [
+            ("list", lambda: list(range(size))),
+            ("SinglyLinkedList", lambda: linked_stack(size)),
+            ("ArrayStack", lambda: ArrayStack(range(size))),
+            ("ArrayStack('q')", lambda: ArrayStack(range(size), typecode="q"))]:
+        gc.collect()
+        tracemalloc.start()
+        stack = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"    {name:32s} {current / size:6.1f} bytes/element")
+        del stack
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--depth", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"Push then pop {args.depth} items, {args.size} items in total:")
+    bench_push_pop(args.size, args.depth)
+    print(f"Memory of a stack of {args.size} integers:")
+    bench_memory(args.size)
+
+if __name__ == "__main__":
+    main()
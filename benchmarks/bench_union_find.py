@@ -0,0 +1,66 @@
+"""
+Benchmark of the Union-Find structures: unions one call at a time against
+union_many over edge arrays, connectivity queries, the keyed layer, and
+connected components and Kruskal's algorithm on a random graph.
+
+Run from the repository root:
+    python -m benchmarks.bench_union_find --elements 1000000 --pairs 2000000
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.graphs.connectivity import connected_components, kruskal_mst
+from src.data_structures.graphs.csr_graph import GraphBuilder
+from src.data_structures.graphs.union_find import KeyedUnionFind, UnionFind
+
+def report(name: str, operations: int, elapsed: float) -> None:
+    """Prints throughput in millions of operations per second."""
+    print(f"    {name:32s} {operations / elapsed / 1e6:6.2f} M ops/s")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    parser.add_argument("--pairs", type=int, default=2_000_000)
+    args = parser.parse_args()
+    n, m = args.elements, args.pairs
+
+    rng = random.Random(5)
+    sources = [rng.randrange(n) for _ in range(m)]
+    targets = [rng.randrange(n) for _ in range(m)]
+
+    print(f"{n} elements, {m} random pairs:")
+    forest = UnionFind(n)
+    start = time.perf_counter()
+    for a, b in zip(sources, targets):
+        forest.union(a, b)
+    report("union, one call per pair", m, time.perf_counter() - start)
+    batched = UnionFind(n)
+    start = time.perf_counter()
+    batched.union_many(sources, targets)
+    report("union_many", m, time.perf_counter() - start)
+    start = time.perf_counter()
+    for a, b in zip(targets, sources):
+        forest.connected(a, b)
+    report("connected", m, time.perf_counter() - start)
+    keys = [f"node-{x}" for x in range(n)]
+    keyed = KeyedUnionFind()
+    start = time.perf_counter()
+    keyed.union_many((keys[a], keys[b]) for a, b in zip(sources, targets))
+    report("KeyedUnionFind.union_many", m, time.perf_counter() - start)
+    print(f"    {forest.count} components")
+
+    builder = GraphBuilder(n, directed=False, weighted=True)
+    for a, b in zip(sources, targets):
+        builder.add_edge(a, b, rng.random())
+    graph = builder.freeze()
+    print(f"Random graph, {n} vertices, {m} edges:")
+    start = time.perf_counter()
+    count, _ = connected_components(graph)
+    print(f"    {'connected_components':32s} {time.perf_counter() - start:6.2f} s ({count} components)")
+    start = time.perf_counter()
+    total, chosen = kruskal_mst(graph)
+    print(f"    {'kruskal_mst':32s} {time.perf_counter() - start:6.2f} s ({len(chosen)} edges)")
+
+if __name__ == "__main__":
+    main()
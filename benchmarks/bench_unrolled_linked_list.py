@@ -0,0 +1,78 @@
+"""
+Benchmark comparing SinglyLinkedList with UnrolledLinkedList on sequential
+scans, random positional inserts and memory per element.
+
+Run from the repository root:
+    python -m benchmarks.bench_unrolled_linked_list --size 1000000
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from src.data_structures.fundamentals.linked_lists.singly_linked_list import SinglyLinkedList
+from src.data_structures.fundamentals.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+def memory_per_element(build, size: int) -> float:
+    """Returns the bytes allocated per element by `build(size)`."""
+    gc.collect()
+    tracemalloc.start()
+    structure = build(size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current / size
+
+def build_singly(size: int) -> SinglyLinkedList:
+    lst = SinglyLinkedList()
+    lst.extend(i & 0xFF for i in range(size))
+    return lst
+
+def build_unrolled(size: int, capacity: int) -> UnrolledLinkedList:
+    lst = UnrolledLinkedList(capacity)
+    lst.extend(i & 0xFF for i in range(size))
+    return lst
+
+def timed(label: str, func, repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    print(f"    {label:28s} {(time.perf_counter() - start) / repeat * 1e3:10.2f} ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--inserts", type=int, default=200)
+    parser.add_argument("--capacities", type=int, nargs="+", default=[16, 64, 256])
+    args = parser.parse_args()
+    rng = random.Random(0)
+    positions = [rng.randrange(args.size) for _ in range(args.inserts)]
+
+    singly = build_singly(args.size)
+    print(f"SinglyLinkedList n={args.size:,d} "
+          f"{memory_per_element(build_singly, args.size):.1f} bytes/elem")
+    timed("scan (values)", lambda: sum(singly.values()))
+
+    def singly_inserts():
+        for position in positions:
+            node = singly.head
+            for _ in range(position):
+                node = node.next
+            singly.insert_after(node, -1)
+    timed(f"{args.inserts} random inserts", singly_inserts)
+
+    for capacity in args.capacities:
+        unrolled = build_unrolled(args.size, capacity)
+        bytes_per = memory_per_element(lambda n: build_unrolled(n, capacity), args.size)
+        print(f"UnrolledLinkedList(capacity={capacity}) {bytes_per:.1f} bytes/elem")
+        timed("scan (iter)", lambda: sum(unrolled))
+
+        def unrolled_inserts():
+            for position in positions:
+                unrolled.insert(position, -1)
+        timed(f"{args.inserts} random inserts", unrolled_inserts)
+        timed(f"{args.inserts} random reads", lambda: [unrolled[p] for p in positions])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Stress harness for the thread-safe wrappers: many threads hammer one shared
+linked list or tree with a mix of writes and reads, then the structure is
+checked for lost updates and broken links.
+
+Pass --unsafe to run the same workload against the raw structures and watch
+the races the wrappers prevent.
+
+Run from the repository root:
+    python -m benchmarks.stress_synchronized --threads 16 --ops 20000
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from src.data_structures.fundamentals.linked_lists.circular_linked_list import CircularLinkedList
+from src.data_structures.fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList
+from src.data_structures.fundamentals.linked_lists.singly_linked_list import SinglyLinkedList
+from src.data_structures.synchronized import synchronized
+from src.data_structures.trees.red_black_tree import RedBlackTree
+
+def list_worker(shared, thread_id: int, ops: int, read_share: float) -> int:
+    """Appends tagged values and mixes in head reads and occasional full snapshots."""
+    rng = random.Random(thread_id)
+    appended = 0
+    for n in range(ops):
+        if rng.random() < read_share:
+            if n % 512:
+                len(shared) and shared[0]
+            else:
+                sum(1 for _ in shared.values())
+        else:
+            shared.append((thread_id, n))
+            appended += 1
+    return appended
+
+def tree_worker(shared, thread_id: int, ops: int, read_share: float) -> int:
+    """Inserts keys owned by this thread and mixes in searches and rank queries."""
+    rng = random.Random(thread_id)
+    inserted = 0
+    for n in range(ops):
+        key = n * 1024 + thread_id
+        if rng.random() < read_share:
+            shared.search(rng.randrange(ops * 1024))
+        else:
+            shared.insert(key)
+            inserted += 1
+    return inserted
+
+def check_list(structure, expected: int) -> str:
+    """Walks the list and compares its links with its counters."""
+    nodes = list(structure)
+    problems = []
+    if len(nodes) != expected:
+        problems.append(f"{expected - len(nodes)} lost nodes")
+    if structure.size != len(nodes):
+        problems.append(f"size={structure.size} but {len(nodes)} nodes")
+    if getattr(structure, "tail", nodes[-1] if nodes else None) is not (nodes[-1] if nodes else None):
+        problems.append("tail is not the last node")
+    return ", ".join(problems) or "ok"
+
+def check_tree(structure, expected: int) -> str:
+    """Checks the key count and ordering of the tree."""
+    keys = list(structure)
+    problems = []
+    if len(keys) != expected:
+        problems.append(f"{expected - len(keys)} lost keys")
+    if keys != sorted(keys):
+        problems.append("keys out of order")
+    return ", ".join(problems) or "ok"
+
+def run(name: str, factory, worker, check, args) -> None:
+    """Runs one workload and prints throughput and the consistency check."""
+    raw = factory()
+    shared = raw if args.unsafe else synchronized(raw)
+    results = [0] * args.threads
+
+    def target(thread_id: int) -> None:
+        try:
+            results[thread_id] = worker(shared, thread_id, args.ops, args.read_share)
+        except Exception as error:  # a corrupted structure may raise anywhere
+            print(f"    thread {thread_id} crashed: {error!r}")
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total_ops = args.threads * args.ops
+    print(f"    {name:20s} {total_ops / elapsed / 1e3:8.1f} kops/s  check: {check(raw, sum(results))}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--read-share", type=float, default=0.5)
+    parser.add_argument("--unsafe", action="store_true", help="skip the wrappers")
+    args = parser.parse_args()
+
+    # Switch threads as often as possible to expose races.
+    sys.setswitchinterval(1e-6)
+    mode = "raw structures" if args.unsafe else "synchronized wrappers"
+    print(f"{args.threads} threads x {args.ops} ops, {args.read_share:.0%} reads, {mode}:")
+    run("SinglyLinkedList", SinglyLinkedList, list_worker, check_list, args)
+    run("DoublyLinkedList", DoublyLinkedList, list_worker, check_list, args)
+    run("CircularLinkedList", CircularLinkedList, list_worker, check_list, args)
+    run("RedBlackTree", RedBlackTree, tree_worker, check_tree, args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,562 @@
+"""
+This module contains the implementation of a B+ Tree, a balanced search tree
+designed for block storage.
+
+A B+ tree keeps all key-value pairs in its leaves, which are chained left to
+right for fast range scans, while the internal nodes only hold separator keys.
+With a fan-out of f, a tree of n keys is about log_f(n) levels deep, so even
+hundreds of millions of keys are reached in a handful of node visits.
+
+Nodes live in pages provided by a page store:
+
+* MemoryPageStore keeps page objects in a Python list and accepts any
+  comparable keys and any values.
+* MmapPageStore keeps fixed-size pages in a memory-mapped file. Keys and
+  values are 64-bit signed integers (for example a hash and a row offset).
+  Opening an existing file only reads its header page; other pages are
+  decoded on demand and kept in a small LRU cache.
+
+Deletion is lazy: keys are removed from their leaf, but underfull nodes are
+not merged. This keeps deletes to a single root-to-leaf walk and matches how
+many database indexes behave; the space is reused by later inserts into the
+same key range, and `bulk_load` into a fresh store produces a compact tree.
+"""
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# Page id meaning "no page", e.g. the `next` link of the last leaf.
+NO_PAGE = -1
+
+class Page:
+    """
+    A node of a B+ Tree.
+
+    Attributes:
+        is_leaf: True for leaves, False for internal nodes.
+        keys: The sorted keys (separators in internal nodes).
+        values: The values paired with `keys` (leaves only).
+        children: The child page ids, one more than keys (internal nodes only).
+        next: The page id of the next leaf, or NO_PAGE (leaves only).
+    """
+    __slots__ = ("is_leaf", "keys", "values", "children", "next")
+
+    def __init__(self, is_leaf: bool):
+        """Initializes an empty page."""
+        self.is_leaf: bool = is_leaf
+        self.keys: List[Any] = []
+        self.values: List[Any] = []
+        self.children: List[int] = []
+        self.next: int = NO_PAGE
+
+class MemoryPageStore:
+    """
+    A page store that keeps page objects in memory.
+
+    Attributes:
+        root: The page id of the root, or NO_PAGE for a new store.
+        size: The number of keys stored in the tree.
+        order: The maximum number of keys per page, or 0 if unset.
+    """
+    def __init__(self):
+        """Initializes an empty in-memory store."""
+        self._pages: List[Page] = []
+        self.root: int = NO_PAGE
+        self.size: int = 0
+        self.order: int = 0
+
+    def max_order(self) -> Optional[int]:
+        """Returns the largest order the store can hold, or None if unbounded."""
+        return None
+
+    def allocate(self, page: Page) -> int:
+        """Stores a new page and returns its id."""
+        self._pages.append(page)
+        return len(self._pages) - 1
+
+    def read(self, page_id: int) -> Page:
+        """Returns the page with the given id."""
+        return self._pages[page_id]
+
+    def write(self, page_id: int, page: Page) -> None:
+        """Stores a modified page; a no-op since pages are held by reference."""
+        self._pages[page_id] = page
+
+    def reset(self) -> None:
+        """Discards every page, keeping the order."""
+        self._pages = []
+        self.root = NO_PAGE
+        self.size = 0
+
+    def save_meta(self) -> None:
+        """Persists root, size and order; a no-op in memory."""
+
+    def flush(self) -> None:
+        """Writes pending changes to stable storage; a no-op in memory."""
+
+    def close(self) -> None:
+        """Releases the store's resources."""
+        self._pages = []
+
+class MmapPageStore:
+    """
+    A page store backed by a memory-mapped file of fixed-size pages.
+
+    Page 0 is a header holding the tree's metadata. Every other page holds
+    one node: a 16-byte page header followed by int64 keys and then int64
+    values (leaves) or int64 child ids (internal nodes).
+
+    Attributes:
+        path: The file backing the store.
+        page_size: The size of every page in bytes.
+        root: The page id of the root, or NO_PAGE for a new store.
+        size: The number of keys stored in the tree.
+        order: The maximum number of keys per page, or 0 if unset.
+    """
+    MAGIC = b"BPTREE01"
+    _HEADER = struct.Struct("<8sIIqqq")
+    _PAGE_HEADER = struct.Struct("<BxxxIq")
+
+    def __init__(self, path: str, page_size: int = 4096, cache_pages: int = 1024):
+        """
+        Opens or creates a page file.
+
+        Args:
+            path: The file to open; it is created if it does not exist.
+            page_size: The page size for a new file; an existing file keeps its own.
+            cache_pages: How many decoded pages to keep in the LRU cache.
+
+        Raises:
+            ValueError: If the file exists but is not a B+ tree page file.
+        """
+        self.path: str = path
+        self._cache: "OrderedDict[int, Page]" = OrderedDict()
+        self._cache_pages: int = cache_pages
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            magic, page_size, order, root, size, page_count = self._HEADER.unpack_from(self._mm, 0)
+            if magic != self.MAGIC:
+                self._mm.close()
+                self._file.close()
+                raise ValueError(f"{path} is not a B+ tree page file.")
+            self.page_size, self.order = page_size, order
+            self.root, self.size, self._page_count = root, size, page_count
+        else:
+            self.page_size: int = page_size
+            self.order: int = 0
+            self.root: int = NO_PAGE
+            self.size: int = 0
+            self._page_count: int = 1
+            self._file.truncate(page_size * 16)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            self.save_meta()
+
+    def max_order(self) -> int:
+        """Returns the largest order whose internal nodes fit in one page."""
+        # Header, `order` keys and `order + 1` children, 8 bytes each.
+        return (self.page_size - self._PAGE_HEADER.size - 8) // 16
+
+    def save_meta(self) -> None:
+        """Writes root, size and order into the header page."""
+        self._HEADER.pack_into(self._mm, 0, self.MAGIC, self.page_size, self.order,
+                               self.root, self.size, self._page_count)
+
+    def allocate(self, page: Page) -> int:
+        """Appends a new page, growing the file geometrically when it is full."""
+        page_id = self._page_count
+        self._page_count += 1
+        if self._page_count * self.page_size > len(self._mm):
+            new_length = max(len(self._mm) * 2, self._page_count * self.page_size)
+            self._mm.close()
+            self._file.truncate(new_length)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.write(page_id, page)
+        return page_id
+
+    def reset(self) -> None:
+        """Discards every page, keeping the order, and shrinks the file back to its initial length."""
+        self._cache.clear()
+        self.root = NO_PAGE
+        self.size = 0
+        self._page_count = 1
+        self._mm.close()
+        self._file.truncate(self.page_size * 16)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.save_meta()
+
+    def read(self, page_id: int) -> Page:
+        """Returns the decoded page with the given id."""
+        page = self._cache.get(page_id)
+        if page is not None:
+            self._cache.move_to_end(page_id)
+            return page
+
+        offset = page_id * self.page_size
+        is_leaf, count, next_page = self._PAGE_HEADER.unpack_from(self._mm, offset)
+        offset += self._PAGE_HEADER.size
+        page = Page(bool(is_leaf))
+        page.next = next_page
+        keys = array("q")
+        keys.frombytes(self._mm[offset:offset + 8 * count])
+        page.keys = keys.tolist()
+        offset += 8 * self.order
+        tail = array("q")
+        if page.is_leaf:
+            tail.frombytes(self._mm[offset:offset + 8 * count])
+            page.values = tail.tolist()
+        else:
+            tail.frombytes(self._mm[offset:offset + 8 * (count + 1)])
+            page.children = tail.tolist()
+        self._remember(page_id, page)
+        return page
+
+    def write(self, page_id: int, page: Page) -> None:
+        """Encodes a page into the file and refreshes the cache."""
+        offset = page_id * self.page_size
+        self._PAGE_HEADER.pack_into(self._mm, offset, 1 if page.is_leaf else 0,
+                                    len(page.keys), page.next)
+        offset += self._PAGE_HEADER.size
+        keys = array("q", page.keys).tobytes()
+        self._mm[offset:offset + len(keys)] = keys
+        offset += 8 * self.order
+        tail = array("q", page.values if page.is_leaf else page.children).tobytes()
+        self._mm[offset:offset + len(tail)] = tail
+        self._remember(page_id, page)
+
+    def _remember(self, page_id: int, page: Page) -> None:
+        """Adds a decoded page to the LRU cache, evicting the oldest one if needed."""
+        self._cache[page_id] = page
+        self._cache.move_to_end(page_id)
+        if len(self._cache) > self._cache_pages:
+            self._cache.popitem(last=False)
+
+    def flush(self) -> None:
+        """Writes the header and all dirty pages back to the file."""
+        self.save_meta()
+        self._mm.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file."""
+        if self._mm.closed:
+            return
+        self.flush()
+        self._mm.close()
+        self._file.close()
+
+class BPlusTree:
+    """
+    A B+ Tree mapping keys to values, stored in pages of a page store.
+
+    Attributes:
+        store: The page store holding the nodes.
+        order: The maximum number of keys per node.
+    """
+    def __init__(self, store: Any = None, order: Optional[int] = None):
+        """
+        Creates a new tree or opens the tree already held by `store`.
+
+        Args:
+            store: A MemoryPageStore (the default) or MmapPageStore.
+            order: The maximum number of keys per node for a new tree. By
+                   default 64 in memory, or as many as fit in a page for an
+                   mmap store. Ignored when opening an existing tree.
+
+        Raises:
+            ValueError: If the order is below 3 or does not fit in a page.
+        """
+        self.store = store if store is not None else MemoryPageStore()
+        if self.store.root == NO_PAGE:
+            limit = self.store.max_order()
+            if order is None:
+                order = limit if limit is not None else 64
+            if order < 3 or (limit is not None and order > limit):
+                raise ValueError(f"Order must be between 3 and {limit or 'unbounded'}.")
+            self.store.order = order
+            self.store.root = self.store.allocate(Page(is_leaf=True))
+            self.store.save_meta()
+        self.order: int = self.store.order
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys.
+
+        Time Complexity: O(1)
+        """
+        return self.store.size
+
+    def _find_leaf(self, key: Any) -> Tuple[Page, List[Tuple[int, Page, int]]]:
+        """Walks from the root to the leaf for `key`, recording (id, page, child index)."""
+        path = []
+        page_id = self.store.root
+        page = self.store.read(page_id)
+        while not page.is_leaf:
+            index = bisect_right(page.keys, key)
+            path.append((page_id, page, index))
+            page_id = page.children[index]
+            page = self.store.read(page_id)
+        path.append((page_id, page, -1))
+        return page, path
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value stored under `key`, or `default`.
+
+        Time Complexity: O(log n) page reads, O(log order) comparisons each.
+        """
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return default
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Returns the value stored under `key`, or None if it is missing.
+
+        Time Complexity: O(log n)
+        """
+        return self.get(key)
+
+    def __contains__(self, key: Any) -> bool:
+        """Checks whether `key` is stored."""
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and leaf.keys[index] == key
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Stores `value` under `key`, replacing any previous value.
+
+        A node that overflows is split in half and the split propagates up
+        the recorded path; a split root grows the tree by one level.
+
+        Time Complexity: O(log n)
+        """
+        leaf, path = self._find_leaf(key)
+        leaf_id = path[-1][0]
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.values[index] = value
+            self.store.write(leaf_id, leaf)
+            return
+
+        leaf.keys.insert(index, key)
+        leaf.values.insert(index, value)
+        self.store.size += 1
+
+        split = None
+        if len(leaf.keys) > self.order:
+            split = self._split_leaf(leaf)
+        self.store.write(leaf_id, leaf)
+
+        # Propagate the split up through the ancestors.
+        for page_id, page, child_index in reversed(path[:-1]):
+            if split is None:
+                break
+            separator, new_id = split
+            page.keys.insert(child_index, separator)
+            page.children.insert(child_index + 1, new_id)
+            split = self._split_internal(page) if len(page.keys) > self.order else None
+            self.store.write(page_id, page)
+
+        if split is not None:
+            separator, new_id = split
+            root = Page(is_leaf=False)
+            root.keys = [separator]
+            root.children = [self.store.root, new_id]
+            self.store.root = self.store.allocate(root)
+        self.store.save_meta()
+
+    def _split_leaf(self, leaf: Page) -> Tuple[Any, int]:
+        """Moves the upper half of a leaf into a new right sibling."""
+        middle = len(leaf.keys) // 2
+        right = Page(is_leaf=True)
+        right.keys = leaf.keys[middle:]
+        right.values = leaf.values[middle:]
+        right.next = leaf.next
+        del leaf.keys[middle:]
+        del leaf.values[middle:]
+        right_id = self.store.allocate(right)
+        leaf.next = right_id
+        return right.keys[0], right_id
+
+    def _split_internal(self, page: Page) -> Tuple[Any, int]:
+        """Moves the upper half of an internal node into a new sibling, promoting the middle key."""
+        middle = len(page.keys) // 2
+        separator = page.keys[middle]
+        right = Page(is_leaf=False)
+        right.keys = page.keys[middle + 1:]
+        right.children = page.children[middle + 1:]
+        del page.keys[middle:]
+        del page.children[middle + 1:]
+        return separator, self.store.allocate(right)
+
+    def delete(self, key: Any) -> bool:
+        """
+        Removes `key` from its leaf (lazy deletion, no merging).
+
+        Time Complexity: O(log n)
+        Returns:
+            True if the key was removed, False if it was not present.
+        """
+        leaf, path = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index >= len(leaf.keys) or leaf.keys[index] != key:
+            return False
+        del leaf.keys[index]
+        del leaf.values[index]
+        self.store.write(path[-1][0], leaf)
+        self.store.size -= 1
+        self.store.save_meta()
+        return True
+
+    def iter_range(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields (key, value) pairs with lo <= key <= hi in key order.
+
+        Only the root-to-leaf path for `lo` and the leaves holding the range
+        are read, following the leaf chain.
+
+        Time Complexity: O(log n + k) for k yielded pairs.
+        """
+        if lo is None:
+            page_id = self.store.root
+            page = self.store.read(page_id)
+            while not page.is_leaf:
+                page = self.store.read(page.children[0])
+            index = 0
+        else:
+            page, _ = self._find_leaf(lo)
+            index = bisect_left(page.keys, lo)
+        while True:
+            keys, values = page.keys, page.values
+            while index < len(keys):
+                if hi is not None and keys[index] > hi:
+                    return
+                yield keys[index], values[index]
+                index += 1
+            if page.next == NO_PAGE:
+                return
+            page = self.store.read(page.next)
+            index = 0
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields every (key, value) pair in key order."""
+        return self.iter_range()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys in sorted order."""
+        for key, _ in self.iter_range():
+            yield key
+
+    def bulk_load(self, items: Iterable[Tuple[Any, Any]], fill_factor: float = 1.0) -> None:
+        """
+        Builds the tree bottom-up from (key, value) pairs sorted by key.
+
+        Leaves are packed to `fill_factor` of the order and written
+        sequentially, then each internal level is built from the first keys
+        of the level below. This is far faster than repeated inserts and
+        leaves no half-empty pages.
+
+        Time Complexity: O(n)
+        Args:
+            items: Pairs in strictly ascending key order.
+            fill_factor: The fraction of each leaf to fill, in (0, 1].
+
+        Raises:
+            ValueError: If the tree is not empty, the keys are not strictly
+                        ascending, or fill_factor is out of range. Keys
+                        that are out of order leave the tree empty.
+        """
+        if self.store.size:
+            raise ValueError("bulk_load requires an empty tree.")
+        if not 0 < fill_factor <= 1:
+            raise ValueError("fill_factor must be in (0, 1].")
+        per_leaf = max(1, int(self.order * fill_factor))
+
+        # An empty tree may still hold the pages of keys that were deleted,
+        # since deletion never frees pages; start over from a blank store.
+        leaf_id = self._reset_store()
+        leaf = self.store.read(leaf_id)
+
+        # Build the leaf level, starting with the new root.
+        level: List[Tuple[Any, int]] = []
+        previous_key = None
+        count = 0
+        try:
+            for key, value in items:
+                if count and not previous_key < key:
+                    raise ValueError("bulk_load keys must be strictly ascending.")
+                if len(leaf.keys) == per_leaf:
+                    next_leaf = Page(is_leaf=True)
+                    next_id = self.store.allocate(next_leaf)
+                    leaf.next = next_id
+                    self.store.write(leaf_id, leaf)
+                    level.append((leaf.keys[0], leaf_id))
+                    leaf, leaf_id = next_leaf, next_id
+                leaf.keys.append(key)
+                leaf.values.append(value)
+                previous_key = key
+                count += 1
+        except Exception:
+            # Drop the leaves written so far so the tree is empty again.
+            self._reset_store()
+            raise
+        self.store.write(leaf_id, leaf)
+        if not count:
+            return
+        level.append((leaf.keys[0], leaf_id))
+        self.store.size = count
+
+        # Build internal levels until a single root remains.
+        fan_out = self.order + 1
+        while len(level) > 1:
+            groups = [level[i:i + fan_out] for i in range(0, len(level), fan_out)]
+            if len(groups) > 1 and len(groups[-1]) < 2:
+                # Avoid a node with a single child by borrowing from its neighbour.
+                groups[-1].insert(0, groups[-2].pop())
+            next_level = []
+            for group in groups:
+                page = Page(is_leaf=False)
+                page.keys = [first_key for first_key, _ in group[1:]]
+                page.children = [page_id for _, page_id in group]
+                next_level.append((group[0][0], self.store.allocate(page)))
+            level = next_level
+        self.store.root = level[0][1]
+        self.store.save_meta()
+
+    def _reset_store(self) -> int:
+        """Discards every page and allocates a single empty root leaf, returning its id."""
+        self.store.reset()
+        self.store.root = self.store.allocate(Page(is_leaf=True))
+        self.store.save_meta()
+        return self.store.root
+
+    def height(self) -> int:
+        """Returns the number of levels, counting the leaves."""
+        levels = 1
+        page = self.store.read(self.store.root)
+        while not page.is_leaf:
+            page = self.store.read(page.children[0])
+            levels += 1
+        return levels
+
+    def flush(self) -> None:
+        """Writes pending changes to the page store's backing storage."""
+        self.store.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the page store."""
+        self.store.close()
+
+    def __enter__(self) -> 'BPlusTree':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
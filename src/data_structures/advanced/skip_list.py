@@ -0,0 +1,289 @@
+"""
+This module contains the implementation of a Skip List, a probabilistic
+ordered set.
+
+A skip list is a sorted linked list augmented with "express lanes": every node
+is given a random height, and a node of height h is linked into the first h of
+a stack of lists. Searches start in the sparsest lane at the top and drop a
+level whenever the next step would overshoot, giving expected O(log n) search,
+insertion and deletion without any rebalancing. Each link also records its
+width (how many elements it skips), which supports rank and select queries in
+expected O(log n).
+
+Because updates only ever swap single forward pointers, a skip list is also a
+convenient concurrent structure. In thread-safe mode writers are serialized by
+a lock, while searches and scans take no lock at all: a new node is fully
+linked to its successors before it is published, and a removed node keeps its
+forward pointers, so a reader never follows a dangling or half-built link.
+"""
+import random
+import threading
+from contextlib import nullcontext
+from typing import Any, Iterator, List, Optional
+
+class Node:
+    """
+    A node in a Skip List.
+
+    Attributes:
+        key: The value stored in the node (None for the head sentinel).
+        forward: forward[i] is the next node in lane i, or None at the end.
+        width: width[i] is the number of elements link i skips over, plus one.
+    """
+    __slots__ = ("key", "forward", "width")
+
+    def __init__(self, key: Any, height: int):
+        """Initializes a node linked into `height` lanes."""
+        self.key: Any = key
+        self.forward: List[Optional['Node']] = [None] * height
+        self.width: List[int] = [1] * height
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return f"Node({self.key})"
+
+class SkipList:
+    """
+    A Skip List storing distinct, mutually comparable keys in sorted order.
+
+    Attributes:
+        head: The sentinel node that starts every lane.
+        level: The number of lanes currently in use.
+        size: The number of keys stored.
+        max_level: The maximum height of a node.
+        thread_safe: Whether writers are serialized by a lock.
+    """
+    def __init__(self, max_level: int = 32, thread_safe: bool = False,
+                 seed: Optional[int] = None):
+        """
+        Initializes an empty skip list.
+
+        Args:
+            max_level: The maximum node height; 32 comfortably covers 2**32 keys.
+            thread_safe: If True, insert and delete (and the width-based rank
+                         and select) take a lock, while search, membership
+                         tests and iteration stay lock-free.
+            seed: An optional seed for the level generator, for reproducible shapes.
+        """
+        self.max_level: int = max_level
+        self.head: Node = Node(None, max_level)
+        self.level: int = 1
+        self.size: int = 0
+        self.thread_safe: bool = thread_safe
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+        self._random = random.Random(seed)
+
+    def _random_level(self) -> int:
+        """Draws a node height with P(height > h) = 2**-h."""
+        # The number of trailing zero bits of a random word is geometrically
+        # distributed, which saves one random() call per extra level.
+        bits = self._random.getrandbits(self.max_level - 1)
+        if bits == 0:
+            return self.max_level
+        return (bits & -bits).bit_length()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys.
+
+        Time Complexity: O(1)
+        """
+        return self.size
+
+    def search(self, key: Any) -> Optional[Node]:
+        """
+        Searches for the node holding `key`. Lock-free in thread-safe mode.
+
+        Time Complexity: O(log n) expected.
+        Args:
+            key: The key to search for.
+        Returns:
+            The node if found, otherwise None.
+        """
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.key < key:
+                node = nxt
+                nxt = node.forward[i]
+        nxt = node.forward[0]
+        if nxt is not None and nxt.key == key:
+            return nxt
+        return None
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks whether `key` is stored. Lock-free in thread-safe mode.
+
+        Time Complexity: O(log n) expected.
+        """
+        return self.search(key) is not None
+
+    def insert(self, key: Any) -> bool:
+        """
+        Inserts a key; duplicates are ignored.
+
+        Time Complexity: O(log n) expected.
+        Args:
+            key: The key to insert.
+        Returns:
+            True if the key was added, False if it was already present.
+        """
+        with self._lock:
+            update = [self.head] * self.max_level
+            position_of = [0] * self.max_level
+            node = self.head
+            position = 0
+            for i in range(self.level - 1, -1, -1):
+                nxt = node.forward[i]
+                while nxt is not None and nxt.key < key:
+                    position += node.width[i]
+                    node = nxt
+                    nxt = node.forward[i]
+                update[i] = node
+                position_of[i] = position
+            nxt = node.forward[0]
+            if nxt is not None and nxt.key == key:
+                return False
+
+            height = self._random_level()
+            if height > self.level:
+                # Newly used lanes run straight from the head to the end.
+                for i in range(self.level, height):
+                    self.head.width[i] = self.size + 1
+
+            new_node = Node(key, height)
+            new_position = position + 1
+            # Link the new node to its successors before publishing it, so
+            # lock-free readers never see a partially linked node.
+            for i in range(height):
+                prev = update[i]
+                new_node.forward[i] = prev.forward[i]
+                new_node.width[i] = prev.width[i] - (new_position - position_of[i]) + 1
+            for i in range(height):
+                prev = update[i]
+                prev.forward[i] = new_node
+                prev.width[i] = new_position - position_of[i]
+            # Links that now pass over the new node grow by one.
+            for i in range(height, max(self.level, height)):
+                update[i].width[i] += 1
+
+            self.level = max(self.level, height)
+            self.size += 1
+            return True
+
+    def delete(self, key: Any) -> bool:
+        """
+        Deletes a key if present.
+
+        The removed node keeps its forward pointers, so a concurrent reader
+        standing on it can still continue its walk.
+
+        Time Complexity: O(log n) expected.
+        Args:
+            key: The key to delete.
+        Returns:
+            True if the key was removed, False if it was not present.
+        """
+        with self._lock:
+            update = [self.head] * self.max_level
+            node = self.head
+            for i in range(self.level - 1, -1, -1):
+                nxt = node.forward[i]
+                while nxt is not None and nxt.key < key:
+                    node = nxt
+                    nxt = node.forward[i]
+                update[i] = node
+            target = node.forward[0]
+            if target is None or target.key != key:
+                return False
+
+            # Unlink from the top lane down.
+            for i in range(self.level - 1, -1, -1):
+                prev = update[i]
+                if prev.forward[i] is target:
+                    prev.width[i] += target.width[i] - 1
+                    prev.forward[i] = target.forward[i]
+                else:
+                    prev.width[i] -= 1
+
+            while self.level > 1 and self.head.forward[self.level - 1] is None:
+                self.level -= 1
+            self.size -= 1
+            return True
+
+    def rank(self, key: Any) -> int:
+        """
+        Returns the number of keys strictly less than `key`.
+
+        Time Complexity: O(log n) expected.
+        """
+        with self._lock:
+            node = self.head
+            position = 0
+            for i in range(self.level - 1, -1, -1):
+                nxt = node.forward[i]
+                while nxt is not None and nxt.key < key:
+                    position += node.width[i]
+                    node = nxt
+                    nxt = node.forward[i]
+            return position
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest key (0-based); negative k counts from the end.
+
+        Time Complexity: O(log n) expected.
+        Raises:
+            IndexError: If k is out of range.
+        """
+        with self._lock:
+            if k < 0:
+                k += self.size
+            if not 0 <= k < self.size:
+                raise IndexError("select index out of range")
+            target = k + 1
+            node = self.head
+            position = 0
+            for i in range(self.level - 1, -1, -1):
+                while node.forward[i] is not None and position + node.width[i] <= target:
+                    position += node.width[i]
+                    node = node.forward[i]
+            return node.key
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Lazily yields the keys in sorted order. Lock-free in thread-safe mode.
+        """
+        node = self.head.forward[0]
+        while node is not None:
+            yield node.key
+            node = node.forward[0]
+
+    def iter_range(self, lo: Any = None, hi: Any = None) -> Iterator[Any]:
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Lock-free in thread-safe mode: keys inserted or deleted during the
+        scan may or may not be seen, but the scan always stays sorted.
+
+        Time Complexity: O(log n + k) expected for k yielded keys.
+        Args:
+            lo: The inclusive lower bound, or None for no lower bound.
+            hi: The inclusive upper bound, or None for no upper bound.
+        """
+        node = self.head
+        if lo is not None:
+            for i in range(self.level - 1, -1, -1):
+                nxt = node.forward[i]
+                while nxt is not None and nxt.key < lo:
+                    node = nxt
+                    nxt = node.forward[i]
+        node = node.forward[0]
+        while node is not None and (hi is None or not hi < node.key):
+            yield node.key
+            node = node.forward[0]
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return "SkipList([" + ", ".join(repr(key) for key in self) + "])"
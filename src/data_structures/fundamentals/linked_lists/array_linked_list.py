@@ -0,0 +1,270 @@
+"""
+This module contains the implementation of an Array-Backed Linked List, a
+doubly linked list that stores its links in flat integer arrays instead of
+one Python object per node.
+
+Each element lives in a numbered slot. The `next` and `prev` links of every
+slot are kept in two `array('l')` buffers and the values in a parallel Python
+list, so an element costs a few machine words rather than a full object with
+its own header and garbage-collector bookkeeping. Slots freed by deletions are
+pushed on a free-list and recycled by later insertions. Slot numbers play the
+role of node references: `find` returns one and `insert_after` accepts one.
+"""
+
+# src\data_structures\fundamentals\linked_lists\array_linked_list.py
+
+from array import array
+from typing import Any, Iterator, List, Optional
+
+# Link value meaning "no slot", the array equivalent of a None pointer.
+NIL = -1
+
+# Marker stored in the value list for slots that are on the free-list.
+_FREE = object()
+
+class ArrayLinkedList:
+    """
+    A doubly linked list whose nodes are slots in struct-of-arrays storage.
+
+    Attributes:
+        head: The slot of the first element, or NIL if the list is empty.
+        tail: The slot of the last element, or NIL if the list is empty.
+        size: The number of elements in the list.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes an empty array-backed linked list.
+        """
+        self._next = array('l')
+        self._prev = array('l')
+        self._data: List[Any] = []
+        self._free = array('l')
+        self.head: int = NIL
+        self.tail: int = NIL
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the list.
+
+        Time Complexity: O(1)
+        """
+        return self.size
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks if a value is present in the list.
+
+        Time Complexity: O(n)
+        """
+        return self.find(value) is not None
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def _allocate(self, data: Any) -> int:
+        """Returns a fresh slot holding `data`, reusing a freed slot when possible."""
+        if self._free:
+            slot = self._free.pop()
+            self._data[slot] = data
+            return slot
+        self._next.append(NIL)
+        self._prev.append(NIL)
+        self._data.append(data)
+        return len(self._data) - 1
+
+    def _release(self, slot: int) -> None:
+        """Returns a slot to the free-list and drops its value reference."""
+        self._data[slot] = _FREE
+        self._free.append(slot)
+
+    def _check_slot(self, slot: Optional[int]) -> None:
+        """Raises ValueError unless `slot` refers to a live element."""
+        if slot is None:
+            raise ValueError("Slot cannot be None.")
+        if not 0 <= slot < len(self._data) or self._data[slot] is _FREE:
+            raise ValueError(f"Slot {slot} does not hold an element of this list.")
+
+    def append(self, data: Any) -> int:
+        """
+        Appends a new element to the end of the list.
+
+        Time Complexity: O(1) amortized.
+
+        Args:
+            data: The value to add.
+
+        Returns:
+            int: The slot of the new element.
+        """
+        slot = self._allocate(data)
+        self._next[slot] = NIL
+        self._prev[slot] = self.tail
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+        return slot
+
+    def prepend(self, data: Any) -> int:
+        """
+        Adds a new element to the beginning of the list.
+
+        Time Complexity: O(1) amortized.
+
+        Args:
+            data: The value to add.
+
+        Returns:
+            int: The slot of the new element.
+        """
+        slot = self._allocate(data)
+        self._prev[slot] = NIL
+        self._next[slot] = self.head
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self._prev[self.head] = slot
+        self.head = slot
+        self.size += 1
+        return slot
+
+    def insert_after(self, slot: int, value: Any) -> int:
+        """
+        Inserts a new element after the element stored in `slot`.
+
+        Time Complexity: O(1)
+
+        Args:
+            slot: The slot of an existing element, as returned by find/append.
+            value: The value to add.
+
+        Returns:
+            int: The slot of the new element.
+
+        Raises:
+            ValueError: If `slot` is None or does not hold an element.
+        """
+        self._check_slot(slot)
+        new_slot = self._allocate(value)
+        following = self._next[slot]
+        self._prev[new_slot] = slot
+        self._next[new_slot] = following
+        if following == NIL:
+            self.tail = new_slot
+        else:
+            self._prev[following] = new_slot
+        self._next[slot] = new_slot
+        self.size += 1
+        return new_slot
+
+    def remove(self, slot: int) -> Any:
+        """
+        Unlinks the element stored in `slot` and recycles the slot.
+
+        Time Complexity: O(1)
+
+        Args:
+            slot: The slot of an existing element.
+
+        Returns:
+            The removed value.
+
+        Raises:
+            ValueError: If `slot` is None or does not hold an element.
+        """
+        self._check_slot(slot)
+        before = self._prev[slot]
+        after = self._next[slot]
+        if before == NIL:
+            self.head = after
+        else:
+            self._next[before] = after
+        if after == NIL:
+            self.tail = before
+        else:
+            self._prev[after] = before
+        value = self._data[slot]
+        self._release(slot)
+        self.size -= 1
+        return value
+
+    def delete(self, value: Any) -> None:
+        """
+        Deletes the first occurrence of an element with the given value.
+
+        Time Complexity: O(n) in the worst case.
+
+        Args:
+            value: The value to delete.
+        """
+        slot = self.find(value)
+        if slot is not None:
+            self.remove(slot)
+
+    def find(self, value: Any) -> Optional[int]:
+        """
+        Finds the slot of the first element equal to `value`.
+
+        Time Complexity: O(n)
+
+        Returns:
+            int: The slot of the first match, or None if not found.
+        """
+        data = self._data
+        links = self._next
+        slot = self.head
+        while slot != NIL:
+            if data[slot] == value:
+                return slot
+            slot = links[slot]
+        return None
+
+    def get(self, slot: int) -> Any:
+        """
+        Returns the value stored in `slot`.
+
+        Time Complexity: O(1)
+
+        Raises:
+            ValueError: If `slot` is None or does not hold an element.
+        """
+        self._check_slot(slot)
+        return self._data[slot]
+
+    def reverse(self) -> None:
+        """
+        Reverses the list in-place.
+
+        Swapping the roles of the two link arrays reverses every link at
+        once, so no element needs to be visited.
+
+        Time Complexity: O(1)
+        """
+        self._next, self._prev = self._prev, self._next
+        self.head, self.tail = self.tail, self.head
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the values from head to tail.
+        """
+        data = self._data
+        links = self._next
+        slot = self.head
+        while slot != NIL:
+            yield data[slot]
+            slot = links[slot]
+
+    def __repr__(self) -> str:
+        """
+        Provides a clear string representation of the list for debugging.
+        """
+        return " <-> ".join(str(value) for value in self)
@@ -7,11 +7,21 @@ A Circular Linked List is a linear data structure where the last node points bac
 to the first node, forming a circle. This unique structure allows for seamless
 traversal without a defined end, making it useful for applications like round-robin
 scheduling, music playlists, or continuous data streams.
+
+The list keeps a pointer to its tail, the head's predecessor in the ring, so
+append, prepend and deleting the head are O(1). The head doubles as a cursor:
+`advance`, `rotate` and `pop_current` move it around the ring or cut it out
+in constant time per step, which is all a round-robin scheduler needs.
+
+An optional hash index maps every value to the nodes holding it (together with
+each node's predecessor in the ring), turning find, membership tests and
+delete-by-value into O(1) average operations at the cost of one dict entry per
+node.
 """
 
 # src\data_structures\fundamentals\linked_lists\circular_linked_list.py
 
-from typing import Any, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 class Node:
     """
@@ -21,6 +31,8 @@ class Node:
         data: The value stored in the node. Can be any data type.
         next: A pointer to the next node in the list. Defaults to None.
     """
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any) -> None:
         """
         Initializes a new node with the given data.
@@ -38,12 +50,27 @@ class CircularLinkedList:
 
     Attributes:
         head: The head node of the list.
+        tail: The last node of the list, whose next is the head.
         size: The number of elements in the list.
+        indexed: Whether the value index is maintained.
     """
-    def __init__(self) -> None:
-        """Initializes a new, empty circular linked list."""
+    def __init__(self, indexed: bool = False) -> None:
+        """
+        Initializes a new, empty circular linked list.
+
+        Args:
+            indexed: If True, maintain a value -> {node: predecessor} index so
+                     that find, `in` and delete run in O(1) on average. Values
+                     must then be hashable. With duplicate values, the indexed
+                     lookups use the earliest-inserted matching node, which is
+                     the first by position unless a later duplicate was
+                     prepended in front of it.
+        """
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
         self.size: int = 0
+        self.indexed: bool = indexed
+        self._index: Optional[Dict[Any, Dict[Node, Node]]] = {} if indexed else None
 
     def __len__(self) -> int:
         """
@@ -57,7 +84,7 @@ class CircularLinkedList:
         """
         Checks if the list contains a given value.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n), or O(1) on average for an indexed list.
 
         Args:
             value: The value to search for.
@@ -65,6 +92,9 @@ class CircularLinkedList:
         Returns:
             bool: True if the value is in the list, False otherwise.
         """
+        if self._index is not None:
+            return value in self._index
+
         if self.is_empty():
             return False
 
@@ -86,15 +116,7 @@ class CircularLinkedList:
         """
         if self.is_empty():
             return "CircularLinkedList()"
-
-        nodes = []
-        current = self.head
-        while True:
-            nodes.append(repr(current.data))
-            current = current.next
-            if current == self.head:
-                break
-        return "CircularLinkedList(" + " -> ".join(nodes) + " -> ...)"
+        return "CircularLinkedList(" + " -> ".join(repr(data) for data in self.values()) + " -> ...)"
 
     def is_empty(self) -> bool:
         """
@@ -107,46 +129,53 @@ class CircularLinkedList:
         """
         return self.size == 0
 
+    def _link_first(self, node: Node) -> None:
+        """Makes a node the only element of an empty list."""
+        node.next = node
+        self.head = self.tail = node
+        if self._index is not None:
+            self._index_add(node, node)
+
+    def _link_after_tail(self, node: Node) -> None:
+        """Splices a node in between the tail and the head."""
+        tail = self.tail
+        tail.next = node
+        node.next = self.head
+        if self._index is not None:
+            self._index_add(node, tail)
+            self._index_set_prev(self.head, node)
+
     def append(self, value: Any) -> None:
         """
         Adds a new node to the end of the list.
 
-        Time Complexity: O(n) to find the tail.
+        Time Complexity: O(1)
 
         Args:
             value: The value to add.
         """
         new_node = Node(value)
         if self.is_empty():
-            self.head = new_node
-            new_node.next = self.head
+            self._link_first(new_node)
         else:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
-            new_node.next = self.head
+            self._link_after_tail(new_node)
+            self.tail = new_node
         self.size += 1
 
     def prepend(self, value: Any) -> None:
         """
         Adds a new node to the beginning of the list.
 
-        Time Complexity: O(n) to find the tail.
+        Time Complexity: O(1)
 
         Args:
             value: The value to add.
         """
         new_node = Node(value)
         if self.is_empty():
-            self.head = new_node
-            new_node.next = self.head
+            self._link_first(new_node)
         else:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
-            new_node.next = self.head
+            self._link_after_tail(new_node)
             self.head = new_node
         self.size += 1
 
@@ -154,7 +183,7 @@ class CircularLinkedList:
         """
         Finds and returns the first node containing the specified value.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n), or O(1) on average for an indexed list.
 
         Args:
             value: The value to search for.
@@ -162,6 +191,10 @@ class CircularLinkedList:
         Returns:
             Node: The first node containing the value, or None if not found.
         """
+        if self._index is not None:
+            entries = self._index.get(value)
+            return next(iter(entries)) if entries else None
+
         if self.is_empty():
             return None
 
@@ -178,7 +211,7 @@ class CircularLinkedList:
         """
         Deletes the first occurrence of a node with the specified value.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n); O(1) for the head, or on average for an indexed list.
 
         Args:
             value: The value of the node to delete.
@@ -186,40 +219,78 @@ class CircularLinkedList:
         Returns:
             Node: The deleted node, or None if not found.
         """
+        if self._index is not None:
+            return self._delete_indexed(value)
+
         if self.is_empty():
             return None
 
         # Case 1: Deleting the head node
         if self.head.data == value:
-            # Find the tail node
-            if self.size == 1:
-                deleted_node = self.head
-                self.head = None
-                self.size = 0
-                return deleted_node
-            
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            
-            deleted_node = self.head
-            current.next = self.head.next
-            self.head = self.head.next
-            self.size -= 1
-            return deleted_node
+            return self._unlink_head()
 
         # Case 2: Deleting a node from the middle or tail
-        current = self.head
-        prev = None
-        while current.next != self.head:
-            prev = current
-            current = current.next
+        prev = self.head
+        current = prev.next
+        while current is not self.head:
             if current.data == value:
                 prev.next = current.next
+                if current is self.tail:
+                    self.tail = prev
                 self.size -= 1
                 return current
+            prev = current
+            current = current.next
         return None
 
+    def _unlink_head(self) -> Node:
+        """Removes the head node in O(1), using the tail as its predecessor."""
+        node = self.head
+        if self._index is not None:
+            self._index_remove(node)
+        if self.size == 1:
+            self.head = self.tail = None
+        else:
+            self.head = self.tail.next = node.next
+            if self._index is not None:
+                self._index_set_prev(node.next, self.tail)
+        self.size -= 1
+        return node
+
+    def _index_add(self, node: Node, prev: Node) -> None:
+        """Records a new node and its predecessor in the value index."""
+        self._index.setdefault(node.data, {})[node] = prev
+
+    def _index_set_prev(self, node: Node, prev: Node) -> None:
+        """Updates the predecessor recorded for a node already in the index."""
+        self._index[node.data][node] = prev
+
+    def _index_remove(self, node: Node) -> None:
+        """Drops a node from the value index."""
+        entries = self._index[node.data]
+        del entries[node]
+        if not entries:
+            del self._index[node.data]
+
+    def _delete_indexed(self, value: Any) -> Optional[Node]:
+        """Unlinks the indexed node holding `value`, using its recorded predecessor."""
+        entries = self._index.get(value)
+        if not entries:
+            return None
+        node, prev = next(iter(entries.items()))
+        self._index_remove(node)
+        if self.size == 1:
+            self.head = self.tail = None
+        else:
+            prev.next = node.next
+            self._index_set_prev(node.next, prev)
+            if node is self.head:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = prev
+        self.size -= 1
+        return node
+
     def __iter__(self) -> Iterable[Node]:
         """
         Allows the list to be iterated over in a for loop.
@@ -233,3 +304,153 @@ class CircularLinkedList:
             current = current.next
             if current == self.head:
                 break
+
+    def values(self) -> Iterator[Any]:
+        """
+        Yields the stored values for one lap of the ring, starting at the head.
+
+        Time Complexity: O(1) per value.
+        """
+        if self.is_empty():
+            return
+
+        current = self.head
+        while True:
+            yield current.data
+            current = current.next
+            if current is self.head:
+                break
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns the stored values as a Python list, starting at the head.
+
+        Time Complexity: O(n)
+        """
+        return list(self.values())
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Appends every value from an iterable in a single pass.
+
+        The new nodes are chained together first and then spliced in between
+        the tail and the head at once.
+
+        Time Complexity: O(k) for k new values.
+
+        Args:
+            iterable: The values to append. A CircularLinkedList contributes
+                      its values, not its nodes.
+        """
+        if isinstance(iterable, CircularLinkedList):
+            iterable = iterable.to_list()
+        first = last = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if self._index is not None:
+                self._index_add(new_node, last)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        if first is None:
+            return
+        if self.is_empty():
+            self.head = first
+            tail = last
+        else:
+            tail = self.tail
+            tail.next = first
+        last.next = self.head
+        self.tail = last
+        if self._index is not None:
+            # The ends of the batch are only linked once the loop is done.
+            self._index_set_prev(first, tail)
+            self._index_set_prev(self.head, last)
+        self.size += count
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Returns the value at a position counted from the head, or a new list
+        for a slice.
+
+        Negative indices count back from the tail, as with Python lists.
+
+        Time Complexity: O(i) to reach index i, O(1) for the last element;
+        O(n) for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            wanted = range(*index.indices(self.size))
+            result = CircularLinkedList(indexed=self.indexed)
+            picked = [data for i, data in enumerate(self.values()) if i in wanted]
+            result.extend(picked if wanted.step > 0 else reversed(picked))
+            return result
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+        if index == self.size - 1:
+            return self.tail.data
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current.data
+
+    def advance(self) -> Any:
+        """
+        Returns the value at the head and moves the head on to the next node.
+
+        Successive calls cycle through the ring forever, like itertools.cycle,
+        which makes the head the cursor of a round-robin rotation.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        node = self.head
+        if node is None:
+            raise IndexError("advance on an empty list")
+        self.tail = node
+        self.head = node.next
+        return node.data
+
+    def rotate(self, k: int = 1) -> None:
+        """
+        Moves the head k nodes forward, so the value at index k becomes the head.
+
+        A negative k moves the head backward, which in a singly linked ring
+        means going forward size - |k| nodes. No node is relinked.
+
+        Time Complexity: O(k mod n)
+        """
+        if self.size == 0:
+            return
+        steps = k % self.size
+        if not steps:
+            return
+        tail = self.tail
+        for _ in range(steps):
+            tail = tail.next
+        self.tail = tail
+        self.head = tail.next
+
+    def pop_current(self) -> Any:
+        """
+        Removes the head node and returns its value; the next node becomes the head.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.head is None:
+            raise IndexError("pop from an empty list")
+        return self._unlink_head().data
@@ -7,11 +7,15 @@ A Doubly Linked List is a linear data structure where each element, called a nod
 contains a value, a pointer to the next node, and a pointer to the previous node.
 This structure allows for efficient O(1) time complexity for insertions and deletions
 at both the head and tail.
+
+An optional hash index maps every value to the nodes holding it, turning find,
+membership tests and delete-by-value into O(1) average operations at the cost
+of one dict entry per node.
 """
 
 # src\data_structures\fundamentals\linked_lists\doubly_linked_list.py
 
-from typing import Any, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 class Node:
     """
@@ -22,6 +26,8 @@ class Node:
         next: A pointer to the next node in the list. Defaults to None.
         prev: A pointer to the previous node in the list. Defaults to None.
     """
+    __slots__ = ("data", "next", "prev")
+
     def __init__(self, data: Any) -> None:
         """
         Initializes a new node with the given data.
@@ -41,36 +47,43 @@ class DoublyLinkedList:
     Attributes:
         head: The head node of the list.
         tail: The tail node of the list.
+        size: The number of nodes in the list.
+        indexed: Whether the value index is maintained.
     """
-    def __init__(self) -> None:
+    def __init__(self, indexed: bool = False) -> None:
         """
         Initializes an empty doubly linked list.
+
+        Args:
+            indexed: If True, maintain a value -> nodes index so that find,
+                     `in` and delete run in O(1) on average. Values must then
+                     be hashable. With duplicate values, the indexed lookups
+                     use the earliest-inserted matching node, which is the
+                     first by position unless a later duplicate was moved or
+                     inserted in front of it.
         """
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
+        self.size: int = 0
+        self.indexed: bool = indexed
+        self._index: Optional[Dict[Any, Dict[Node, None]]] = {} if indexed else None
 
     def __len__(self) -> int:
         """
         Returns the number of nodes in the list.
 
-        Time Complexity: O(n)
-        Note: For O(1) time complexity, a 'size' counter could be maintained.
+        Time Complexity: O(1) due to the maintained size counter.
 
         Returns:
             int: The number of nodes.
         """
-        count = 0
-        current = self.head
-        while current:
-            count += 1
-            current = current.next
-        return count
+        return self.size
 
     def __contains__(self, value: Any) -> bool:
         """
         Checks if a value is present in the list.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n), or O(1) on average for an indexed list.
 
         Args:
             value: The value to search for.
@@ -89,7 +102,7 @@ class DoublyLinkedList:
         """
         return self.head is None
 
-    def append(self, data: Any) -> None:
+    def append(self, data: Any) -> Node:
         """
         Appends a new node with the given data to the end of the list.
 
@@ -97,8 +110,13 @@ class DoublyLinkedList:
 
         Args:
             data: The data for the new node.
+
+        Returns:
+            Node: The new node, usable with remove_node and the move methods.
         """
         new_node = Node(data)
+        if self._index is not None:
+            self._index_add(new_node)
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -106,8 +124,10 @@ class DoublyLinkedList:
             self.tail.next = new_node
             new_node.prev = self.tail
             self.tail = new_node
+        self.size += 1
+        return new_node
 
-    def prepend(self, data: Any) -> None:
+    def prepend(self, data: Any) -> Node:
         """
         Adds a new node with the given data to the beginning of the list.
 
@@ -115,8 +135,13 @@ class DoublyLinkedList:
 
         Args:
             data: The data for the new node.
+
+        Returns:
+            Node: The new node, usable with remove_node and the move methods.
         """
         new_node = Node(data)
+        if self._index is not None:
+            self._index_add(new_node)
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -124,42 +149,132 @@ class DoublyLinkedList:
             new_node.next = self.head
             self.head.prev = new_node
             self.head = new_node
+        self.size += 1
+        return new_node
 
     def delete(self, value: Any) -> None:
         """
         Deletes the first occurrence of a node with the given value.
 
-        Time Complexity: O(n) in the worst case.
+        Time Complexity: O(n) in the worst case, or O(1) on average for an
+        indexed list.
 
         Args:
             value: The data value of the node to delete.
         """
-        if self.is_empty():
+        node = self.find(value)
+        if node is not None:
+            self.remove_node(node)
+
+    def remove_node(self, node: Node) -> Any:
+        """
+        Unlinks a node that belongs to this list, without searching for it.
+
+        Time Complexity: O(1)
+
+        Args:
+            node: A node of this list, e.g. as returned by find, append or insert_after.
+
+        Returns:
+            The data of the removed node.
+
+        Raises:
+            ValueError: If the provided node is None or no longer in the list.
+        """
+        if node is None:
+            raise ValueError("Cannot remove a None node.")
+        self._check_linked(node)
+        if self._index is not None:
+            self._index_remove(node)
+        self._unlink(node)
+        node.next = None
+        node.prev = None
+        self.size -= 1
+        return node.data
+
+    def move_to_front(self, node: Node) -> None:
+        """
+        Moves a node that belongs to this list to the head.
+
+        Time Complexity: O(1)
+
+        Args:
+            node: A node of this list.
+
+        Raises:
+            ValueError: If the provided node is None or no longer in the list.
+        """
+        if node is None:
+            raise ValueError("Cannot move a None node.")
+        self._check_linked(node)
+        if node is self.head:
             return
+        self._unlink(node)
+        node.prev = None
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
 
-        current = self.head
-        while current:
-            if current.data == value:
-                # Case 1: Deleting the head node
-                if current.prev is None:
-                    self.head = current.next
-                    if self.head:
-                        self.head.prev = None
-                    else:  # The list becomes empty
-                        self.tail = None
-                # Case 2: Deleting the tail node
-                elif current.next is None:
-                    self.tail = current.prev
-                    if self.tail:
-                        self.tail.next = None
-                # Case 3: Deleting a middle node
-                else:
-                    current.prev.next = current.next
-                    current.next.prev = current.prev
-                return
-            current = current.next
+    def move_to_end(self, node: Node) -> None:
+        """
+        Moves a node that belongs to this list to the tail.
 
-    def insert_after(self, node: Node, value: Any) -> None:
+        Time Complexity: O(1)
+
+        Args:
+            node: A node of this list.
+
+        Raises:
+            ValueError: If the provided node is None or no longer in the list.
+        """
+        if node is None:
+            raise ValueError("Cannot move a None node.")
+        self._check_linked(node)
+        if node is self.tail:
+            return
+        self._unlink(node)
+        node.next = None
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+
+    def _check_linked(self, node: Node) -> None:
+        """Raises if a node has already been removed from the list."""
+        # Only the head has no predecessor; a removed node has neither link.
+        if node.prev is None and node is not self.head:
+            raise ValueError("The node is no longer in the list.")
+
+    def _index_add(self, node: Node) -> None:
+        """Records a new node in the value index."""
+        self._index.setdefault(node.data, {})[node] = None
+
+    def _index_remove(self, node: Node) -> None:
+        """Drops a node from the value index."""
+        entries = self._index[node.data]
+        del entries[node]
+        if not entries:
+            del self._index[node.data]
+
+    def _unlink(self, node: Node) -> None:
+        """Detaches a node from its neighbours, fixing head and tail as needed."""
+        # Case 1: Unlinking the head node
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        # Case 2: Unlinking the tail node
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+    def insert_after(self, node: Node, value: Any) -> Node:
         """
         Inserts a new node with the given value after a specified existing node.
 
@@ -170,13 +285,19 @@ class DoublyLinkedList:
             node: The existing node after which to insert the new node.
             value: The data for the new node.
 
+        Returns:
+            Node: The new node.
+
         Raises:
-            ValueError: If the provided node is None.
+            ValueError: If the provided node is None or no longer in the list.
         """
         if node is None:
             raise ValueError("Cannot insert after a None node.")
+        self._check_linked(node)
 
         new_node = Node(value)
+        if self._index is not None:
+            self._index_add(new_node)
         new_node.next = node.next
         new_node.prev = node
         
@@ -186,12 +307,14 @@ class DoublyLinkedList:
             self.tail = new_node
             
         node.next = new_node
+        self.size += 1
+        return new_node
 
     def find(self, value: Any) -> Optional[Node]:
         """
         Finds and returns the first node containing the specified value.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n), or O(1) on average for an indexed list.
 
         Args:
             value: The value to search for.
@@ -199,6 +322,10 @@ class DoublyLinkedList:
         Returns:
             Node: The first node containing the value, or None if not found.
         """
+        if self._index is not None:
+            entries = self._index.get(value)
+            return next(iter(entries)) if entries else None
+
         current = self.head
         while current:
             if current.data == value:
@@ -233,11 +360,115 @@ class DoublyLinkedList:
             yield current
             current = current.next
 
+    def values(self, reverse: bool = False) -> Iterator[Any]:
+        """
+        Yields the stored values without exposing the nodes.
+
+        Time Complexity: O(1) per value.
+
+        Args:
+            reverse: If True, yield from tail to head instead.
+        """
+        if reverse:
+            current = self.tail
+            while current:
+                yield current.data
+                current = current.prev
+        else:
+            current = self.head
+            while current:
+                yield current.data
+                current = current.next
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns the stored values as a Python list.
+
+        Time Complexity: O(n)
+        """
+        return list(self.values())
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Appends every value from an iterable in a single pass.
+
+        The new nodes are chained together first and then spliced onto the
+        tail at once.
+
+        Time Complexity: O(k) for k new values.
+
+        Args:
+            iterable: The values to append. A DoublyLinkedList contributes
+                      its values, not its nodes.
+        """
+        if isinstance(iterable, DoublyLinkedList):
+            iterable = iterable.to_list()
+        first = last = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if self._index is not None:
+                self._index_add(new_node)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+                new_node.prev = last
+            last = new_node
+            count += 1
+        if first is None:
+            return
+        if self.is_empty():
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self.size += count
+
+    def _node_at(self, index: int) -> Node:
+        """Returns the node at a non-negative index, walking from the nearer end."""
+        if index <= self.size // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - index):
+                current = current.prev
+        return current
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Returns the value at a position, or a new list for a slice.
+
+        Negative indices count from the tail, as with Python lists. Single
+        positions are reached from whichever end is nearer.
+
+        Time Complexity: O(min(i, n - i)) for index i; O(n) for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            wanted = range(*index.indices(self.size))
+            result = DoublyLinkedList(indexed=self.indexed)
+            if wanted.step > 0:
+                result.extend(data for i, data in enumerate(self.values()) if i in wanted)
+            else:
+                last = self.size - 1
+                result.extend(data for i, data in enumerate(self.values(reverse=True))
+                              if last - i in wanted)
+            return result
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+        return self._node_at(index).data
+
     def __repr__(self) -> str:
         """
         Provides a clear string representation of the list for debugging and printing.
         """
-        nodes = []
-        for node in self:
-            nodes.append(str(node.data))
-        return " <-> ".join(nodes)
+        return " <-> ".join(str(data) for data in self.values())
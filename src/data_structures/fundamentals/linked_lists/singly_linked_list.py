@@ -8,11 +8,15 @@ contains a value and a pointer to the next node in the sequence. Unlike a doubly
 linked list, it does not maintain a pointer to the previous node. This makes
 some operations, like backward traversal, impossible but simplifies the
 structure and reduces memory overhead.
+
+An optional hash index maps every value to the nodes holding it (together with
+each node's predecessor), turning find, membership tests and delete-by-value
+into O(1) average operations at the cost of one dict entry per node.
 """
 
 # src\data_structures\fundamentals\linked_lists\singly_linked_list.py
 
-from typing import Any, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 class Node:
     """
@@ -22,6 +26,8 @@ class Node:
         data: The value stored in the node. Can be any data type.
         next: A pointer to the next node in the list. Defaults to None.
     """
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any) -> None:
         """
         Initializes a new node with the given data.
@@ -41,14 +47,25 @@ class SinglyLinkedList:
         head: The head node of the list.
         tail: The tail node of the list. Maintaining a tail pointer allows for
               O(1) appends.
+        indexed: Whether the value index is maintained.
     """
-    def __init__(self) -> None:
+    def __init__(self, indexed: bool = False) -> None:
         """
         Initializes an empty singly linked list.
+
+        Args:
+            indexed: If True, maintain a value -> {node: predecessor} index so
+                     that find, `in` and delete run in O(1) on average. Values
+                     must then be hashable. With duplicate values, the indexed
+                     lookups use the earliest-inserted matching node, which is
+                     the first by position unless a later duplicate was put in
+                     front of it with prepend or insert_after.
         """
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
         self.size: int = 0
+        self.indexed: bool = indexed
+        self._index: Optional[Dict[Any, Dict[Node, Optional[Node]]]] = {} if indexed else None
 
     def __len__(self) -> int:
         """
@@ -65,7 +82,7 @@ class SinglyLinkedList:
         """
         Checks if a value is present in the list.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n), or O(1) on average for an indexed list.
 
         Args:
             value: The value to search for.
@@ -94,6 +111,8 @@ class SinglyLinkedList:
             data: The data for the new node.
         """
         new_node = Node(data)
+        if self._index is not None:
+            self._index_add(new_node, self.tail)
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -112,6 +131,10 @@ class SinglyLinkedList:
             data: The data for the new node.
         """
         new_node = Node(data)
+        if self._index is not None:
+            self._index_add(new_node, None)
+            if self.head is not None:
+                self._index_set_prev(self.head, new_node)
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -124,11 +147,16 @@ class SinglyLinkedList:
         """
         Deletes the first occurrence of a node with the given value.
 
-        Time Complexity: O(n) in the worst case.
+        Time Complexity: O(n) in the worst case, or O(1) on average for an
+        indexed list.
 
         Args:
             value: The data value of the node to delete.
         """
+        if self._index is not None:
+            self._delete_indexed(value)
+            return
+
         if self.is_empty():
             return
 
@@ -169,6 +197,10 @@ class SinglyLinkedList:
             raise ValueError("Cannot insert after a None node.")
             
         new_node = Node(value)
+        if self._index is not None:
+            self._index_add(new_node, node)
+            if node.next is not None:
+                self._index_set_prev(node.next, new_node)
         new_node.next = node.next
         node.next = new_node
         self.size += 1
@@ -181,7 +213,7 @@ class SinglyLinkedList:
         """
         Finds and returns the first node containing the specified value.
 
-        Time Complexity: O(n)
+        Time Complexity: O(n), or O(1) on average for an indexed list.
 
         Args:
             value: The value to search for.
@@ -189,6 +221,10 @@ class SinglyLinkedList:
         Returns:
             Node: The first node containing the value, or None if not found.
         """
+        if self._index is not None:
+            entries = self._index.get(value)
+            return next(iter(entries)) if entries else None
+
         current = self.head
         while current:
             if current.data == value:
@@ -205,11 +241,128 @@ class SinglyLinkedList:
             yield current
             current = current.next
 
+    def _index_add(self, node: Node, prev: Optional[Node]) -> None:
+        """Records a new node and its predecessor in the value index."""
+        self._index.setdefault(node.data, {})[node] = prev
+
+    def _index_set_prev(self, node: Node, prev: Optional[Node]) -> None:
+        """Updates the predecessor recorded for a node already in the index."""
+        self._index[node.data][node] = prev
+
+    def _index_remove(self, node: Node) -> None:
+        """Drops a node from the value index."""
+        entries = self._index[node.data]
+        del entries[node]
+        if not entries:
+            del self._index[node.data]
+
+    def _delete_indexed(self, value: Any) -> None:
+        """Unlinks the indexed node holding `value`, using its recorded predecessor."""
+        entries = self._index.get(value)
+        if not entries:
+            return
+        node, prev = next(iter(entries.items()))
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+        if node.next is not None:
+            self._index_set_prev(node.next, prev)
+        self._index_remove(node)
+        node.next = None
+        self.size -= 1
+
+    def values(self) -> Iterator[Any]:
+        """
+        Yields the stored values from head to tail, without exposing the nodes.
+
+        Time Complexity: O(1) per value.
+        """
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns the stored values as a Python list.
+
+        Time Complexity: O(n)
+        """
+        return list(self.values())
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Appends every value from an iterable in a single pass.
+
+        The new nodes are chained together first and then spliced onto the
+        tail at once.
+
+        Time Complexity: O(k) for k new values.
+
+        Args:
+            iterable: The values to append. A SinglyLinkedList contributes
+                      its values, not its nodes.
+        """
+        if isinstance(iterable, SinglyLinkedList):
+            iterable = iterable.to_list()
+        first = last = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if self._index is not None:
+                self._index_add(new_node, last if last is not None else self.tail)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        if first is None:
+            return
+        if self.is_empty():
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Returns the value at a position, or a new list for a slice.
+
+        Negative indices count from the tail, as with Python lists.
+
+        Time Complexity: O(i) to reach index i; O(n) for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            wanted = range(*index.indices(self.size))
+            result = SinglyLinkedList(indexed=self.indexed)
+            if wanted.step > 0:
+                picked = (data for i, data in enumerate(self.values()) if i in wanted)
+            else:
+                picked = reversed([data for i, data in enumerate(self.values()) if i in wanted])
+            result.extend(picked)
+            return result
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+        if index == self.size - 1:
+            return self.tail.data
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current.data
+
     def __repr__(self) -> str:
         """
         Provides a clear string representation of the list for debugging.
         """
-        nodes = []
-        for node in self:
-            nodes.append(str(node.data))
-        return " -> ".join(nodes)
\ No newline at end of file
+        return " -> ".join(str(data) for data in self.values())
\ No newline at end of file
@@ -0,0 +1,348 @@
+"""
+This module contains the implementation of an Unrolled Linked List, a linked
+list whose nodes each hold a small array of elements instead of just one.
+
+Packing up to `capacity` elements per node means a sequential scan follows one
+pointer per block rather than per element, positional access can skip whole
+blocks at a time, and the per-element overhead of node objects is amortized
+over the block. Nodes are kept at least half full (except possibly the last
+one) by splitting full nodes on insertion and merging or borrowing on deletion.
+
+Because elements do not have nodes of their own, positions (indices) take the
+place of node references: `find` returns an index and `insert_after` accepts one.
+"""
+
+# src\data_structures\fundamentals\linked_lists\unrolled_linked_list.py
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+class Node:
+    """
+    A block of elements in an unrolled linked list.
+
+    Attributes:
+        items: The elements stored in this block, in list order.
+        next: A pointer to the next block in the list. Defaults to None.
+    """
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: Optional[List[Any]] = None) -> None:
+        """
+        Initializes a new block.
+
+        Args:
+            items: The initial elements of the block.
+        """
+        self.items: List[Any] = items if items is not None else []
+        self.next: Optional[Node] = None
+
+class UnrolledLinkedList:
+    """
+    An unrolled linked list supporting the standard linked list operations
+    plus fast indexed access.
+
+    Attributes:
+        head: The first block of the list.
+        tail: The last block of the list.
+        size: The number of elements in the list.
+        capacity: The maximum number of elements per block.
+    """
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initializes an empty unrolled linked list.
+
+        Args:
+            capacity: The maximum number of elements per block.
+
+        Raises:
+            ValueError: If capacity is less than 2.
+        """
+        if capacity < 2:
+            raise ValueError("Block capacity must be at least 2.")
+        self.capacity: int = capacity
+        self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the list.
+
+        Time Complexity: O(1)
+        """
+        return self.size
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks if a value is present in the list.
+
+        Time Complexity: O(n)
+        """
+        return self.find(value) is not None
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def append(self, data: Any) -> None:
+        """
+        Appends a value to the end of the list.
+
+        A full tail block starts a new block instead of being split, so a run
+        of appends produces completely packed blocks.
+
+        Time Complexity: O(1)
+        """
+        if self.tail is None:
+            self.head = self.tail = Node([data])
+        elif len(self.tail.items) < self.capacity:
+            self.tail.items.append(data)
+        else:
+            new_node = Node([data])
+            self.tail.next = new_node
+            self.tail = new_node
+        self.size += 1
+
+    def prepend(self, data: Any) -> None:
+        """
+        Adds a value to the beginning of the list.
+
+        A full head block gives its first half to a new head block, so both
+        stay at least half full.
+
+        Time Complexity: O(capacity)
+        """
+        if self.head is None:
+            self.head = self.tail = Node([data])
+        elif len(self.head.items) < self.capacity:
+            self.head.items.insert(0, data)
+        else:
+            half = self.capacity // 2
+            new_node = Node([data] + self.head.items[:half])
+            del self.head.items[:half]
+            new_node.next = self.head
+            self.head = new_node
+        self.size += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Appends every value from an iterable, filling blocks to capacity.
+
+        Time Complexity: O(k) for k new values.
+        """
+        for data in iterable:
+            self.append(data)
+
+    def _locate(self, index: int) -> Tuple[Optional[Node], Node, int]:
+        """Returns (previous block, block, offset) for a valid non-negative index."""
+        if index >= self.size - len(self.tail.items):
+            # Fast path for the last block, which append keeps hot.
+            node = self.tail
+            return None, node, index - (self.size - len(node.items))
+        prev = None
+        node = self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            prev, node = node, node.next
+        return prev, node, index
+
+    def _normalize(self, index: int) -> int:
+        """Converts a possibly negative index into a valid non-negative one."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Returns the value at a position. Negative indices count from the end.
+
+        Time Complexity: O(n / capacity), skipping whole blocks.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        _, node, offset = self._locate(self._normalize(index))
+        return node.items[offset]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        """
+        Replaces the value at a position.
+
+        Time Complexity: O(n / capacity)
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        _, node, offset = self._locate(self._normalize(index))
+        node.items[offset] = value
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a value so that it ends up at position `index`.
+
+        Indices past the end append, as with list.insert. A full block is
+        split in half before the insertion.
+
+        Time Complexity: O(n / capacity + capacity)
+        """
+        if index < 0:
+            index = max(index + self.size, 0)
+        if index >= self.size:
+            self.append(value)
+            return
+        _, node, offset = self._locate(index)
+        if len(node.items) >= self.capacity:
+            half = len(node.items) // 2
+            new_node = Node(node.items[half:])
+            del node.items[half:]
+            new_node.next = node.next
+            node.next = new_node
+            if node is self.tail:
+                self.tail = new_node
+            if offset > half:
+                node, offset = new_node, offset - half
+        node.items.insert(offset, value)
+        self.size += 1
+
+    def insert_after(self, index: int, value: Any) -> None:
+        """
+        Inserts a value right after the element at position `index`.
+
+        Time Complexity: O(n / capacity + capacity)
+
+        Args:
+            index: The position of an existing element, e.g. as returned by find.
+            value: The value to insert.
+
+        Raises:
+            ValueError: If the index is None.
+            IndexError: If the index is out of range.
+        """
+        if index is None:
+            raise ValueError("Cannot insert after a None position.")
+        self.insert(self._normalize(index) + 1, value)
+
+    def pop(self, index: int = -1) -> Any:
+        """
+        Removes and returns the value at a position (the last one by default).
+
+        A block that drops below half capacity borrows from or merges with
+        the following block.
+
+        Time Complexity: O(n / capacity + capacity)
+
+        Raises:
+            IndexError: If the list is empty or the index is out of range.
+        """
+        prev, node, offset = self._locate(self._normalize(index))
+        value = node.items.pop(offset)
+        self.size -= 1
+        self._rebalance(prev, node)
+        return value
+
+    def _rebalance(self, prev: Optional[Node], node: Node) -> None:
+        """Restores the half-full invariant of a block after a removal."""
+        following = node.next
+        if following is not None and len(node.items) < self.capacity // 2:
+            if len(node.items) + len(following.items) <= self.capacity:
+                # Merge the following block into this one.
+                node.items.extend(following.items)
+                node.next = following.next
+                if following is self.tail:
+                    self.tail = node
+            else:
+                # Borrow enough elements to bring this block back to half full.
+                count = self.capacity // 2 - len(node.items)
+                node.items.extend(following.items[:count])
+                del following.items[:count]
+        elif not node.items:
+            # Only a block without a successor can become empty.
+            if prev is None:
+                prev = self.head
+                if prev is node:
+                    self.head = self.tail = None
+                    return
+                while prev.next is not node:
+                    prev = prev.next
+            prev.next = None
+            self.tail = prev
+
+    def delete(self, value: Any) -> None:
+        """
+        Deletes the first occurrence of a value.
+
+        Time Complexity: O(n)
+
+        Args:
+            value: The value to delete.
+        """
+        prev = None
+        node = self.head
+        while node is not None:
+            for offset, data in enumerate(node.items):
+                if data == value:
+                    del node.items[offset]
+                    self.size -= 1
+                    self._rebalance(prev, node)
+                    return
+            prev, node = node, node.next
+
+    def find(self, value: Any) -> Optional[int]:
+        """
+        Finds the position of the first occurrence of a value.
+
+        Time Complexity: O(n)
+
+        Returns:
+            int: The index of the first match, or None if not found.
+        """
+        base = 0
+        node = self.head
+        while node is not None:
+            for offset, data in enumerate(node.items):
+                if data == value:
+                    return base + offset
+            base += len(node.items)
+            node = node.next
+        return None
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the values, one block at a time.
+        """
+        node = self.head
+        while node is not None:
+            yield from node.items
+            node = node.next
+
+    def values(self) -> Iterator[Any]:
+        """
+        Yields the stored values from head to tail.
+        """
+        return iter(self)
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns the stored values as a Python list.
+
+        Time Complexity: O(n), copying whole blocks at a time.
+        """
+        result = []
+        node = self.head
+        while node is not None:
+            result.extend(node.items)
+            node = node.next
+        return result
+
+    def __repr__(self) -> str:
+        """
+        Provides a clear string representation of the list for debugging.
+        """
+        return " -> ".join(str(data) for data in self)
@@ -0,0 +1,210 @@
+"""
+This module contains bounded queues for asyncio producer/consumer tasks.
+
+AsyncQueue is the asyncio counterpart of BlockingQueue: elements live in a
+bounded RingBuffer, a producer awaiting `put` on a full queue is suspended
+until a consumer makes room (backpressure), and a consumer awaiting `get` on
+an empty queue is suspended until an element arrives. Waiting tasks are
+parked on futures, as in asyncio.Queue, so the `*_nowait` methods can wake
+them without any lock. `put_many` and `get_many` move whole batches per
+wake-up. The queues are not thread-safe; use them from one event loop.
+"""
+
+# src\data_structures\fundamentals\queues\async_queue.py
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Iterable, List
+
+from .ring_buffer import RingBuffer
+
+class AsyncQueue:
+    """
+    A bounded FIFO queue whose put and get can be awaited.
+
+    Attributes:
+        capacity: The maximum number of queued elements.
+    """
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes an empty queue.
+
+        Args:
+            capacity: The maximum number of queued elements.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        self._buffer = RingBuffer(capacity)
+        self.capacity: int = capacity
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of queued elements.
+
+        Time Complexity: O(1)
+        """
+        return len(self._buffer)
+
+    def empty(self) -> bool:
+        """Checks if the queue is empty."""
+        return self._buffer.is_empty()
+
+    def full(self) -> bool:
+        """Checks if the queue is full."""
+        return self._buffer.is_full()
+
+    @staticmethod
+    def _wake(waiters: Deque[asyncio.Future], count: int = 1) -> None:
+        """Wakes up to `count` waiting tasks, skipping cancelled ones."""
+        while count > 0 and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    async def _wait(self, waiters: Deque[asyncio.Future]) -> None:
+        """Parks the current task on a future in `waiters` until it is woken."""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in waiters:
+                waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # We were woken but will not act on it; pass the turn on.
+                self._wake(waiters)
+            raise
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Adds an element at the back without waiting.
+
+        Time Complexity: O(1)
+
+        Raises:
+            asyncio.QueueFull: If the queue is full.
+        """
+        if self._buffer.is_full():
+            raise asyncio.QueueFull
+        self._buffer.append(item)
+        self._wake(self._getters)
+
+    def get_nowait(self) -> Any:
+        """
+        Removes and returns the front element without waiting.
+
+        Time Complexity: O(1)
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty.
+        """
+        if self._buffer.is_empty():
+            raise asyncio.QueueEmpty
+        item = self._buffer.popleft()
+        self._wake(self._putters)
+        return item
+
+    async def put(self, item: Any) -> None:
+        """
+        Adds an element at the back, waiting while the queue is full.
+
+        Time Complexity: O(1), plus the wait.
+        """
+        while self._buffer.is_full():
+            await self._wait(self._putters)
+        self.put_nowait(item)
+
+    async def get(self) -> Any:
+        """
+        Removes and returns the front element, waiting while the queue is empty.
+
+        Time Complexity: O(1), plus the wait.
+        """
+        while self._buffer.is_empty():
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+    async def put_many(self, items: Iterable[Any]) -> None:
+        """
+        Adds elements at the back, waiting for room as often as needed.
+
+        Each time room is available, as many elements as fit are copied in
+        at once and as many waiting consumers are woken.
+
+        Time Complexity: O(k) for k elements, plus the waits.
+        """
+        items = list(items)
+        position = 0
+        while position < len(items):
+            while self._buffer.is_full():
+                await self._wait(self._putters)
+            added = self._buffer.put_many(items[position:position + self._buffer.free()])
+            position += added
+            self._wake(self._getters, added)
+
+    async def get_many(self, max_items: int) -> List[Any]:
+        """
+        Removes and returns up to `max_items` front elements at once.
+
+        Waits only until at least one element is available, then takes
+        whatever is queued, up to `max_items`.
+
+        Time Complexity: O(k) for k returned elements.
+        """
+        while self._buffer.is_empty():
+            await self._wait(self._getters)
+        items = self._buffer.get_many(max_items)
+        self._wake(self._putters, len(items))
+        return items
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return f"{type(self).__name__}({self._buffer.to_list()!r}, capacity={self.capacity})"
+
+class AsyncDeque(AsyncQueue):
+    """
+    A bounded double-ended queue whose operations at both ends can be awaited.
+
+    put and get work at the back and front as in AsyncQueue; put_front and
+    get_back add the other two ends.
+    """
+    def put_front_nowait(self, item: Any) -> None:
+        """
+        Adds an element at the front without waiting.
+
+        Raises:
+            asyncio.QueueFull: If the deque is full.
+        """
+        if self._buffer.is_full():
+            raise asyncio.QueueFull
+        self._buffer.appendleft(item)
+        self._wake(self._getters)
+
+    def get_back_nowait(self) -> Any:
+        """
+        Removes and returns the back element without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If the deque is empty.
+        """
+        if self._buffer.is_empty():
+            raise asyncio.QueueEmpty
+        item = self._buffer.pop()
+        self._wake(self._putters)
+        return item
+
+    async def put_front(self, item: Any) -> None:
+        """Adds an element at the front, waiting while the deque is full."""
+        while self._buffer.is_full():
+            await self._wait(self._putters)
+        self.put_front_nowait(item)
+
+    async def get_back(self) -> Any:
+        """Removes and returns the back element, waiting while the deque is empty."""
+        while self._buffer.is_empty():
+            await self._wait(self._getters)
+        return self.get_back_nowait()
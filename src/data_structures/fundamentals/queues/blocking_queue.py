@@ -0,0 +1,224 @@
+"""
+This module contains bounded blocking queues for producer/consumer threads.
+
+A BlockingQueue stores its elements in a bounded RingBuffer guarded by one
+lock and two condition variables: producers wait on `not_full` while the
+buffer is full and consumers wait on `not_empty` while it is empty. The fixed
+capacity gives backpressure: a fast producer is held up instead of letting
+the queue grow without bound.
+
+Handing elements over one at a time costs a lock round-trip and a wake-up per
+element. `put_many` and `get_many` move whole batches under a single lock
+acquisition, which is what lets a pipeline reach millions of elements per
+second. Timeouts follow the standard library: `queue.Full` and `queue.Empty`
+are raised when a non-blocking or timed operation cannot complete.
+"""
+
+# src\data_structures\fundamentals\queues\blocking_queue.py
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+from .ring_buffer import RingBuffer
+
+class BlockingQueue:
+    """
+    A thread-safe, bounded FIFO queue with blocking put and get.
+
+    Attributes:
+        capacity: The maximum number of queued elements.
+    """
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes an empty queue.
+
+        Args:
+            capacity: The maximum number of queued elements.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        self._buffer = RingBuffer(capacity)
+        self.capacity: int = capacity
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of queued elements, which may change at any time.
+
+        Time Complexity: O(1)
+        """
+        return len(self._buffer)
+
+    def empty(self) -> bool:
+        """Checks if the queue is currently empty."""
+        return self._buffer.is_empty()
+
+    def full(self) -> bool:
+        """Checks if the queue is currently full."""
+        return self._buffer.is_full()
+
+    @staticmethod
+    def _wait(condition: threading.Condition, blocked: Callable[[], bool],
+              block: bool, timeout: Optional[float]) -> bool:
+        """Waits, with the lock held, while `blocked()` is true; returns False on timeout."""
+        if not blocked():
+            return True
+        if not block:
+            return False
+        if timeout is None:
+            while blocked():
+                condition.wait()
+            return True
+        deadline = time.monotonic() + timeout
+        while blocked():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def _put(self, item: Any, front: bool, block: bool, timeout: Optional[float]) -> None:
+        """Adds an element at either end, waiting for room."""
+        buffer = self._buffer
+        with self._lock:
+            if buffer.is_full() and not self._wait(self._not_full, buffer.is_full, block, timeout):
+                raise queue.Full
+            if front:
+                buffer.appendleft(item)
+            else:
+                buffer.append(item)
+            self._not_empty.notify()
+
+    def _get(self, back: bool, block: bool, timeout: Optional[float]) -> Any:
+        """Removes an element from either end, waiting for one to arrive."""
+        buffer = self._buffer
+        with self._lock:
+            if not len(buffer) and not self._wait(self._not_empty, buffer.is_empty, block, timeout):
+                raise queue.Empty
+            item = buffer.pop() if back else buffer.popleft()
+            self._not_full.notify()
+            return item
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds an element at the back, waiting while the queue is full.
+
+        Time Complexity: O(1)
+
+        Args:
+            item: The element to add.
+            block: If False, fail at once instead of waiting.
+            timeout: The longest time to wait in seconds, or None to wait forever.
+
+        Raises:
+            queue.Full: If no room became available.
+        """
+        self._put(item, False, block, timeout)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes and returns the front element, waiting while the queue is empty.
+
+        Time Complexity: O(1)
+
+        Args:
+            block: If False, fail at once instead of waiting.
+            timeout: The longest time to wait in seconds, or None to wait forever.
+
+        Raises:
+            queue.Empty: If no element arrived.
+        """
+        return self._get(False, block, timeout)
+
+    def put_many(self, items: Iterable[Any], timeout: Optional[float] = None) -> int:
+        """
+        Adds elements at the back, waiting for room as often as needed.
+
+        Each time room is available, as many elements as fit are copied in
+        under one lock acquisition and one waiting consumer is woken per element.
+
+        Time Complexity: O(k) for k elements, plus the waits.
+
+        Args:
+            items: The elements to add, in order.
+            timeout: The longest total time to wait in seconds, or None to wait forever.
+
+        Returns:
+            int: The number of elements added; fewer than given only on timeout.
+        """
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        position = 0
+        while position < len(items):
+            with self._lock:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._wait(self._not_full, self._buffer.is_full, True, remaining):
+                    break
+                chunk = items[position:position + self._buffer.free()]
+                added = self._buffer.put_many(chunk)
+                position += added
+                self._not_empty.notify(added)
+        return position
+
+    def get_many(self, max_items: int, block: bool = True, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Removes and returns up to `max_items` front elements at once.
+
+        Waits only until at least one element is available, then takes
+        whatever is queued, up to `max_items`, under one lock acquisition.
+
+        Time Complexity: O(k) for k returned elements.
+
+        Args:
+            max_items: The largest number of elements to return.
+            block: If False, fail at once instead of waiting.
+            timeout: The longest time to wait in seconds, or None to wait forever.
+
+        Raises:
+            queue.Empty: If no element arrived.
+        """
+        with self._lock:
+            if not self._wait(self._not_empty, self._buffer.is_empty, block, timeout):
+                raise queue.Empty
+            items = self._buffer.get_many(max_items)
+            self._not_full.notify(len(items))
+            return items
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        with self._lock:
+            return f"{type(self).__name__}({self._buffer.to_list()!r}, capacity={self.capacity})"
+
+class BlockingDeque(BlockingQueue):
+    """
+    A thread-safe, bounded double-ended queue with blocking operations at both ends.
+
+    put and get work at the back and front as in BlockingQueue; put_front and
+    get_back add the other two ends.
+    """
+    def put_front(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds an element at the front, waiting while the deque is full.
+
+        Time Complexity: O(1)
+
+        Raises:
+            queue.Full: If no room became available.
+        """
+        self._put(item, True, block, timeout)
+
+    def get_back(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes and returns the back element, waiting while the deque is empty.
+
+        Time Complexity: O(1)
+
+        Raises:
+            queue.Empty: If no element arrived.
+        """
+        return self._get(True, block, timeout)
@@ -0,0 +1,314 @@
+"""
+This module contains the implementation of a Ring Buffer, an array-backed
+double-ended queue.
+
+The elements live in a fixed Python list used as a circle: `head` is the slot
+of the front element and the others follow it, wrapping around to slot 0 at
+the end of the list. Pushing or popping at either end only moves `head` or
+changes the element count, so all four operations are O(1) without ever
+shifting elements, unlike list.insert(0, ...) or list.pop(0).
+
+A ring buffer is either bounded, in which case pushing onto a full buffer is
+an error and memory use is fixed up front, or unbounded, in which case the
+list doubles in size when it fills up. Batches of elements are copied in and
+out with at most two slice assignments each, which is much cheaper than
+moving them one at a time. The buffer is the storage behind the blocking and
+asyncio queues of this package, and used with append and popleft it is a
+bounded FIFO queue in its own right.
+"""
+
+# src\data_structures\fundamentals\queues\ring_buffer.py
+
+from typing import Any, Iterable, Iterator, List, Optional
+
+class RingBuffer:
+    """
+    A double-ended queue stored in a circular array.
+
+    Attributes:
+        capacity: The maximum number of elements, or None if unbounded.
+    """
+    def __init__(self, capacity: Optional[int] = None, iterable: Optional[Iterable[Any]] = None) -> None:
+        """
+        Initializes a ring buffer, optionally filled from an iterable.
+
+        Args:
+            capacity: The maximum number of elements, or None to grow as needed.
+            iterable: Initial elements, from front to back.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+            OverflowError: If the iterable does not fit in the capacity.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Ring buffer capacity must be at least 1.")
+        self.capacity: Optional[int] = capacity
+        self._buffer: List[Any] = [None] * (capacity if capacity is not None else 16)
+        self._head: int = 0
+        self._size: int = 0
+        if iterable is not None:
+            items = list(iterable)
+            if self.put_many(items) < len(items):
+                raise OverflowError("ring buffer is full")
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements.
+
+        Time Complexity: O(1)
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the buffer is empty.
+
+        Returns:
+            bool: True if the buffer is empty, False otherwise.
+        """
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if a bounded buffer has reached its capacity.
+
+        Returns:
+            bool: True if no more elements fit, False otherwise (always False
+                  for an unbounded buffer).
+        """
+        return self._size == self.capacity
+
+    def free(self) -> Optional[int]:
+        """Returns how many more elements fit, or None if the buffer is unbounded."""
+        return None if self.capacity is None else self.capacity - self._size
+
+    def _grow(self, needed: int) -> None:
+        """Unrolls the elements into a larger list with room for `needed` in total."""
+        length = len(self._buffer)
+        while length < needed:
+            length *= 2
+        items = self._ordered()
+        self._buffer = items + [None] * (length - len(items))
+        self._head = 0
+
+    def _ensure_room(self, count: int) -> None:
+        """Makes room for `count` more elements, or raises if the buffer is bounded and full."""
+        if self._size + count <= len(self._buffer):
+            return
+        if self.capacity is not None:
+            raise OverflowError("ring buffer is full")
+        self._grow(self._size + count)
+
+    def append(self, item: Any) -> None:
+        """
+        Adds an element at the back.
+
+        Time Complexity: O(1), amortized for an unbounded buffer.
+
+        Raises:
+            OverflowError: If a bounded buffer is full.
+        """
+        buffer = self._buffer
+        size = self._size
+        if size == len(buffer):
+            self._ensure_room(1)
+            buffer = self._buffer
+        index = self._head + size
+        if index >= len(buffer):
+            index -= len(buffer)
+        buffer[index] = item
+        self._size = size + 1
+
+    def appendleft(self, item: Any) -> None:
+        """
+        Adds an element at the front.
+
+        Time Complexity: O(1), amortized for an unbounded buffer.
+
+        Raises:
+            OverflowError: If a bounded buffer is full.
+        """
+        if self._size == len(self._buffer):
+            self._ensure_room(1)
+        head = self._head - 1
+        if head < 0:
+            head += len(self._buffer)
+        self._buffer[head] = item
+        self._head = head
+        self._size += 1
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the element at the back.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the buffer is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        buffer = self._buffer
+        index = self._head + self._size - 1
+        if index >= len(buffer):
+            index -= len(buffer)
+        item = buffer[index]
+        buffer[index] = None
+        self._size -= 1
+        return item
+
+    def popleft(self) -> Any:
+        """
+        Removes and returns the element at the front.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the buffer is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        buffer = self._buffer
+        head = self._head
+        item = buffer[head]
+        buffer[head] = None
+        head += 1
+        self._head = head if head < len(buffer) else 0
+        self._size -= 1
+        return item
+
+    def put_many(self, items: Iterable[Any]) -> int:
+        """
+        Adds elements at the back, as many as fit.
+
+        The elements are copied with at most two slice assignments.
+
+        Time Complexity: O(k) for k elements.
+
+        Args:
+            items: The elements to add, from front to back.
+
+        Returns:
+            int: The number of elements added; fewer than given only if a
+                 bounded buffer filled up.
+        """
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        count = len(items)
+        if self.capacity is not None:
+            count = min(count, self.capacity - self._size)
+        else:
+            self._ensure_room(count)
+        if count <= 0:
+            return 0
+        buffer = self._buffer
+        length = len(buffer)
+        start = self._head + self._size
+        if start >= length:
+            start -= length
+        first = min(count, length - start)
+        buffer[start:start + first] = items[:first]
+        if first < count:
+            buffer[:count - first] = items[first:count]
+        self._size += count
+        return count
+
+    def get_many(self, max_items: Optional[int] = None) -> List[Any]:
+        """
+        Removes and returns up to `max_items` elements from the front.
+
+        The elements are copied with at most two slices.
+
+        Time Complexity: O(k) for k returned elements.
+
+        Args:
+            max_items: The largest number of elements to return, or None for all.
+
+        Returns:
+            list: The removed elements, from front to back; empty if the buffer is.
+        """
+        count = self._size if max_items is None else max(0, min(max_items, self._size))
+        if not count:
+            return []
+        buffer = self._buffer
+        head = self._head
+        first = min(count, len(buffer) - head)
+        items = buffer[head:head + first]
+        buffer[head:head + first] = [None] * first
+        if first < count:
+            items += buffer[:count - first]
+            buffer[:count - first] = [None] * (count - first)
+        head += count
+        self._head = head if head < len(buffer) else head - len(buffer)
+        self._size -= count
+        return items
+
+    def peek(self) -> Any:
+        """
+        Returns the front element without removing it.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        """
+        return self[0]
+
+    def peek_back(self) -> Any:
+        """
+        Returns the back element without removing it.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        """
+        return self[-1]
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Returns the element at a position from the front.
+
+        Negative indices count from the back.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        index += self._head
+        if index >= len(self._buffer):
+            index -= len(self._buffer)
+        return self._buffer[index]
+
+    def clear(self) -> None:
+        """Removes every element."""
+        self.get_many()
+        self._head = 0
+
+    def _ordered(self) -> List[Any]:
+        """Returns the elements as a list, from front to back."""
+        head, end = self._head, self._head + self._size
+        if end <= len(self._buffer):
+            return self._buffer[head:end]
+        return self._buffer[head:] + self._buffer[:end - len(self._buffer)]
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over a snapshot of the elements, from front to back.
+        """
+        return iter(self._ordered())
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns the elements as a Python list, from front to back.
+
+        Time Complexity: O(n)
+        """
+        return self._ordered()
+
+    def __repr__(self) -> str:
+        """
+        Provides a clear string representation of the buffer for debugging.
+        """
+        return f"RingBuffer({self._ordered()!r}, capacity={self.capacity})"
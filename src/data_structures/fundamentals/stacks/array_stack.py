@@ -0,0 +1,376 @@
+"""
+This module contains the implementation of an Array Stack, a LIFO stack
+stored in one contiguous, growable buffer.
+
+Using a linked list as a stack allocates a node object for every push and
+frees it on every pop. An array stack instead keeps its elements in a buffer
+with spare room at the end: a push writes into the next free slot and a pop
+just moves the top index back, so neither allocates anything once the buffer
+is large enough. When the buffer fills up it doubles, which makes push O(1)
+amortized. When the stack falls to a quarter of the buffer, the buffer is
+halved; the gap between the two thresholds keeps a stack that hovers around
+one size from resizing back and forth, and the buffer never goes below its
+initial capacity, so that memory is reused from one burst to the next.
+
+The buffer is a Python list by default. Given a typecode, such as 'q' for
+64-bit integers or 'd' for doubles, it is a typed `array.array` instead, which
+stores raw numbers rather than pointers to boxed objects and takes a fraction
+of the memory. `push_many` and `pop_many` move whole batches with one slice
+copy each. MinMaxStack extends the stack with O(1) `min` and `max` queries.
+"""
+
+# src\data_structures\fundamentals\stacks\array_stack.py
+
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional
+
+class ArrayStack:
+    """
+    A LIFO stack backed by a growable list or typed array.
+
+    Attributes:
+        typecode: The `array` typecode of the buffer, or None for a list buffer.
+    """
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, typecode: Optional[str] = None,
+                 capacity: int = 16, shrink: bool = True) -> None:
+        """
+        Initializes a stack, optionally filled from an iterable.
+
+        Args:
+            iterable: Initial elements, from bottom to top.
+            typecode: An `array` typecode for a typed buffer, or None for a list.
+            capacity: The initial buffer size; the buffer never shrinks below it.
+            shrink: Whether to halve the buffer when the stack falls to a quarter of it.
+
+        Raises:
+            ValueError: If capacity is less than 1 or the typecode is invalid.
+        """
+        if capacity < 1:
+            raise ValueError("Stack capacity must be at least 1.")
+        self.typecode: Optional[str] = typecode
+        self._min_capacity: int = capacity
+        self._shrink: bool = shrink
+        self._buffer = self._allocate(capacity)
+        self._size: int = 0
+        if iterable is not None:
+            self.push_many(iterable)
+
+    def _allocate(self, length: int) -> Any:
+        """Returns an empty buffer of the given length."""
+        if self.typecode is None:
+            return [None] * length
+        return array(self.typecode, [0]) * length
+
+    def _resize(self, length: int) -> None:
+        """Moves the elements into a new buffer of the given length."""
+        buffer = self._allocate(length)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements.
+
+        Time Complexity: O(1)
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return self._size == 0
+
+    @property
+    def capacity(self) -> int:
+        """The current buffer size."""
+        return len(self._buffer)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grows the buffer to hold at least `capacity` elements without resizing.
+
+        Time Complexity: O(n)
+        """
+        if capacity > len(self._buffer):
+            self._resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Shrinks the buffer to the number of elements, but not below the initial capacity.
+
+        Time Complexity: O(n)
+        """
+        length = max(self._size, self._min_capacity)
+        if length < len(self._buffer):
+            self._resize(length)
+
+    def _maybe_shrink(self) -> None:
+        """Halves the buffer, repeatedly if needed, while the stack fills at most a quarter of it."""
+        length = len(self._buffer)
+        if not self._shrink or self._size > length // 4 or length <= self._min_capacity:
+            return
+        while length > self._min_capacity and self._size <= length // 4:
+            length //= 2
+        self._resize(max(length, self._min_capacity))
+
+    def push(self, item: Any) -> None:
+        """
+        Adds an element on top.
+
+        Time Complexity: O(1) amortized.
+
+        Raises:
+            TypeError: If the element's type does not fit a typed buffer.
+            OverflowError: If a number is out of range for a typed buffer,
+                           e.g. 300 in a 'B' stack.
+        """
+        size = self._size
+        if size == len(self._buffer):
+            self._resize(2 * size)
+        self._buffer[size] = item
+        self._size = size + 1
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the top element.
+
+        Time Complexity: O(1) amortized.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        size = self._size - 1
+        if size < 0:
+            raise IndexError("pop from an empty stack")
+        buffer = self._buffer
+        item = buffer[size]
+        if self.typecode is None:
+            buffer[size] = None  # Release the reference.
+        self._size = size
+        if size <= len(buffer) >> 2:
+            self._maybe_shrink()
+        return item
+
+    def peek(self) -> Any:
+        """
+        Returns the top element without removing it.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self._size:
+            raise IndexError("peek from an empty stack")
+        return self._buffer[self._size - 1]
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """
+        Pushes elements in order, so the last one ends up on top.
+
+        The buffer grows at most once and the elements are copied in with
+        one slice assignment.
+
+        Time Complexity: O(k) amortized for k elements.
+
+        Raises:
+            TypeError: If an element's type does not fit a typed buffer.
+            OverflowError: If a number is out of range for a typed buffer;
+                           no element is pushed then.
+        """
+        if self.typecode is not None:
+            if not isinstance(items, array) or items.typecode != self.typecode:
+                items = array(self.typecode, items)
+        elif not isinstance(items, list):
+            items = list(items)
+        start, end = self._size, self._size + len(items)
+        if end > len(self._buffer):
+            length = len(self._buffer)
+            while length < end:
+                length *= 2
+            self._resize(length)
+        self._buffer[start:end] = items
+        self._size = end
+
+    def pop_many(self, count: int) -> List[Any]:
+        """
+        Pops `count` elements at once.
+
+        Time Complexity: O(k) for k elements.
+
+        Returns:
+            list: The popped elements in the order pop would return them,
+                  top first.
+
+        Raises:
+            ValueError: If count is negative.
+            IndexError: If the stack has fewer than `count` elements.
+        """
+        if count < 0:
+            raise ValueError("Cannot pop a negative number of elements.")
+        if count > self._size:
+            raise IndexError("pop_many from a stack with too few elements")
+        start, end = self._size - count, self._size
+        buffer = self._buffer
+        if self.typecode is None:
+            items = buffer[start:end]
+            buffer[start:end] = [None] * count
+        else:
+            items = buffer[start:end].tolist()
+        items.reverse()
+        self._size = start
+        self._maybe_shrink()
+        return items
+
+    def clear(self) -> None:
+        """Removes every element and returns the buffer to its initial capacity."""
+        self._buffer = self._allocate(self._min_capacity)
+        self._size = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over a snapshot of the elements, from bottom to top.
+        """
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns the elements as a Python list, from bottom to top.
+
+        Time Complexity: O(n)
+        """
+        items = self._buffer[:self._size]
+        return items if self.typecode is None else items.tolist()
+
+    def __repr__(self) -> str:
+        """
+        Provides a clear string representation of the stack for debugging.
+        """
+        typed = "" if self.typecode is None else f", typecode={self.typecode!r}"
+        return f"{type(self).__name__}({self.to_list()!r}{typed})"
+
+class MinMaxStack(ArrayStack):
+    """
+    An array stack that also reports its smallest and largest element in O(1).
+
+    Two auxiliary stacks record the running minimum and maximum. A new
+    element is pushed onto the minimum stack only if it is no larger than the
+    current minimum (and likewise for the maximum), and popped from it when
+    it leaves the main stack, so for typical data they stay much shorter than
+    the stack itself.
+    """
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, typecode: Optional[str] = None,
+                 capacity: int = 16, shrink: bool = True) -> None:
+        """
+        Initializes a stack, optionally filled from an iterable.
+
+        Args:
+            iterable: Initial elements, from bottom to top.
+            typecode: An `array` typecode for typed buffers, or None for lists.
+            capacity: The initial buffer size; the buffer never shrinks below it.
+            shrink: Whether to halve a buffer when its stack falls to a quarter of it.
+        """
+        self._mins = ArrayStack(typecode=typecode, capacity=capacity, shrink=shrink)
+        self._maxes = ArrayStack(typecode=typecode, capacity=capacity, shrink=shrink)
+        super().__init__(iterable, typecode, capacity, shrink)
+
+    def _track(self, item: Any) -> None:
+        """Records a pushed element in the minimum and maximum stacks."""
+        mins, maxes = self._mins, self._maxes
+        if not mins._size or not mins._buffer[mins._size - 1] < item:
+            mins.push(item)
+        if not maxes._size or not item < maxes._buffer[maxes._size - 1]:
+            maxes.push(item)
+
+    def _untrack(self, item: Any) -> None:
+        """Removes a popped element from the minimum and maximum stacks."""
+        mins, maxes = self._mins, self._maxes
+        # The popped element is never below the minimum, so "not above" means equal.
+        if not mins._buffer[mins._size - 1] < item:
+            mins.pop()
+        if not item < maxes._buffer[maxes._size - 1]:
+            maxes.pop()
+
+    def push(self, item: Any) -> None:
+        """
+        Adds an element on top.
+
+        Time Complexity: O(1) amortized.
+        """
+        super().push(item)
+        self._track(item)
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the top element.
+
+        Time Complexity: O(1) amortized.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        item = super().pop()
+        self._untrack(item)
+        return item
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """
+        Pushes elements in order, so the last one ends up on top.
+
+        Time Complexity: O(k) amortized for k elements.
+        """
+        items = list(items)
+        super().push_many(items)
+        for item in items:
+            self._track(item)
+
+    def pop_many(self, count: int) -> List[Any]:
+        """
+        Pops `count` elements at once, top first.
+
+        Time Complexity: O(k) for k elements.
+
+        Raises:
+            ValueError: If count is negative.
+            IndexError: If the stack has fewer than `count` elements.
+        """
+        items = super().pop_many(count)
+        for item in items:
+            self._untrack(item)
+        return items
+
+    def min(self) -> Any:
+        """
+        Returns the smallest element.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self._size:
+            raise IndexError("min of an empty stack")
+        return self._mins.peek()
+
+    def max(self) -> Any:
+        """
+        Returns the largest element.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self._size:
+            raise IndexError("max of an empty stack")
+        return self._maxes.peek()
+
+    def clear(self) -> None:
+        """Removes every element and returns the buffers to their initial capacity."""
+        super().clear()
+        self._mins.clear()
+        self._maxes.clear()
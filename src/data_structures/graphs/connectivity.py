@@ -0,0 +1,222 @@
+"""
+This module contains connectivity algorithms for CSRGraph.
+
+Connected components and Kruskal's minimum spanning tree are built on the
+Union-Find structure. They treat every edge as undirected, so on a directed
+graph they find the weakly connected components and a spanning forest of
+the underlying undirected graph.
+
+Strongly connected components, the maximal sets of vertices that can all
+reach each other along directed edges, are found with Tarjan's or
+Kosaraju's algorithm. Both are depth-first searches, written here with an
+explicit stack of (vertex, neighbour iterator) pairs instead of recursion, so
+a chain of millions of vertices does not hit Python's recursion limit.
+Collapsing every strongly connected component to a single vertex gives the
+condensation, which is always a DAG.
+"""
+from typing import List, Set, Tuple
+
+from .csr_graph import CSRGraph, GraphBuilder
+from .union_find import UnionFind
+
+def connected_components(graph: CSRGraph) -> Tuple[int, List[int]]:
+    """
+    Labels every vertex with the number of its (weakly) connected component.
+
+    All the edges are merged in one UnionFind.union_many call over the
+    graph's edge arrays.
+
+    Time Complexity: O((n + m) alpha(n))
+
+    Returns:
+        tuple: The number of components, and a list giving each vertex's
+               component; components are numbered 0, 1, ... in order of
+               their smallest vertex.
+    """
+    forest = UnionFind(graph.num_vertices)
+    sources, targets, _ = graph.edge_arrays()
+    forest.union_many(sources, targets)
+    numbers = {}
+    labels = []
+    for v in range(graph.num_vertices):
+        root = forest.find(v)
+        label = numbers.get(root)
+        if label is None:
+            label = numbers[root] = len(numbers)
+        labels.append(label)
+    return len(numbers), labels
+
+def kruskal_mst(graph: CSRGraph) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """
+    Finds a minimum spanning forest with Kruskal's algorithm.
+
+    Edges are taken in ascending order of weight and kept whenever they join
+    two different components, which a UnionFind tells in near-constant time.
+    The search stops early once the forest has become a single tree. An
+    unweighted graph counts every edge as 1, giving some spanning forest.
+
+    Time Complexity: O(m log m) for the sort, plus O(m alpha(n)).
+
+    Returns:
+        tuple: The total weight and the chosen (u, v, weight) edges, lightest first.
+    """
+    n = graph.num_vertices
+    candidates = []
+    for edge in graph.edges():
+        u, v = edge[0], edge[1]
+        # An undirected graph stores each edge twice; one copy is enough.
+        if u == v or (not graph.directed and u > v):
+            continue
+        candidates.append((edge[2] if graph.weighted else 1.0, u, v))
+    candidates.sort()
+    forest = UnionFind(n)
+    chosen: List[Tuple[int, int, float]] = []
+    total = 0.0
+    for weight, u, v in candidates:
+        if forest.count == 1:
+            break  # A spanning tree is complete.
+        if forest.union(u, v):
+            chosen.append((u, v, weight))
+            total += weight
+    return total, chosen
+
+def tarjan_scc(graph: CSRGraph) -> Tuple[int, List[int]]:
+    """
+    Labels every vertex with its strongly connected component, using
+    Tarjan's algorithm in a single depth-first pass.
+
+    Each vertex gets a discovery index and a low-link, the smallest index
+    reachable through its subtree and one back edge to a vertex still on
+    the component stack. A vertex whose low-link equals its own index is the
+    root of a component, which is then popped off the stack whole.
+
+    Time Complexity: O(n + m)
+
+    Returns:
+        tuple: The number of components, and a list giving each vertex's
+               component. Components are numbered in topological order:
+               every edge between two components goes from a lower number
+               to a higher one.
+    """
+    n = graph.num_vertices
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    labels = [-1] * n
+    stack: List[int] = []
+    counter = components = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(graph.neighbors(root)))]
+        while work:
+            v, neighbors = work[-1]
+            for w in neighbors:
+                if index[w] == -1:
+                    # Descend into w; v's iterator resumes when w is done.
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, iter(graph.neighbors(w))))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        labels[w] = components
+                        if w == v:
+                            break
+                    components += 1
+    # Tarjan finds sink components first; number them in topological order.
+    last = components - 1
+    return components, [last - label for label in labels]
+
+def kosaraju_scc(graph: CSRGraph) -> Tuple[int, List[int]]:
+    """
+    Labels every vertex with its strongly connected component, using
+    Kosaraju's algorithm.
+
+    A first depth-first pass records the order in which vertices finish.
+    A second pass over the reversed graph, starting from vertices in
+    decreasing finish order, then collects one component per search tree.
+    It costs an extra pass and the transposed graph compared with Tarjan's
+    algorithm, but each pass is simpler.
+
+    Time Complexity: O(n + m)
+
+    Returns:
+        tuple: The number of components and each vertex's component,
+               numbered in topological order as in tarjan_scc.
+    """
+    n = graph.num_vertices
+    seen = bytearray(n)
+    finished: List[int] = []
+    for root in range(n):
+        if seen[root]:
+            continue
+        seen[root] = 1
+        work = [(root, iter(graph.neighbors(root)))]
+        while work:
+            v, neighbors = work[-1]
+            for w in neighbors:
+                if not seen[w]:
+                    seen[w] = 1
+                    work.append((w, iter(graph.neighbors(w))))
+                    break
+            else:
+                work.pop()
+                finished.append(v)
+
+    reverse = graph.transpose()
+    labels = [-1] * n
+    components = 0
+    for root in reversed(finished):
+        if labels[root] != -1:
+            continue
+        labels[root] = components
+        stack = [root]
+        while stack:
+            v = stack.pop()
+            for w in reverse.neighbors(v):
+                if labels[w] == -1:
+                    labels[w] = components
+                    stack.append(w)
+        components += 1
+    return components, labels
+
+def condensation(graph: CSRGraph) -> Tuple[CSRGraph, List[int]]:
+    """
+    Collapses every strongly connected component into a single vertex.
+
+    Time Complexity: O(n + m)
+
+    Returns:
+        tuple: The condensation, a DAG with one vertex per component and one
+               edge per pair of components joined by at least one edge, and
+               each original vertex's component as numbered by tarjan_scc,
+               which is a topological order of the DAG.
+    """
+    count, labels = tarjan_scc(graph)
+    builder = GraphBuilder(count)
+    seen: Set[Tuple[int, int]] = set()
+    for u in range(graph.num_vertices):
+        a = labels[u]
+        for v in graph.neighbors(u):
+            b = labels[v]
+            if a != b and (a, b) not in seen:
+                seen.add((a, b))
+                builder.add_edge(a, b)
+    return builder.freeze(graph.uses_numpy), labels
@@ -0,0 +1,423 @@
+"""
+This module contains a graph stored in Compressed Sparse Row (CSR) form, and
+the builder that produces it.
+
+A dict mapping every vertex to a set or list of neighbours costs a hash table
+entry, a container object and a boxed integer per edge, which runs to around a
+hundred bytes per edge and scatters each vertex's neighbours across the heap.
+CSR packs the whole graph into two flat integer arrays instead:
+
+    neighbors  the targets of all edges, grouped by source vertex
+    offsets    offsets[v] .. offsets[v + 1] is the slice of `neighbors`
+               holding the targets of v's edges (n + 1 entries)
+
+and, for a weighted graph, a third array `weights` parallel to `neighbors`.
+That is 4 to 8 bytes per edge for the targets, the degree of a vertex is one
+subtraction, and a vertex's neighbours are a contiguous slice that can be
+returned as a zero-copy view. Within each row the targets are sorted, so an
+edge lookup is a binary search.
+
+The price is that a CSR graph is immutable. Edges are collected by a
+GraphBuilder, which stores them as flat source/target arrays rather than as
+per-vertex lists, and `freeze` buckets them into rows with a counting sort
+in O(n + m), then sorts each row. The arrays are `array.array`s, or NumPy
+arrays if NumPy is installed, in which case freezing runs in NumPy too.
+Vertices are the integers 0 .. n - 1.
+"""
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+def _index_typecode(num_vertices: int) -> str:
+    """Returns the smallest array typecode able to hold every vertex id."""
+    return "i" if num_vertices < 2 ** 31 else "q"
+
+def _compress(num_vertices: int, sources: Sequence[int], targets: Sequence[int],
+              weights: Optional[Sequence[float]], use_numpy: bool) -> Tuple[Any, Any, Any]:
+    """
+    Sorts an edge list into CSR rows.
+
+    Returns:
+        tuple: The offsets, neighbors and weights (or None) arrays.
+    """
+    if use_numpy:
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        # Order by source, then by target within a row.
+        order = np.lexsort((targets, sources))
+        offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_vertices), out=offsets[1:])
+        dtype = np.int32 if _index_typecode(num_vertices) == "i" else np.int64
+        neighbors = targets[order].astype(dtype)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)[order]
+        return offsets, neighbors, weights
+
+    counts = [0] * (num_vertices + 1)
+    for source in sources:
+        counts[source + 1] += 1
+    for v in range(num_vertices):
+        counts[v + 1] += counts[v]
+    offsets = array("q", counts)
+    # Place every edge in its row, then sort each row by target.
+    position = counts[:-1]
+    neighbors = array(_index_typecode(num_vertices), [0]) * len(targets)
+    new_weights = array("d", [0.0]) * len(targets) if weights is not None else None
+    for i, source in enumerate(sources):
+        slot = position[source]
+        neighbors[slot] = targets[i]
+        if new_weights is not None:
+            new_weights[slot] = weights[i]
+        position[source] = slot + 1
+    for v in range(num_vertices):
+        start, end = offsets[v], offsets[v + 1]
+        if end - start < 2:
+            continue
+        if new_weights is None:
+            neighbors[start:end] = array(neighbors.typecode, sorted(neighbors[start:end]))
+        else:
+            row = sorted(zip(neighbors[start:end], new_weights[start:end]))
+            neighbors[start:end] = array(neighbors.typecode, [target for target, _ in row])
+            new_weights[start:end] = array("d", [weight for _, weight in row])
+    return offsets, neighbors, new_weights
+
+class CSRGraph:
+    """
+    An immutable directed graph in Compressed Sparse Row form.
+
+    An undirected graph is stored with each edge in both directions.
+
+    Attributes:
+        directed: Whether the graph was built as directed.
+        uses_numpy: Whether the arrays are NumPy arrays.
+    """
+    def __init__(self, offsets: Any, neighbors: Any, weights: Any = None, directed: bool = True) -> None:
+        """
+        Initializes a graph from ready-made CSR arrays.
+
+        Most callers use GraphBuilder.freeze or `from_edges` instead.
+
+        Args:
+            offsets: n + 1 non-decreasing row offsets into `neighbors`.
+            neighbors: The edge targets, grouped by source and sorted within each row.
+            weights: Edge weights parallel to `neighbors`, or None.
+            directed: Whether the graph is directed.
+
+        Raises:
+            ValueError: If the arrays do not describe a graph.
+        """
+        if len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != len(neighbors):
+            raise ValueError("Offsets must run from 0 to the number of edges.")
+        if weights is not None and len(weights) != len(neighbors):
+            raise ValueError("There must be exactly one weight per edge.")
+        self.directed: bool = directed
+        self.uses_numpy: bool = np is not None and isinstance(neighbors, np.ndarray)
+        self._offsets = offsets
+        self._neighbors = neighbors
+        self._weights = weights
+        # Slicing a memoryview, like slicing an ndarray, returns a view, not a
+        # copy. The views are read-only so callers cannot unsort a row.
+        if self.uses_numpy:
+            for arr in (offsets, neighbors, weights):
+                if arr is not None:
+                    arr.flags.writeable = False
+            self._neighbor_view = neighbors
+            self._weight_view = weights
+        else:
+            self._neighbor_view = memoryview(neighbors).toreadonly()
+            self._weight_view = None if weights is None else memoryview(weights).toreadonly()
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence[Any]], num_vertices: int = 0, directed: bool = True,
+                   weighted: bool = False, use_numpy: Optional[bool] = None) -> 'CSRGraph':
+        """
+        Builds a graph from (u, v) or, if weighted, (u, v, weight) tuples.
+
+        Time Complexity: O(n + m log d) for m edges and maximum degree d;
+        O(n + m log m) with NumPy.
+        """
+        builder = GraphBuilder(num_vertices, directed=directed, weighted=weighted)
+        builder.add_edges(edges)
+        return builder.freeze(use_numpy)
+
+    @property
+    def num_vertices(self) -> int:
+        """The number of vertices."""
+        return len(self._offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """The number of stored (directed) edges."""
+        return len(self._neighbors)
+
+    @property
+    def weighted(self) -> bool:
+        """Whether the edges carry weights."""
+        return self._weights is not None
+
+    @property
+    def nbytes(self) -> int:
+        """The memory taken by the offsets, neighbors and weights arrays, in bytes."""
+        arrays = [self._offsets, self._neighbors] + ([self._weights] if self.weighted else [])
+        return sum(memoryview(arr).nbytes for arr in arrays)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices.
+
+        Time Complexity: O(1)
+        """
+        return len(self._offsets) - 1
+
+    def _row(self, v: int) -> Tuple[int, int]:
+        """Returns the bounds of a vertex's slice of `neighbors`."""
+        if not 0 <= v < len(self._offsets) - 1:
+            raise IndexError("vertex out of range")
+        return int(self._offsets[v]), int(self._offsets[v + 1])
+
+    def degree(self, v: int) -> int:
+        """
+        Returns the number of edges leaving a vertex.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the vertex is out of range.
+        """
+        start, end = self._row(v)
+        return end - start
+
+    def neighbors(self, v: int) -> Any:
+        """
+        Returns the targets of a vertex's edges, in ascending order.
+
+        The result is a read-only view into the graph's storage (a memoryview,
+        or an ndarray with NumPy), so no elements are copied.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the vertex is out of range.
+        """
+        start, end = self._row(v)
+        return self._neighbor_view[start:end]
+
+    def weights(self, v: int) -> Any:
+        """
+        Returns the weights of a vertex's edges, parallel to `neighbors(v)`.
+
+        Time Complexity: O(1)
+
+        Raises:
+            ValueError: If the graph is unweighted.
+            IndexError: If the vertex is out of range.
+        """
+        if self._weights is None:
+            raise ValueError("The graph is unweighted.")
+        start, end = self._row(v)
+        return self._weight_view[start:end]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """
+        Checks for an edge from u to v with a binary search of u's row.
+
+        Time Complexity: O(log d) for a vertex of degree d.
+
+        Raises:
+            IndexError: If u is out of range.
+        """
+        start, end = self._row(u)
+        i = bisect_left(self._neighbors, v, start, end)
+        return i < end and self._neighbors[i] == v
+
+    def weight(self, u: int, v: int) -> float:
+        """
+        Returns the weight of an edge from u to v (the first, for parallel edges).
+
+        Time Complexity: O(log d) for a vertex of degree d.
+
+        Raises:
+            ValueError: If the graph is unweighted.
+            KeyError: If there is no such edge.
+        """
+        if self._weights is None:
+            raise ValueError("The graph is unweighted.")
+        start, end = self._row(u)
+        i = bisect_left(self._neighbors, v, start, end)
+        if i == end or self._neighbors[i] != v:
+            raise KeyError((u, v))
+        return float(self._weights[i])
+
+    def edges(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yields every edge as (u, v), or (u, v, weight) for a weighted graph,
+        in row order.
+
+        Time Complexity: O(n + m)
+        """
+        offsets, neighbors, weights = self._offsets, self._neighbors, self._weights
+        for u in range(len(offsets) - 1):
+            for i in range(int(offsets[u]), int(offsets[u + 1])):
+                if weights is None:
+                    yield u, int(neighbors[i])
+                else:
+                    yield u, int(neighbors[i]), float(weights[i])
+
+    def edge_arrays(self) -> Tuple[Any, Any, Any]:
+        """
+        Returns the edges as parallel source, target and weight arrays.
+
+        The targets and weights are read-only views of the graph's storage,
+        not copies; the sources are built by repeating each vertex once per edge.
+
+        Time Complexity: O(n + m)
+        """
+        n = self.num_vertices
+        if self.uses_numpy:
+            sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(self._offsets))
+        else:
+            sources = array("q")
+            for u in range(n):
+                degree = self._offsets[u + 1] - self._offsets[u]
+                if degree:
+                    sources.extend(array("q", [u]) * degree)
+        return sources, self._neighbor_view, self._weight_view
+
+    def transpose(self) -> 'CSRGraph':
+        """
+        Returns the graph with every edge reversed.
+
+        Time Complexity: O(n + m log d)
+        """
+        sources, targets, weights = self.edge_arrays()
+        offsets, neighbors, weights = _compress(self.num_vertices, targets, sources, weights,
+                                                self.uses_numpy)
+        return CSRGraph(offsets, neighbors, weights, self.directed)
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        kind = "directed" if self.directed else "undirected"
+        weighted = ", weighted" if self.weighted else ""
+        return f"CSRGraph({self.num_vertices} vertices, {self.num_edges} edges, {kind}{weighted})"
+
+class GraphBuilder:
+    """
+    Collects edges and freezes them into a CSRGraph.
+
+    Edges are kept in flat arrays of sources, targets and weights, about
+    20 bytes per edge, rather than in per-vertex containers.
+
+    Attributes:
+        directed: If False, every edge is stored in both directions on freeze.
+        weighted: Whether edges carry weights.
+    """
+    def __init__(self, num_vertices: int = 0, directed: bool = True, weighted: bool = False) -> None:
+        """
+        Initializes a builder.
+
+        Args:
+            num_vertices: The initial number of vertices; adding an edge to a
+                          larger vertex id adds the vertices in between.
+            directed: Whether the graph is directed.
+            weighted: Whether edges carry weights.
+
+        Raises:
+            ValueError: If num_vertices is negative.
+        """
+        if num_vertices < 0:
+            raise ValueError("The number of vertices cannot be negative.")
+        self.directed: bool = directed
+        self.weighted: bool = weighted
+        self._num_vertices: int = num_vertices
+        self._sources = array("q")
+        self._targets = array("q")
+        self._weights = array("d") if weighted else None
+
+    @property
+    def num_vertices(self) -> int:
+        """The number of vertices so far."""
+        return self._num_vertices
+
+    @property
+    def num_edges(self) -> int:
+        """The number of edges added so far."""
+        return len(self._sources)
+
+    def add_vertex(self) -> int:
+        """
+        Adds an isolated vertex.
+
+        Returns:
+            int: The new vertex id.
+        """
+        self._num_vertices += 1
+        return self._num_vertices - 1
+
+    def add_edge(self, u: int, v: int, weight: float = 1.0) -> None:
+        """
+        Adds an edge from u to v.
+
+        Time Complexity: O(1) amortized.
+
+        Args:
+            u: The source vertex.
+            v: The target vertex.
+            weight: The edge weight; ignored by an unweighted builder.
+
+        Raises:
+            ValueError: If a vertex id is negative.
+        """
+        if u < 0 or v < 0:
+            raise ValueError("Vertex ids cannot be negative.")
+        self._sources.append(u)
+        self._targets.append(v)
+        if self._weights is not None:
+            self._weights.append(weight)
+        if u >= self._num_vertices or v >= self._num_vertices:
+            self._num_vertices = max(u, v) + 1
+
+    def add_edges(self, edges: Iterable[Sequence[Any]]) -> None:
+        """
+        Adds (u, v) or (u, v, weight) edges.
+
+        Time Complexity: O(k) for k edges.
+
+        Raises:
+            ValueError: If a vertex id is negative.
+        """
+        for edge in edges:
+            self.add_edge(*edge)
+
+    def freeze(self, use_numpy: Optional[bool] = None) -> CSRGraph:
+        """
+        Sorts the edges into a CSRGraph. The builder can be reused afterwards.
+
+        Time Complexity: O(n + m log d) for m edges and maximum degree d;
+        O(n + m log m) with NumPy.
+
+        Args:
+            use_numpy: Whether to build NumPy arrays; by default, whenever
+                       NumPy is installed.
+
+        Raises:
+            ImportError: If use_numpy is True but NumPy is not installed.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is not installed.")
+        sources, targets, weights = self._sources, self._targets, self._weights
+        if not self.directed:
+            sources, targets = sources + targets, targets + sources
+            weights = weights + weights if weights is not None else None
+        offsets, neighbors, weights = _compress(self._num_vertices, sources, targets, weights, use_numpy)
+        return CSRGraph(offsets, neighbors, weights, self.directed)
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return f"GraphBuilder({self._num_vertices} vertices, {len(self._sources)} edges)"
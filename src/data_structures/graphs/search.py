@@ -0,0 +1,343 @@
+"""
+This module contains graph search over CSRGraph: breadth-first and depth-first
+traversal, Dijkstra's algorithm, A* and bidirectional Dijkstra.
+
+Every algorithm is iterative, with an explicit queue, stack or heap, so the
+depth of a search is not limited by Python's recursion limit. The traversals
+are generators: a caller that has found what it is looking for simply stops
+iterating, and no more of the graph is explored. The shortest-path searches
+take an optional target and stop as soon as its distance is final.
+
+The priority queue is heapq with lazy deletion. Instead of decreasing the
+key of a queued vertex, a better distance is pushed as a new entry and the
+old one is skipped when it surfaces, because it no longer matches the best
+known distance. That wastes a little heap space but keeps every operation a
+plain C-level heappush or heappop, which in Python beats an indexed heap.
+
+Vertices are the integers 0 .. n - 1 of a CSRGraph. Unweighted graphs count
+every edge as 1; weights must not be negative.
+"""
+import heapq
+import math
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .csr_graph import CSRGraph
+
+Heuristic = Callable[[int], float]
+
+def _edges(graph: CSRGraph, v: int) -> Iterable[Tuple[int, float]]:
+    """Returns the (target, weight) pairs of a vertex's edges."""
+    if graph.weighted:
+        return zip(graph.neighbors(v), graph.weights(v))
+    return ((w, 1.0) for w in graph.neighbors(v))
+
+def bfs(graph: CSRGraph, source: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yields every vertex reachable from `source` with its depth, in
+    breadth-first order.
+
+    Time Complexity: O(n + m) for a complete traversal.
+
+    Raises:
+        IndexError: If the source is out of range.
+    """
+    for vertex, depth, _ in multi_source_bfs(graph, [source]):
+        yield vertex, depth
+
+def multi_source_bfs(graph: CSRGraph, sources: Iterable[int]) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yields (vertex, depth, origin) for every vertex reachable from any of the
+    sources, in breadth-first order.
+
+    The depth is the number of edges from the nearest source, and the origin
+    is that source; for example, the nearest depot of every junction.
+
+    Time Complexity: O(n + m) for a complete traversal.
+
+    Raises:
+        IndexError: If a source is out of range.
+    """
+    seen = bytearray(graph.num_vertices)
+    origin: Dict[int, int] = {}
+    frontier: List[int] = []
+    for source in sources:
+        graph.degree(source)  # Validates the vertex.
+        if not seen[source]:
+            seen[source] = 1
+            origin[source] = source
+            frontier.append(source)
+    depth = 0
+    # The frontier is processed one level at a time, so no deque is needed.
+    while frontier:
+        next_frontier = []
+        for u in frontier:
+            yield u, depth, origin[u]
+            start = origin[u]
+            for v in graph.neighbors(u):
+                if not seen[v]:
+                    seen[v] = 1
+                    origin[v] = start
+                    next_frontier.append(v)
+        frontier = next_frontier
+        depth += 1
+
+def dfs(graph: CSRGraph, source: int) -> Iterator[int]:
+    """
+    Yields every vertex reachable from `source` in depth-first preorder.
+
+    The order is the one a recursive search would produce: each vertex's
+    neighbours are explored in ascending order, one at a time. The stack
+    holds an iterator per vertex on the current path.
+
+    Time Complexity: O(n + m) for a complete traversal.
+
+    Raises:
+        IndexError: If the source is out of range.
+    """
+    seen = bytearray(graph.num_vertices)
+    seen[source] = 1
+    yield source
+    stack = [iter(graph.neighbors(source))]
+    while stack:
+        for v in stack[-1]:
+            if not seen[v]:
+                seen[v] = 1
+                yield v
+                stack.append(iter(graph.neighbors(v)))
+                break
+        else:
+            stack.pop()
+
+def reconstruct_path(parents: Dict[int, int], source: int, target: int) -> List[int]:
+    """
+    Follows parent links back from `target` to `source`.
+
+    Returns:
+        list: The vertices from source to target, or an empty list if the
+              target was not reached.
+    """
+    if target != source and target not in parents:
+        return []
+    path = [target]
+    while target != source:
+        target = parents[target]
+        path.append(target)
+    path.reverse()
+    return path
+
+def dijkstra(graph: CSRGraph, source: int,
+             target: Optional[int] = None) -> Tuple[Dict[int, float], Dict[int, int]]:
+    """
+    Finds shortest distances from `source` with Dijkstra's algorithm.
+
+    Time Complexity: O((n + m) log n)
+
+    Args:
+        graph: The graph to search.
+        source: The start vertex.
+        target: If given, stop as soon as its distance is final.
+
+    Returns:
+        tuple: A dict of final distances for every settled vertex, and a dict
+               of parent links from which `reconstruct_path` builds the paths.
+
+    Raises:
+        IndexError: If the source is out of range.
+        ValueError: If a negative edge weight is found.
+    """
+    graph.degree(source)  # Validates the vertex.
+    best: Dict[int, float] = {source: 0.0}
+    parents: Dict[int, int] = {}
+    settled: Dict[int, float] = {}
+    heap = [(0.0, source)]
+    while heap:
+        distance, u = heapq.heappop(heap)
+        if u in settled:
+            continue  # A stale entry, superseded by a shorter distance.
+        settled[u] = distance
+        if u == target:
+            break
+        for v, weight in _edges(graph, u):
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm needs non-negative edge weights.")
+            candidate = distance + weight
+            if candidate < best.get(v, math.inf):
+                best[v] = candidate
+                parents[v] = u
+                heapq.heappush(heap, (candidate, v))
+    return settled, parents
+
+def shortest_path(graph: CSRGraph, source: int, target: int) -> Tuple[float, List[int]]:
+    """
+    Finds a shortest path from `source` to `target` with Dijkstra's algorithm.
+
+    Time Complexity: O((n + m) log n)
+
+    Returns:
+        tuple: The distance and the path's vertices, or (inf, []) if the
+               target is unreachable.
+    """
+    distances, parents = dijkstra(graph, source, target)
+    if target not in distances:
+        return math.inf, []
+    return distances[target], reconstruct_path(parents, source, target)
+
+def astar(graph: CSRGraph, source: int, target: int,
+          heuristic: Optional[Heuristic] = None) -> Tuple[float, List[int]]:
+    """
+    Finds a shortest path with A*, guided by an estimate of the remaining distance.
+
+    The heuristic must never overestimate the distance to the target
+    (admissible) for the result to be a shortest path; a consistent one,
+    such as straight-line distance, also means no vertex is expanded twice.
+    Without a heuristic, A* is Dijkstra's algorithm with an early exit.
+
+    Time Complexity: O((n + m) log n) in the worst case; far less with a good heuristic.
+
+    Args:
+        graph: The graph to search.
+        source: The start vertex.
+        target: The goal vertex.
+        heuristic: A function estimating the distance from a vertex to the target.
+
+    Returns:
+        tuple: The distance and the path's vertices, or (inf, []) if the
+               target is unreachable.
+
+    Raises:
+        IndexError: If the source is out of range.
+        ValueError: If a negative edge weight is found.
+    """
+    graph.degree(source)  # Validates the vertex.
+    if heuristic is None:
+        heuristic = zero_heuristic
+    best: Dict[int, float] = {source: 0.0}
+    parents: Dict[int, int] = {}
+    heap = [(heuristic(source), 0.0, source)]
+    while heap:
+        _, distance, u = heapq.heappop(heap)
+        if distance > best[u]:
+            continue  # A stale entry.
+        if u == target:
+            return distance, reconstruct_path(parents, source, target)
+        for v, weight in _edges(graph, u):
+            if weight < 0:
+                raise ValueError("A* needs non-negative edge weights.")
+            candidate = distance + weight
+            if candidate < best.get(v, math.inf):
+                best[v] = candidate
+                parents[v] = u
+                heapq.heappush(heap, (candidate + heuristic(v), candidate, v))
+    return math.inf, []
+
+def bidirectional_dijkstra(graph: CSRGraph, source: int, target: int,
+                           reverse: Optional[CSRGraph] = None) -> Tuple[float, List[int]]:
+    """
+    Finds a shortest path by searching forward from `source` and backward
+    from `target` at the same time.
+
+    Each search settles the vertex nearest its own end, always advancing the
+    side with the smaller frontier distance. Whenever an edge joins the two
+    searches, the path through it is a candidate; once the two frontier
+    distances add up to at least the best candidate, no shorter path is
+    left. On road-like graphs the two balls explored have about half the
+    area of the single ball Dijkstra's algorithm would explore.
+
+    Time Complexity: O((n + m) log n) in the worst case.
+
+    Args:
+        graph: The graph to search.
+        source: The start vertex.
+        target: The goal vertex.
+        reverse: The graph with its edges reversed, for repeated queries on a
+                 directed graph; computed with transpose() if not given. An
+                 undirected graph is its own reverse.
+
+    Returns:
+        tuple: The distance and the path's vertices, or (inf, []) if the
+               target is unreachable.
+
+    Raises:
+        IndexError: If the source or target is out of range.
+        ValueError: If a negative edge weight is found.
+    """
+    graph.degree(source)
+    graph.degree(target)
+    if source == target:
+        return 0.0, [source]
+    if reverse is None:
+        reverse = graph.transpose() if graph.directed else graph
+    graphs = (graph, reverse)
+    best: Tuple[Dict[int, float], Dict[int, float]] = ({source: 0.0}, {target: 0.0})
+    parents: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+    settled: Tuple[set, set] = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    shortest, meeting = math.inf, -1
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= shortest:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        distance, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        mine, other = best[side], best[1 - side]
+        for v, weight in _edges(graphs[side], u):
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm needs non-negative edge weights.")
+            candidate = distance + weight
+            if candidate < mine.get(v, math.inf):
+                mine[v] = candidate
+                parents[side][v] = u
+                heapq.heappush(heaps[side], (candidate, v))
+            if v in other and candidate + other[v] < shortest:
+                shortest, meeting = candidate + other[v], v
+    if meeting < 0:
+        return math.inf, []
+    path = reconstruct_path(parents[0], source, meeting)
+    path.extend(reversed(reconstruct_path(parents[1], target, meeting)[:-1]))
+    return shortest, path
+
+def zero_heuristic(v: int) -> float:
+    """The trivial heuristic, which turns A* into Dijkstra's algorithm."""
+    return 0.0
+
+def euclidean_heuristic(coordinates: Sequence[Tuple[float, float]], target: int,
+                        scale: float = 1.0) -> Heuristic:
+    """
+    Returns a heuristic giving the straight-line distance to `target`.
+
+    It is admissible if no edge weight is less than `scale` times the
+    straight-line length of the edge.
+
+    Args:
+        coordinates: The (x, y) position of every vertex.
+        target: The goal vertex.
+        scale: The smallest ratio of an edge's weight to its length.
+    """
+    tx, ty = coordinates[target]
+
+    def heuristic(v: int) -> float:
+        x, y = coordinates[v]
+        return scale * math.hypot(x - tx, y - ty)
+    return heuristic
+
+def manhattan_heuristic(coordinates: Sequence[Tuple[float, float]], target: int,
+                        scale: float = 1.0) -> Heuristic:
+    """
+    Returns a heuristic giving the grid (L1) distance to `target`.
+
+    It is admissible on grids whose edges join horizontal or vertical
+    neighbours with a weight of at least `scale` per unit of length.
+
+    Args:
+        coordinates: The (x, y) position of every vertex.
+        target: The goal vertex.
+        scale: The smallest weight per unit of length.
+    """
+    tx, ty = coordinates[target]
+
+    def heuristic(v: int) -> float:
+        x, y = coordinates[v]
+        return scale * (abs(x - tx) + abs(y - ty))
+    return heuristic
@@ -0,0 +1,491 @@
+"""
+This module contains bounded caches with LRU, LFU and time-to-live eviction.
+
+Every cache pairs a dict from key to linked-list node with one or more
+DoublyLinkedLists that order the entries by eviction priority. Because the
+dict hands out the node directly, a hit is a dict lookup plus an O(1)
+`move_to_end` or `remove_node`, and choosing a victim is reading the head of
+a list; no operation ever scans the entries.
+
+* LRUCache keeps a single list in recency order and evicts its head.
+* LFUCache keeps one list per access count ("frequency bucket") and evicts
+  the least recently used entry of the lowest non-empty bucket.
+* TTLCache keeps a single list in expiry order; expired entries are dropped
+  from the head as they are encountered, and the soonest-to-expire entry is
+  evicted when the cache is full.
+
+A cache can be bounded by number of entries, by total size in bytes, or both.
+Sizes come from a `sizeof(key, value)` function, by default the shallow
+sys.getsizeof of the key and the value. The `memoize` decorator puts any of
+the caches in front of a function.
+"""
+import functools
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ..fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList, Node
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+def _default_sizeof(key: Any, value: Any) -> int:
+    """Returns the shallow size of a key and its value in bytes."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+class _Entry:
+    """
+    A cached key-value pair, stored as the data of a list node.
+
+    Attributes:
+        key: The cache key.
+        value: The cached value.
+        size: The size charged against max_bytes.
+        freq: The number of accesses (LFUCache only).
+        expires: The time after which the entry is stale (TTLCache only).
+    """
+    __slots__ = ("key", "value", "size", "freq", "expires")
+
+    def __init__(self, key: Any, value: Any, size: int):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.freq = 1
+        self.expires = 0.0
+
+class Cache(ABC):
+    """
+    The bookkeeping shared by all caches: limits, sizes and counters.
+
+    Subclasses decide how entries are ordered and which one is evicted, by
+    implementing the abstract hooks.
+
+    Attributes:
+        max_entries: The maximum number of entries, or None for no limit.
+        max_bytes: The maximum total size, or None for no limit.
+        current_bytes: The total size of the cached entries.
+        hits: The number of lookups that found a live entry.
+        misses: The number of lookups that did not.
+        evictions: The number of entries dropped to respect the limits.
+    """
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any, Any], int]] = None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries: The maximum number of entries, or None for no limit.
+            max_bytes: The maximum total size of the entries, or None for no limit.
+            sizeof: A function returning the size of a (key, value) pair,
+                    used when max_bytes is set.
+
+        Raises:
+            ValueError: If neither limit is set, or a limit is below 1.
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("A cache needs max_entries, max_bytes or both.")
+        if (max_entries is not None and max_entries < 1) or (max_bytes is not None and max_bytes < 1):
+            raise ValueError("Cache limits must be at least 1.")
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.sizeof: Callable[[Any, Any], int] = sizeof or _default_sizeof
+        self.current_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._map: Dict[Any, Node] = {}
+
+    # Hooks implemented by the eviction policies.
+
+    @abstractmethod
+    def _link(self, entry: _Entry) -> Node:
+        """Adds a new entry to the eviction order and returns its node."""
+
+    @abstractmethod
+    def _unlink(self, node: Node) -> None:
+        """Removes a node from the eviction order."""
+
+    @abstractmethod
+    def _hit(self, node: Node) -> None:
+        """Records an access to a cached entry."""
+
+    @abstractmethod
+    def _victim(self) -> Node:
+        """Returns the node of the entry to evict next."""
+
+    def _alive(self, node: Node) -> bool:
+        """Checks whether a cached entry may still be served."""
+        return True
+
+    # Shared operations.
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached entries.
+
+        Time Complexity: O(1)
+        """
+        return len(self._map)
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks whether `key` is cached, without counting a hit or a miss.
+
+        Time Complexity: O(1)
+        """
+        node = self._map.get(key)
+        return node is not None and self._alive(node)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value cached under `key`, or `default` on a miss.
+
+        Time Complexity: O(1)
+        """
+        node = self._map.get(key)
+        if node is None or not self._alive(node):
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._hit(node)
+        return node.data.value
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Returns the value cached under `key`.
+
+        Time Complexity: O(1)
+
+        Raises:
+            KeyError: If the key is not cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Caches `value` under `key`, first evicting entries to make room.
+
+        Overwriting a key counts as an access to it. A value larger than
+        max_bytes on its own is not cached.
+
+        Time Complexity: O(1) amortized.
+        """
+        size = self.sizeof(key, value) if self.max_bytes is not None else 0
+        node = self._map.get(key)
+        freq = 0
+        if node is not None:
+            freq = node.data.freq
+            self._discard(node)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._make_room(size)
+        entry = _Entry(key, value, size)
+        entry.freq = freq + 1
+        self._map[key] = self._link(entry)
+        self.current_bytes += size
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Caches `value` under `key`; see put."""
+        self.put(key, value)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """
+        Removes `key` from the cache and returns its value.
+
+        Time Complexity: O(1)
+
+        Raises:
+            KeyError: If the key is not cached and no default is given.
+        """
+        node = self._map.get(key)
+        if node is None or not self._alive(node):
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.data.value
+        self._discard(node)
+        return value
+
+    def __delitem__(self, key: Any) -> None:
+        """Removes `key` from the cache; see pop."""
+        self.pop(key)
+
+    def clear(self) -> None:
+        """Removes every entry, keeping the counters."""
+        for node in list(self._map.values()):
+            self._discard(node)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over a snapshot of the cached keys."""
+        return iter(list(self._map))
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits, or 0.0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _discard(self, node: Node) -> None:
+        """Drops an entry from both the dict and the eviction order."""
+        entry = node.data
+        del self._map[entry.key]
+        self.current_bytes -= entry.size
+        self._unlink(node)
+
+    def _make_room(self, size: int) -> None:
+        """Evicts entries until one more entry of `size` bytes fits."""
+        while ((self.max_entries is not None and len(self._map) >= self.max_entries)
+               or (self.max_bytes is not None and self.current_bytes + size > self.max_bytes)):
+            self._discard(self._victim())
+            self.evictions += 1
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return (f"{type(self).__name__}(entries={len(self._map)}, hits={self.hits}, "
+                f"misses={self.misses}, evictions={self.evictions})")
+
+class LRUCache(Cache):
+    """
+    A cache that evicts the least recently used entry.
+    """
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any, Any], int]] = None):
+        """Initializes an empty LRU cache; see Cache for the arguments."""
+        super().__init__(max_entries, max_bytes, sizeof)
+        self._order = DoublyLinkedList()
+
+    def _link(self, entry: _Entry) -> Node:
+        return self._order.append(entry)
+
+    def _unlink(self, node: Node) -> None:
+        self._order.remove_node(node)
+
+    def _hit(self, node: Node) -> None:
+        self._order.move_to_end(node)
+
+    def _victim(self) -> Node:
+        return self._order.head
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys from least to most recently used."""
+        return iter([entry.key for entry in self._order.values()])
+
+class LFUCache(Cache):
+    """
+    A cache that evicts the least frequently used entry, breaking ties by
+    evicting the least recently used one.
+
+    The frequency buckets are themselves kept in a DoublyLinkedList ordered
+    by access count, with a dict from count to bucket node. An access moves
+    an entry into the bucket right after its own, creating that bucket next
+    to it if needed, and an emptied bucket is unlinked; so the lowest bucket
+    is always the head, even after pop, and every operation is O(1).
+    """
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any, Any], int]] = None):
+        """Initializes an empty LFU cache; see Cache for the arguments."""
+        super().__init__(max_entries, max_bytes, sizeof)
+        self._buckets: Dict[int, Node] = {}
+        self._bucket_order = DoublyLinkedList()
+        self._reserved: Optional[int] = None
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Caches `value` under `key`; see Cache.put.
+
+        Overwriting moves the entry up one bucket. That bucket is created
+        next to the entry's current one before the entry is replaced, while
+        its place in the order is still known.
+
+        Time Complexity: O(1) amortized.
+        """
+        node = self._map.get(key)
+        if node is None:
+            super().put(key, value)
+            return
+        freq = node.data.freq
+        self._reserved = freq + 1
+        self._bucket_after(freq)
+        try:
+            super().put(key, value)
+        finally:
+            # The bucket stays empty if the new value was too large to cache.
+            self._reserved = None
+            self._drop_if_empty(freq + 1)
+
+    def _bucket_after(self, freq: int) -> DoublyLinkedList:
+        """Returns the bucket for freq + 1, inserting it after bucket `freq` if needed."""
+        outer = self._buckets.get(freq + 1)
+        if outer is None:
+            outer = self._buckets[freq + 1] = self._bucket_order.insert_after(
+                self._buckets[freq], DoublyLinkedList())
+        return outer.data
+
+    def _drop_if_empty(self, freq: int) -> None:
+        """Unlinks the bucket for `freq` if it exists, is empty and is not reserved."""
+        outer = self._buckets.get(freq)
+        if outer is not None and not outer.data.size and freq != self._reserved:
+            del self._buckets[freq]
+            self._bucket_order.remove_node(outer)
+
+    def _link(self, entry: _Entry) -> Node:
+        outer = self._buckets.get(entry.freq)
+        if outer is None:
+            # Only new keys get here, with the lowest count of all; an
+            # overwrite's bucket was created by put.
+            outer = self._buckets[entry.freq] = self._bucket_order.prepend(DoublyLinkedList())
+        return outer.data.append(entry)
+
+    def _unlink(self, node: Node) -> None:
+        freq = node.data.freq
+        self._buckets[freq].data.remove_node(node)
+        self._drop_if_empty(freq)
+
+    def _hit(self, node: Node) -> None:
+        entry = node.data
+        bucket = self._bucket_after(entry.freq)
+        self._unlink(node)
+        entry.freq += 1
+        self._map[entry.key] = bucket.append(entry)
+
+    def _victim(self) -> Node:
+        outer = self._bucket_order.head
+        if not outer.data.size:
+            # Skip the bucket put reserved for an overwrite.
+            outer = outer.next
+        return outer.data.head
+
+    def frequency(self, key: Any) -> int:
+        """Returns how many times `key` was accessed, or 0 if it is not cached."""
+        node = self._map.get(key)
+        return node.data.freq if node is not None else 0
+
+class TTLCache(Cache):
+    """
+    A cache whose entries expire a fixed time after they were last written.
+
+    When the cache is full, the entry closest to expiry is evicted.
+
+    Attributes:
+        ttl: The lifetime of an entry in seconds.
+        expirations: The number of entries dropped because they expired.
+    """
+    def __init__(self, ttl: float, max_entries: Optional[int] = 128,
+                 max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any, Any], int]] = None,
+                 timer: Callable[[], float] = time.monotonic):
+        """
+        Initializes an empty TTL cache.
+
+        Args:
+            ttl: The lifetime of an entry in seconds.
+            max_entries: The maximum number of entries, or None for no limit.
+            max_bytes: The maximum total size of the entries, or None for no limit.
+            sizeof: A function returning the size of a (key, value) pair.
+            timer: The clock used for expiry.
+
+        Raises:
+            ValueError: If ttl is not positive or the limits are invalid.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        super().__init__(max_entries, max_bytes, sizeof)
+        self.ttl: float = ttl
+        self.timer: Callable[[], float] = timer
+        self.expirations: int = 0
+        self._order = DoublyLinkedList()
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Caches `value` under `key` for `ttl` seconds; see Cache.put.
+
+        Expired entries are dropped first, so they leave before any live
+        entry is evicted.
+
+        Time Complexity: O(1) amortized.
+        """
+        self.expire()
+        super().put(key, value)
+
+    def _link(self, entry: _Entry) -> Node:
+        # Every entry gets the same lifetime, so appending keeps the list in
+        # expiry order, and an overwrite moves the key to the end.
+        entry.expires = self.timer() + self.ttl
+        return self._order.append(entry)
+
+    def _unlink(self, node: Node) -> None:
+        self._order.remove_node(node)
+
+    def _hit(self, node: Node) -> None:
+        """Reads do not extend an entry's lifetime."""
+
+    def _victim(self) -> Node:
+        return self._order.head
+
+    def _alive(self, node: Node) -> bool:
+        if node.data.expires > self.timer():
+            return True
+        self._discard(node)
+        self.expirations += 1
+        return False
+
+    def expire(self) -> int:
+        """
+        Drops every expired entry.
+
+        Time Complexity: O(k) for k expired entries, since the list is in expiry order.
+        Returns:
+            The number of entries dropped.
+        """
+        now = self.timer()
+        dropped = 0
+        while self._order.head is not None and self._order.head.data.expires <= now:
+            self._discard(self._order.head)
+            dropped += 1
+        self.expirations += dropped
+        return dropped
+
+    def __len__(self) -> int:
+        """
+        Returns the number of live entries.
+
+        Time Complexity: O(k) for k newly expired entries.
+        """
+        self.expire()
+        return len(self._map)
+
+def memoize(func: Optional[Callable] = None, *, cache: Optional[Cache] = None) -> Callable:
+    """
+    Caches a function's results by its arguments.
+
+    Use it bare, `@memoize`, for a 128-entry LRUCache, or pass a cache,
+    `@memoize(cache=LFUCache(10_000))`. The cache is available as the
+    wrapper's `cache` attribute, with its hit and miss counters. Arguments
+    must be hashable.
+
+    Args:
+        func: The function to wrap.
+        cache: The cache to store results in.
+
+    Returns:
+        The wrapped function, or a decorator when called without `func`.
+    """
+    if func is None:
+        return lambda f: memoize(f, cache=cache)
+    store = cache if cache is not None else LRUCache()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = args if not kwargs else args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+        value = store.get(key, _MISSING)
+        if value is _MISSING:
+            value = func(*args, **kwargs)
+            store.put(key, value)
+        return value
+
+    wrapper.cache = store
+    return wrapper
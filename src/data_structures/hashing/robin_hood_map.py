@@ -0,0 +1,358 @@
+"""
+This module contains the implementation of a Robin Hood Hash Map, an
+open-addressing hash table.
+
+Entries live directly in three parallel arrays (hashes, keys and values)
+instead of in per-bucket lists or node objects. A key is placed at its home
+slot, given by the top bits of its scrambled hash, or the first free slot
+after it. Robin Hood
+probing keeps the probe sequences short and even: while inserting, an entry
+that is further from its home slot than the current occupant takes the slot,
+and the occupant moves on. Lookups can then stop as soon as they meet an
+entry closer to home than the probe distance. Deletion uses backward
+shifting, so the table needs no tombstones.
+
+Growing the table does not rehash everything at once. When the load factor is
+exceeded, a table of twice the size is allocated and the old one is kept;
+each later write migrates a few entries from old to new until the old table
+is empty. Lookups consult both tables in the meantime, so no single operation
+pays for a full rehash.
+"""
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+# Marks an empty slot in the hash array; stored hashes are never negative.
+_EMPTY = -1
+_MIX = 0x9E3779B97F4A7C15
+_WORD = (1 << 64) - 1
+
+def _mix(key: Any) -> int:
+    """Returns a scrambled, non-negative 63-bit hash of `key`.
+
+    Small ints hash to themselves, which would pack runs of consecutive keys
+    into long contiguous clusters. Multiplying by a Fibonacci constant mixes
+    every input bit into the high bits, which tables use as the home slot.
+    """
+    return ((hash(key) * _MIX) & _WORD) >> 1
+
+# Slots visited in the old table per write while a resize is in progress.
+_MIGRATE_STEP = 4
+
+class _Table:
+    """
+    One open-addressing table of parallel arrays.
+
+    Attributes:
+        hashes: The stored hash of each slot, or _EMPTY.
+        keys: The key of each slot.
+        values: The value of each slot.
+        mask: The capacity minus one; the capacity is a power of two.
+        shift: The shift taking a 63-bit hash to its home slot.
+        count: The number of occupied slots.
+    """
+    __slots__ = ("hashes", "keys", "values", "mask", "shift", "count")
+
+    def __init__(self, capacity: int):
+        """Initializes an empty table with `capacity` slots."""
+        self.hashes = array("q", [_EMPTY]) * capacity
+        self.keys: List[Any] = [None] * capacity
+        self.values: List[Any] = [None] * capacity
+        self.mask: int = capacity - 1
+        self.shift: int = 64 - capacity.bit_length()
+        self.count: int = 0
+
+    def find(self, h: int, key: Any) -> int:
+        """Returns the slot holding `key`, or -1."""
+        hashes, keys, mask, shift = self.hashes, self.keys, self.mask, self.shift
+        i = h >> shift
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                return -1
+            if slot_hash == h:
+                slot_key = keys[i]
+                if slot_key is key or slot_key == key:
+                    return i
+            # An occupant closer to home than we are proves the key is absent.
+            if (i - (slot_hash >> shift)) & mask < dist:
+                return -1
+            i = (i + 1) & mask
+            dist += 1
+
+    def insert(self, h: int, key: Any, value: Any) -> None:
+        """Places a key known to be absent, displacing entries closer to home."""
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        shift = self.shift
+        i = h >> shift
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                hashes[i] = h
+                keys[i] = key
+                values[i] = value
+                self.count += 1
+                return
+            slot_dist = (i - (slot_hash >> shift)) & mask
+            if slot_dist < dist:
+                hashes[i], h = h, slot_hash
+                keys[i], key = key, keys[i]
+                values[i], value = value, values[i]
+                dist = slot_dist
+            i = (i + 1) & mask
+            dist += 1
+
+    def remove_at(self, i: int) -> None:
+        """Empties slot i, shifting the following displaced entries back by one."""
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        shift = self.shift
+        j = (i + 1) & mask
+        while hashes[j] != _EMPTY and (j - (hashes[j] >> shift)) & mask:
+            hashes[i] = hashes[j]
+            keys[i] = keys[j]
+            values[i] = values[j]
+            i = j
+            j = (j + 1) & mask
+        hashes[i] = _EMPTY
+        keys[i] = None
+        values[i] = None
+        self.count -= 1
+
+class RobinHoodHashMap:
+    """
+    A hash map using open addressing with Robin Hood probing.
+
+    Attributes:
+        max_load: The load factor above which the table grows.
+    """
+    def __init__(self, items: Any = None, capacity: int = 8, max_load: float = 0.85):
+        """
+        Initializes a hash map, optionally from a mapping or (key, value) pairs.
+
+        Args:
+            items: A mapping or an iterable of (key, value) pairs to load.
+            capacity: The initial number of slots, rounded up to a power of two.
+            max_load: The load factor that triggers growth, in (0, 0.95].
+
+        Raises:
+            ValueError: If max_load is out of range.
+        """
+        if not 0 < max_load <= 0.95:
+            raise ValueError("max_load must be in (0, 0.95].")
+        self.max_load: float = max_load
+        self._table = _Table(1 << max(3, (capacity - 1).bit_length()))
+        self._old: Optional[_Table] = None
+        self._cursor: int = 0
+        if items is not None:
+            self.update(items)
+
+    @property
+    def capacity(self) -> int:
+        """The number of slots in the current table."""
+        return self._table.mask + 1
+
+    @property
+    def resizing(self) -> bool:
+        """Whether entries are still being migrated from a smaller table."""
+        return self._old is not None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries.
+
+        Time Complexity: O(1)
+        """
+        old = self._old
+        return self._table.count + (old.count if old is not None else 0)
+
+    def _locate(self, key: Any) -> Tuple[Optional[_Table], int, int]:
+        """Returns (table, slot, hash) for `key`, or (None, -1, hash) if missing."""
+        h = _mix(key)
+        i = self._table.find(h, key)
+        if i >= 0:
+            return self._table, i, h
+        old = self._old
+        if old is not None:
+            i = old.find(h, key)
+            if i >= 0:
+                return old, i, h
+        return None, -1, h
+
+    def _migrate(self, budget: int) -> None:
+        """Moves entries from the old table, visiting at most `budget` slots."""
+        old = self._old
+        new = self._table
+        capacity = old.mask + 1
+        while budget > 0:
+            i = self._cursor
+            if old.hashes[i] == _EMPTY:
+                # Slots before the cursor stay empty: removals from the old
+                # table only ever shift entries backwards into occupied slots.
+                i += 1
+                self._cursor = i
+                if i == capacity:
+                    self._old = None
+                    return
+            else:
+                new.insert(old.hashes[i], old.keys[i], old.values[i])
+                old.remove_at(i)
+            budget -= 1
+
+    def _grow(self) -> None:
+        """Starts moving the entries into a table of twice the capacity."""
+        if self._old is not None:
+            # The previous resize has not finished; complete it first.
+            self._migrate(float("inf"))
+        self._old = self._table
+        self._table = _Table(2 * (self._table.mask + 1))
+        self._cursor = 0
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks whether `key` is in the map.
+
+        Time Complexity: O(1) on average.
+        """
+        return self._locate(key)[0] is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Returns the value stored under `key`.
+
+        Time Complexity: O(1) on average.
+
+        Raises:
+            KeyError: If the key is not in the map.
+        """
+        table, i, _ = self._locate(key)
+        if table is None:
+            raise KeyError(key)
+        return table.values[i]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value stored under `key`, or `default` if it is missing.
+
+        Time Complexity: O(1) on average.
+        """
+        table, i, _ = self._locate(key)
+        return table.values[i] if table is not None else default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Stores `value` under `key`, replacing any previous value.
+
+        Time Complexity: O(1) amortized and O(1) worst case per resize step.
+        """
+        if self._old is not None:
+            self._migrate(_MIGRATE_STEP)
+        table, i, h = self._locate(key)
+        if table is not None:
+            table.values[i] = value
+            return
+        if self._table.count + 1 > self.max_load * (self._table.mask + 1):
+            self._grow()
+        self._table.insert(h, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Removes the entry stored under `key`.
+
+        Time Complexity: O(1) on average.
+
+        Raises:
+            KeyError: If the key is not in the map.
+        """
+        self.pop(key)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """
+        Removes `key` and returns its value.
+
+        Time Complexity: O(1) on average.
+
+        Raises:
+            KeyError: If the key is missing and no default is given.
+        """
+        if self._old is not None:
+            self._migrate(_MIGRATE_STEP)
+        table, i, _ = self._locate(key)
+        if table is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = table.values[i]
+        table.remove_at(i)
+        return value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value stored under `key`, storing `default` first if it is missing.
+
+        Time Complexity: O(1) on average.
+        """
+        table, i, _ = self._locate(key)
+        if table is not None:
+            return table.values[i]
+        self[key] = default
+        return default
+
+    def update(self, items: Any) -> None:
+        """
+        Stores every (key, value) pair from a mapping or an iterable of pairs.
+
+        Time Complexity: O(m) on average for m pairs.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        for key, value in items:
+            self[key] = value
+
+    def clear(self) -> None:
+        """Removes every entry, keeping the current capacity."""
+        self._table = _Table(self._table.mask + 1)
+        self._old = None
+        self._cursor = 0
+
+    def _tables(self) -> List[_Table]:
+        """Returns the tables currently holding entries."""
+        return [self._table] if self._old is None else [self._old, self._table]
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields (key, value) pairs in slot order."""
+        for table in self._tables():
+            hashes, keys, values = table.hashes, table.keys, table.values
+            for i in range(table.mask + 1):
+                if hashes[i] != _EMPTY:
+                    yield keys[i], values[i]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys in slot order."""
+        for key, _ in self.items():
+            yield key
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yields the keys in slot order."""
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yields the values in slot order."""
+        for _, value in self.items():
+            yield value
+
+    def probe_lengths(self) -> List[int]:
+        """Returns how far each entry sits from its home slot, for diagnostics."""
+        lengths = []
+        for table in self._tables():
+            for i, h in enumerate(table.hashes):
+                if h != _EMPTY:
+                    lengths.append((i - (h >> table.shift)) & table.mask)
+        return lengths
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        body = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"RobinHoodHashMap({{{body}}})"
@@ -0,0 +1,229 @@
+"""
+This module contains the implementation of a d-ary Heap, an array-backed
+min-heap in which every node has up to d children.
+
+The heap lives in a flat Python list: the children of the element at index i
+are at indices d*i + 1 ... d*i + d, and its parent is at (i - 1) // d. A
+binary heap (d = 2) is the classic choice, but a wider heap is shallower,
+log_d(n) levels instead of log_2(n), so pushes, which only walk up, get
+cheaper, while pops, which compare up to d children per level on the way
+down, get somewhat dearer. Workloads with many pushes or decrease-key
+operations per pop, such as Dijkstra's algorithm, often favour d = 4.
+
+Both sifts move a "hole" instead of swapping: the moving element is held
+aside while parents or children are shifted into the hole, and is written
+once at its final position. Building a heap from n elements sifts down every
+internal node from the last one up, which takes O(n) rather than the
+O(n log n) of n pushes.
+"""
+from typing import Any, Iterable, Iterator, List, Optional
+
+class DAryHeap:
+    """
+    A min-heap with a configurable number of children per node.
+
+    Elements must be mutually comparable with `<`; push (priority, item)
+    tuples to order arbitrary items.
+
+    Attributes:
+        d: The number of children per node.
+    """
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, d: int = 2):
+        """
+        Initializes a heap, building it from an iterable in O(n).
+
+        Args:
+            iterable: The initial elements.
+            d: The number of children per node.
+
+        Raises:
+            ValueError: If d is less than 2.
+        """
+        if d < 2:
+            raise ValueError("A heap node needs at least 2 children.")
+        self.d: int = d
+        self._heap: List[Any] = list(iterable) if iterable is not None else []
+        self._heapify()
+
+    def _heapify(self) -> None:
+        """Restores the heap property for the whole list, bottom-up."""
+        for index in range((len(self._heap) - 2) // self.d, -1, -1):
+            self._sift_down(index)
+
+    def _sift_up(self, index: int) -> None:
+        """Moves the element at `index` up until its parent is not larger."""
+        heap, d = self._heap, self.d
+        item = heap[index]
+        while index > 0:
+            parent = (index - 1) // d
+            parent_item = heap[parent]
+            if not item < parent_item:
+                break
+            heap[index] = parent_item
+            index = parent
+        heap[index] = item
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Moves the element at `index` down to its place among its descendants.
+
+        As in heapq, the hole first follows the smallest child all the way to
+        a leaf without comparing against the moving element, which is then
+        sifted back up from there. The element being sifted is usually a
+        former leaf that belongs near the bottom, so this saves about one
+        comparison per level.
+        """
+        heap, d = self._heap, self.d
+        size = len(heap)
+        item = heap[index]
+        start = index
+        first = d * index + 1
+        while first < size:
+            # Find the smallest child.
+            best = first
+            best_item = heap[first]
+            child = first + 1
+            end = first + d if first + d < size else size
+            while child < end:
+                child_item = heap[child]
+                if child_item < best_item:
+                    best, best_item = child, child_item
+                child += 1
+            heap[index] = best_item
+            index = best
+            first = d * index + 1
+        # Sift the element back up, but no higher than where it started.
+        while index > start:
+            parent = (index - 1) // d
+            parent_item = heap[parent]
+            if not item < parent_item:
+                break
+            heap[index] = parent_item
+            index = parent
+        heap[index] = item
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements.
+
+        Time Complexity: O(1)
+        """
+        return len(self._heap)
+
+    def is_empty(self) -> bool:
+        """Checks if the heap is empty."""
+        return not self._heap
+
+    def peek(self) -> Any:
+        """
+        Returns the smallest element without removing it.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty heap")
+        return self._heap[0]
+
+    def push(self, item: Any) -> None:
+        """
+        Adds an element.
+
+        Time Complexity: O(log_d n)
+        """
+        self._heap.append(item)
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the smallest element.
+
+        Time Complexity: O(d log_d n)
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from an empty heap")
+        last = heap.pop()
+        if not heap:
+            return last
+        smallest = heap[0]
+        heap[0] = last
+        self._sift_down(0)
+        return smallest
+
+    def pushpop(self, item: Any) -> Any:
+        """
+        Pushes an element, then pops and returns the smallest one.
+
+        Faster than push followed by pop: if the new element is the smallest
+        it is returned at once without touching the heap.
+
+        Time Complexity: O(d log_d n)
+        """
+        heap = self._heap
+        if heap and heap[0] < item:
+            item, heap[0] = heap[0], item
+            self._sift_down(0)
+        return item
+
+    def replace(self, item: Any) -> Any:
+        """
+        Pops and returns the smallest element, then pushes `item`.
+
+        Unlike pushpop, the returned element may be larger than `item`.
+
+        Time Complexity: O(d log_d n)
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        heap = self._heap
+        if not heap:
+            raise IndexError("replace on an empty heap")
+        smallest = heap[0]
+        heap[0] = item
+        self._sift_down(0)
+        return smallest
+
+    def merge(self, other: Iterable[Any]) -> None:
+        """
+        Adds every element of another heap or iterable.
+
+        Small batches are pushed one by one; once the batch is large enough
+        that k pushes would cost more than rebuilding, the elements are
+        appended and the whole heap is rebuilt in O(n + k).
+
+        Time Complexity: O(min(k log n, n + k)) for k new elements.
+        """
+        items = list(other._heap if isinstance(other, DAryHeap) else other)
+        size = len(self._heap)
+        if len(items) * max(1, size.bit_length()) < size + len(items):
+            for item in items:
+                self.push(item)
+        else:
+            self._heap.extend(items)
+            self._heapify()
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the elements in heap (array) order, not sorted order.
+        """
+        return iter(self._heap)
+
+    def drain(self) -> Iterator[Any]:
+        """
+        Lazily pops and yields every element in ascending order.
+
+        Time Complexity: O(n d log_d n) in total.
+        """
+        while self._heap:
+            yield self.pop()
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return f"DAryHeap({self._heap!r}, d={self.d})"
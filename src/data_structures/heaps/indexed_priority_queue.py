@@ -0,0 +1,245 @@
+"""
+This module contains the implementation of an Indexed Priority Queue, a
+d-ary min-heap whose entries can be reprioritized or removed after insertion.
+
+A plain heap can only reach its minimum. Here every entry is a Handle that
+records its current position in the heap array; the sifts keep these
+positions up to date as entries move. Given a handle, an entry can therefore
+be found in O(1) and moved up or down, or cut out, in O(log n), which is
+what decrease-key based algorithms (Dijkstra, Prim, A*) and schedulers that
+re-rank or cancel jobs need.
+
+Entries with equal priorities come out in insertion order, because each
+handle also carries a sequence number used as a tie-breaker.
+"""
+from typing import Any, Iterator, List, Tuple
+
+class Handle:
+    """
+    An entry of an Indexed Priority Queue.
+
+    Attributes:
+        priority: The entry's current priority; smaller comes first.
+        item: The payload of the entry.
+        index: The entry's position in the heap array, or -1 once removed.
+    """
+    __slots__ = ("priority", "item", "index", "_order")
+
+    def __init__(self, priority: Any, item: Any, index: int, order: int):
+        """Initializes a handle at a heap position."""
+        self.priority: Any = priority
+        self.item: Any = item
+        self.index: int = index
+        self._order: int = order
+
+    def __lt__(self, other: 'Handle') -> bool:
+        if self.priority == other.priority:
+            return self._order < other._order
+        return self.priority < other.priority
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return f"Handle({self.priority!r}, {self.item!r})"
+
+class IndexedPriorityQueue:
+    """
+    A min-priority queue supporting decrease_key, update and remove by handle.
+
+    Attributes:
+        d: The number of children per heap node.
+    """
+    def __init__(self, d: int = 2):
+        """
+        Initializes an empty queue.
+
+        Args:
+            d: The number of children per heap node.
+
+        Raises:
+            ValueError: If d is less than 2.
+        """
+        if d < 2:
+            raise ValueError("A heap node needs at least 2 children.")
+        self.d: int = d
+        self._heap: List[Handle] = []
+        self._counter: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries.
+
+        Time Complexity: O(1)
+        """
+        return len(self._heap)
+
+    def is_empty(self) -> bool:
+        """Checks if the queue is empty."""
+        return not self._heap
+
+    def __contains__(self, handle: Handle) -> bool:
+        """
+        Checks whether a handle is still queued here.
+
+        Time Complexity: O(1)
+        """
+        index = handle.index
+        return 0 <= index < len(self._heap) and self._heap[index] is handle
+
+    def _sift_up(self, index: int) -> None:
+        """Moves the entry at `index` up, updating the positions of moved entries."""
+        heap, d = self._heap, self.d
+        handle = heap[index]
+        while index > 0:
+            parent = (index - 1) // d
+            parent_handle = heap[parent]
+            if not handle < parent_handle:
+                break
+            heap[index] = parent_handle
+            parent_handle.index = index
+            index = parent
+        heap[index] = handle
+        handle.index = index
+
+    def _sift_down(self, index: int) -> None:
+        """Moves the entry at `index` down, updating the positions of moved entries."""
+        heap, d = self._heap, self.d
+        size = len(heap)
+        handle = heap[index]
+        while True:
+            first = d * index + 1
+            if first >= size:
+                break
+            best = first
+            best_handle = heap[first]
+            child = first + 1
+            end = first + d if first + d < size else size
+            while child < end:
+                if heap[child] < best_handle:
+                    best, best_handle = child, heap[child]
+                child += 1
+            if not best_handle < handle:
+                break
+            heap[index] = best_handle
+            best_handle.index = index
+            index = best
+        heap[index] = handle
+        handle.index = index
+
+    def _check(self, handle: Handle) -> None:
+        """Raises if the handle is not queued here."""
+        if handle not in self:
+            raise ValueError("Handle is not in this priority queue.")
+
+    def push(self, priority: Any, item: Any = None) -> Handle:
+        """
+        Adds an entry.
+
+        Time Complexity: O(log_d n)
+        Returns:
+            Handle: The entry's handle, for decrease_key, update and remove.
+        """
+        handle = Handle(priority, item, len(self._heap), self._counter)
+        self._counter += 1
+        self._heap.append(handle)
+        self._sift_up(handle.index)
+        return handle
+
+    def peek(self) -> Tuple[Any, Any]:
+        """
+        Returns the (priority, item) pair of the first entry without removing it.
+
+        Time Complexity: O(1)
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty priority queue")
+        handle = self._heap[0]
+        return handle.priority, handle.item
+
+    def pop(self) -> Tuple[Any, Any]:
+        """
+        Removes the first entry and returns its (priority, item) pair.
+
+        Time Complexity: O(d log_d n)
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("pop from an empty priority queue")
+        handle = self._heap[0]
+        self._remove_at(0)
+        return handle.priority, handle.item
+
+    def _remove_at(self, index: int) -> None:
+        """Cuts the entry at `index` out, filling the gap with the last entry."""
+        heap = self._heap
+        removed = heap[index]
+        last = heap.pop()
+        removed.index = -1
+        if last is removed:
+            return
+        heap[index] = last
+        last.index = index
+        # The moved entry may belong above or below its new position.
+        if index > 0 and last < heap[(index - 1) // self.d]:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def decrease_key(self, handle: Handle, priority: Any) -> None:
+        """
+        Lowers an entry's priority.
+
+        Time Complexity: O(log_d n)
+
+        Raises:
+            ValueError: If the handle is not queued here or the new priority is larger.
+        """
+        self._check(handle)
+        if handle.priority < priority:
+            raise ValueError("decrease_key cannot increase a priority; use update.")
+        handle.priority = priority
+        self._sift_up(handle.index)
+
+    def update(self, handle: Handle, priority: Any) -> None:
+        """
+        Changes an entry's priority in either direction.
+
+        Time Complexity: O(d log_d n)
+
+        Raises:
+            ValueError: If the handle is not queued here.
+        """
+        self._check(handle)
+        old = handle.priority
+        handle.priority = priority
+        if priority < old:
+            self._sift_up(handle.index)
+        else:
+            self._sift_down(handle.index)
+
+    def remove(self, handle: Handle) -> Any:
+        """
+        Removes an entry and returns its item.
+
+        Time Complexity: O(d log_d n)
+
+        Raises:
+            ValueError: If the handle is not queued here.
+        """
+        self._check(handle)
+        self._remove_at(handle.index)
+        return handle.item
+
+    def __iter__(self) -> Iterator[Handle]:
+        """
+        Iterates over the handles in heap (array) order, not priority order.
+        """
+        return iter(list(self._heap))
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        return f"IndexedPriorityQueue({self._heap!r}, d={self.d})"
@@ -0,0 +1,252 @@
+"""
+This module contains a reader-writer lock and thread-safe wrappers around the
+linked lists and the binary search trees.
+
+The structures themselves are not safe to share between threads: two
+concurrent appends can both read the same `tail` and lose a node and a size
+increment. Each wrapper owns one structure and one ReadWriteLock. Methods that
+modify the structure take the lock exclusively, while lookups share it, so
+any number of readers proceed together and a writer waits only for the
+readers already inside.
+
+Iterating methods (`__iter__`, `values`, `iter_range`, ...) copy their results
+while holding the read lock and return an iterator over the copy, so a
+for-loop never observes a structure half-way through a modification. Several
+operations can be made atomic together with the `read()` and `write()`
+context managers, which hold the lock and hand out the underlying structure:
+
+    with shared.write() as lst:
+        if lst.find(key) is None:
+            lst.append(key)
+
+Node references returned by methods such as `find` must only be used inside
+such a block, since another thread may unlink the node at any time.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Tuple
+
+from .fundamentals.linked_lists.circular_linked_list import CircularLinkedList
+from .fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList
+from .fundamentals.linked_lists.singly_linked_list import SinglyLinkedList
+from .trees.binary_search_tree import BinarySearchTree
+
+class ReadWriteLock:
+    """
+    A lock that admits many readers or a single writer at a time.
+
+    Writers take priority: once a writer is waiting, new readers wait too, so
+    a steady stream of readers cannot starve writers. The lock is not
+    reentrant; a thread holding it must not acquire it again.
+    """
+    def __init__(self):
+        """Initializes an unlocked lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._writer: bool = False
+        self._waiting_writers: int = 0
+
+    def acquire_read(self) -> None:
+        """Blocks until the lock can be shared with other readers."""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Releases a shared hold on the lock."""
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Blocks until the lock is held exclusively."""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Releases an exclusive hold on the lock."""
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Holds the lock shared for the duration of a with-block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Holds the lock exclusively for the duration of a with-block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+def _writer(name: str) -> Callable:
+    """Builds a method that calls `name` on the wrapped structure under the write lock."""
+    def method(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_write()
+        try:
+            return getattr(self._inner, name)(*args, **kwargs)
+        finally:
+            lock.release_write()
+    method.__name__ = name
+    return method
+
+def _reader(name: str) -> Callable:
+    """Builds a method that calls `name` on the wrapped structure under the read lock."""
+    def method(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_read()
+        try:
+            return getattr(self._inner, name)(*args, **kwargs)
+        finally:
+            lock.release_read()
+    method.__name__ = name
+    return method
+
+def _snapshot(name: str) -> Callable:
+    """Builds a method that copies an iterator's results under the read lock."""
+    def method(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_read()
+        try:
+            items = list(getattr(self._inner, name)(*args, **kwargs))
+        finally:
+            lock.release_read()
+        return iter(items)
+    method.__name__ = name
+    return method
+
+class Synchronized:
+    """
+    The base of the thread-safe wrappers.
+
+    Subclasses name the wrapped class and sort its public methods into
+    writers, readers and snapshots; matching locked methods are generated
+    when the subclass is defined.
+    """
+    wrapped: type = object
+    writers: Tuple[str, ...] = ()
+    readers: Tuple[str, ...] = ()
+    snapshots: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for builder, names in ((_writer, cls.writers), (_reader, cls.readers),
+                               (_snapshot, cls.snapshots)):
+            for name in names:
+                method = builder(name)
+                method.__doc__ = getattr(cls.wrapped, name).__doc__
+                setattr(cls, name, method)
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates a new structure from the arguments and wraps it.
+
+        Use `wrap` to share a structure that already exists.
+        """
+        self._inner = self.wrapped(*args, **kwargs)
+        self._lock = ReadWriteLock()
+
+    @classmethod
+    def wrap(cls, structure: Any) -> 'Synchronized':
+        """
+        Wraps an existing structure. It must not be used directly afterwards.
+
+        Raises:
+            TypeError: If the structure is not an instance of the wrapped class.
+        """
+        if not isinstance(structure, cls.wrapped):
+            raise TypeError(f"{cls.__name__} wraps {cls.wrapped.__name__}, not {type(structure).__name__}.")
+        wrapper = cls.__new__(cls)
+        wrapper._inner = structure
+        wrapper._lock = ReadWriteLock()
+        return wrapper
+
+    @contextmanager
+    def read(self) -> Iterator[Any]:
+        """Holds the read lock and yields the wrapped structure for several lookups."""
+        with self._lock.read_locked():
+            yield self._inner
+
+    @contextmanager
+    def write(self) -> Iterator[Any]:
+        """Holds the write lock and yields the wrapped structure for a compound update."""
+        with self._lock.write_locked():
+            yield self._inner
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        with self._lock.read_locked():
+            return f"{type(self).__name__}({self._inner!r})"
+
+class SynchronizedSinglyLinkedList(Synchronized):
+    """
+    A thread-safe SinglyLinkedList.
+    """
+    wrapped = SinglyLinkedList
+    writers = ("append", "prepend", "delete", "insert_after", "extend")
+    readers = ("__len__", "__contains__", "__getitem__", "is_empty", "find", "to_list")
+    snapshots = ("__iter__", "values")
+
+class SynchronizedDoublyLinkedList(Synchronized):
+    """
+    A thread-safe DoublyLinkedList.
+    """
+    wrapped = DoublyLinkedList
+    writers = ("append", "prepend", "delete", "insert_after", "extend", "remove_node",
+               "move_to_front", "move_to_end", "reverse")
+    readers = ("__len__", "__contains__", "__getitem__", "is_empty", "find", "to_list")
+    snapshots = ("__iter__", "values")
+
+class SynchronizedCircularLinkedList(Synchronized):
+    """
+    A thread-safe CircularLinkedList.
+    """
+    wrapped = CircularLinkedList
+    writers = ("append", "prepend", "delete", "extend", "advance", "rotate", "pop_current")
+    readers = ("__len__", "__contains__", "__getitem__", "is_empty", "find", "to_list")
+    snapshots = ("__iter__", "values")
+
+class SynchronizedBinarySearchTree(Synchronized):
+    """
+    A thread-safe BinarySearchTree, AVLTree or RedBlackTree.
+
+    The constructor builds a plain BinarySearchTree; use `wrap` for the
+    balanced subclasses.
+    """
+    wrapped = BinarySearchTree
+    writers = ("insert", "delete", "update", "merge")
+    readers = ("__len__", "__contains__", "search", "select", "rank", "count_range",
+               "floor", "ceiling", "predecessor", "successor",
+               "in_order_traversal", "pre_order_traversal", "post_order_traversal")
+    snapshots = ("__iter__", "__reversed__", "iter_range", "iter_in_order",
+                 "iter_pre_order", "iter_post_order")
+
+_WRAPPERS = (SynchronizedSinglyLinkedList, SynchronizedDoublyLinkedList,
+             SynchronizedCircularLinkedList, SynchronizedBinarySearchTree)
+
+def synchronized(structure: Any) -> Synchronized:
+    """
+    Wraps a linked list or search tree in the matching thread-safe wrapper.
+
+    Raises:
+        TypeError: If there is no wrapper for the structure's type.
+    """
+    for wrapper in _WRAPPERS:
+        if isinstance(structure, wrapper.wrapped):
+            return wrapper.wrap(structure)
+    raise TypeError(f"No synchronized wrapper for {type(structure).__name__}.")
@@ -0,0 +1,160 @@
+"""
+This module contains the implementation of an AVL Tree, a self-balancing
+Binary Search Tree.
+
+An AVL tree keeps, for every node, the heights of its left and right subtrees
+within one of each other. Whenever an insertion or deletion breaks this rule,
+the tree is repaired with one or two rotations on the way back up. The height
+of the tree is therefore always O(log n), so insert, search and delete run in
+O(log n) time in the worst case, even for sorted or adversarial input that
+would degrade a plain BST into a linked list.
+"""
+from typing import Any, List, Optional
+
+from .binary_search_tree import BinarySearchTree, Node as BSTNode
+
+class Node(BSTNode):
+    """
+    A node in an AVL Tree.
+
+    Attributes:
+        data: The value stored in the node.
+        left: A pointer to the left child node.
+        right: A pointer to the right child node.
+        size: The number of nodes in the subtree rooted at this node.
+        height: The height of the subtree rooted at this node (a leaf has height 1).
+    """
+    __slots__ = ("height",)
+
+    def __init__(self, data: Any):
+        """Initializes a new leaf node."""
+        super().__init__(data)
+        self.height: int = 1
+
+class AVLTree(BinarySearchTree):
+    """
+    An AVL Tree sharing the BinarySearchTree API (insert, search, delete and
+    the traversals) with a worst-case O(log n) height guarantee.
+
+    Attributes:
+        root: The root node of the tree.
+    """
+    def insert(self, data: Any) -> None:
+        """
+        Inserts a new node with the given data into the tree and rebalances it.
+
+        Time Complexity: O(log n) in the worst case.
+        Args:
+            data: The value to be inserted.
+        """
+        self.root = self._insert_balanced(self.root, data)
+
+    def _insert_balanced(self, node: Optional[Node], data: Any) -> Node:
+        """Recursive helper for insertion; the depth is bounded by the tree height."""
+        if node is None:
+            return self._new_node(data)
+
+        if data < node.data:
+            node.left = self._insert_balanced(node.left, data)
+        elif data > node.data:
+            node.right = self._insert_balanced(node.right, data)
+        else:
+            # Duplicates are not allowed, so the shape is unchanged.
+            return node
+
+        return self._rebalance(node)
+
+    def delete(self, data: Any) -> None:
+        """
+        Deletes a node with the given data from the tree and rebalances it.
+
+        Time Complexity: O(log n) in the worst case.
+        Args:
+            data: The value to be deleted.
+        """
+        self.root = self._delete_balanced(self.root, data)
+
+    def _delete_balanced(self, node: Optional[Node], data: Any) -> Optional[Node]:
+        """Recursive helper for deletion; the depth is bounded by the tree height."""
+        if node is None:
+            return None
+
+        if data < node.data:
+            node.left = self._delete_balanced(node.left, data)
+        elif data > node.data:
+            node.right = self._delete_balanced(node.right, data)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+
+            # Two children: replace with the in-order successor, then remove it.
+            temp = self._find_min_node(node.right)
+            node.data = temp.data
+            node.right = self._delete_balanced(node.right, temp.data)
+
+        return self._rebalance(node)
+
+    def _new_node(self, data: Any) -> Node:
+        """Creates an AVL node."""
+        return Node(data)
+
+    def _build_subtree(self, values: List[Any], lo: int, hi: int,
+                       depth: int, height: int) -> Optional[Node]:
+        """Builds a balanced subtree and fills in the cached heights."""
+        node = super()._build_subtree(values, lo, hi, depth, height)
+        if node is not None:
+            self._update(node)
+        return node
+
+    @staticmethod
+    def _height(node: Optional[Node]) -> int:
+        """Returns the height of a subtree, treating None as height 0."""
+        return node.height if node is not None else 0
+
+    def _update(self, node: Node) -> None:
+        """Recomputes the cached height and subtree size of a node from its children."""
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _balance_factor(self, node: Node) -> int:
+        """Returns the height of the left subtree minus that of the right subtree."""
+        return self._height(node.left) - self._height(node.right)
+
+    def _rotate_left(self, node: Node) -> Node:
+        """Rotates a subtree to the left and returns its new root."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: Node) -> Node:
+        """Rotates a subtree to the right and returns its new root."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: Node) -> Node:
+        """Restores the AVL property at a node and returns the subtree's new root."""
+        self._update(node)
+        balance = self._balance_factor(node)
+
+        if balance > 1:
+            # Left-Right case: straighten the left child first.
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            # Right-Left case: straighten the right child first.
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
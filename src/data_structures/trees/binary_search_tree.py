@@ -6,8 +6,13 @@ left and right children satisfy the BST property: all values in the left
 subtree are less than the node's value, and all values in the right subtree
 are greater. This allows for efficient search, insertion, and deletion operations,
 with a time complexity of O(log n) on average.
+
+Every node also records the size of its subtree, which makes len() O(1) and
+supports order-statistic queries (select, rank, count_range) in time
+proportional to the height of the tree.
 """
-from typing import Any, Optional
+from math import log2
+from typing import Any, Iterable, Iterator, List, Optional
 
 class Node:
     """
@@ -17,12 +22,16 @@ class Node:
         data: The value stored in the node.
         left: A pointer to the left child node.
         right: A pointer to the right child node.
+        size: The number of nodes in the subtree rooted at this node.
     """
+    __slots__ = ("data", "left", "right", "size")
+
     def __init__(self, data: Any):
         """Initializes a new node."""
         self.data: Any = data
         self.left: Optional['Node'] = None
         self.right: Optional['Node'] = None
+        self.size: int = 1
 
     def __repr__(self) -> str:
         """Provides a string representation for debugging."""
@@ -32,6 +41,9 @@ class BinarySearchTree:
     """
     A Binary Search Tree implementation with common operations.
 
+    All operations are iterative (explicit stacks or pointer walks), so very
+    deep or degenerate trees never raise RecursionError.
+
     Attributes:
         root: The root node of the tree.
     """
@@ -39,28 +51,75 @@ class BinarySearchTree:
         """Initializes an empty BST."""
         self.root: Optional[Node] = None
 
+    @classmethod
+    def from_sorted(cls, iterable: Iterable[Any]) -> 'BinarySearchTree':
+        """
+        Builds a perfectly balanced tree from values in ascending order.
+
+        Consecutive duplicates are collapsed, matching insert's behaviour.
+
+        Time Complexity: O(n)
+        Args:
+            iterable: The values to load, already sorted in ascending order.
+        Returns:
+            A new tree of minimal height holding the values.
+        Raises:
+            ValueError: If the values are not in ascending order.
+        """
+        tree = cls()
+        tree._build_balanced(cls._unique_sorted(iterable, check=True))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any]) -> 'BinarySearchTree':
+        """
+        Builds a perfectly balanced tree from values in any order.
+
+        Time Complexity: O(n log n) for the sort, O(n) if the input is already sorted.
+        Args:
+            iterable: The values to load.
+        Returns:
+            A new tree of minimal height holding the distinct values.
+        """
+        tree = cls()
+        tree._build_balanced(cls._unique_sorted(sorted(iterable)))
+        return tree
+
     def insert(self, data: Any) -> None:
         """
         Inserts a new node with the given data into the tree.
 
+        The insertion point is found with an iterative walk, so degenerate
+        (e.g. sorted) input cannot exhaust the interpreter's recursion limit.
+
         Time Complexity: O(log n) on average, O(n) in the worst case (unbalanced tree).
         Args:
             data: The value to be inserted.
         """
-        self.root = self._insert_recursive(self.root, data)
+        if self.root is None:
+            self.root = self._new_node(data)
+            return
 
-    def _insert_recursive(self, node: Optional[Node], data: Any) -> Node:
-        """Recursive helper function for insertion."""
-        if node is None:
-            return Node(data)
-        
-        if data < node.data:
-            node.left = self._insert_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._insert_recursive(node.right, data)
-        # If data is equal, do nothing (duplicates are not allowed in this implementation)
-        
-        return node
+        path = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            if data < current.data:
+                current = current.left
+            elif data > current.data:
+                current = current.right
+            else:
+                # If data is equal, do nothing (duplicates are not allowed in this implementation)
+                return
+
+        parent = path[-1]
+        if data < parent.data:
+            parent.left = self._new_node(data)
+        else:
+            parent.right = self._new_node(data)
+        # Every ancestor of the new leaf gains one descendant.
+        for node in path:
+            node.size += 1
 
     def search(self, data: Any) -> Optional[Node]:
         """
@@ -72,17 +131,15 @@ class BinarySearchTree:
         Returns:
             The node if found, otherwise None.
         """
-        return self._search_recursive(self.root, data)
-    
-    def _search_recursive(self, node: Optional[Node], data: Any) -> Optional[Node]:
-        """Recursive helper function for search."""
-        if node is None or node.data == data:
-            return node
-        
-        if data < node.data:
-            return self._search_recursive(node.left, data)
-        else:
-            return self._search_recursive(node.right, data)
+        current = self.root
+        while current is not None:
+            if data < current.data:
+                current = current.left
+            elif data > current.data:
+                current = current.right
+            else:
+                return current
+        return None
 
     def delete(self, data: Any) -> None:
         """
@@ -92,35 +149,139 @@ class BinarySearchTree:
         Args:
             data: The value to be deleted.
         """
-        self.root = self._delete_recursive(self.root, data)
-
-    def _delete_recursive(self, node: Optional[Node], data: Any) -> Optional[Node]:
-        """Recursive helper function for deletion."""
+        # Traverse the tree to find the node to delete, recording the path to it
+        path = []
+        node = self.root
+        while node is not None:
+            if data < node.data:
+                path.append(node)
+                node = node.left
+            elif data > node.data:
+                path.append(node)
+                node = node.right
+            else:
+                break
         if node is None:
-            return node
-        
-        # Traverse the tree to find the node to delete
-        if data < node.data:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._delete_recursive(node.right, data)
-        else: # Found the node to delete
-            # Case 1: Node with no children or only one child
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
-            # Case 2: Node with two children. Find the inorder successor
-            # (the smallest node in the right subtree)
-            temp = self._find_min_node(node.right)
-            # Copy the inorder successor's data to this node
-            node.data = temp.data
-            # Delete the inorder successor
-            node.right = self._delete_recursive(node.right, temp.data)
-        
+            return
+
+        # Case 2: Node with two children. Copy the inorder successor's data
+        # (the smallest node in the right subtree) into this node, then
+        # remove the successor, which has no left child.
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+
+        # Every node on the path loses one descendant.
+        for ancestor in path:
+            ancestor.size -= 1
+
+        # Case 1: Node with no children or only one child
+        parent = path[-1] if path else None
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Inserts many values at once.
+
+        Small batches are inserted one by one. Large batches are merged with
+        the tree's existing contents and the tree is rebuilt perfectly
+        balanced, which also repairs a degenerate shape.
+
+        Time Complexity: O(n + m log m) for a rebuild with m new values.
+        Args:
+            iterable: The values to insert.
+        """
+        incoming = self._unique_sorted(sorted(iterable))
+        size = len(self)
+        if len(incoming) * log2(size + 2) < size:
+            for data in incoming:
+                self.insert(data)
+            return
+        self._build_balanced(self._merge_sorted(list(self), incoming))
+
+    def merge(self, other: 'BinarySearchTree') -> None:
+        """
+        Inserts every value of another tree into this one.
+
+        The other tree is iterated in sorted order, so no sort is needed and
+        the rebuild is linear. The other tree is left unchanged.
+
+        Time Complexity: O(n + m)
+        Args:
+            other: The tree whose values are added.
+        """
+        self.update(other)
+
+    @staticmethod
+    def _unique_sorted(values: Iterable[Any], check: bool = False) -> List[Any]:
+        """Drops consecutive duplicates, optionally verifying ascending order."""
+        result = []
+        for data in values:
+            if result:
+                last = result[-1]
+                if data == last:
+                    continue
+                if check and data < last:
+                    raise ValueError("Values passed to from_sorted must be in ascending order.")
+            result.append(data)
+        return result
+
+    @staticmethod
+    def _merge_sorted(left: List[Any], right: List[Any]) -> List[Any]:
+        """Merges two duplicate-free ascending lists into one, dropping shared values."""
+        result = []
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                result.append(left[i])
+                i += 1
+            elif right[j] < left[i]:
+                result.append(right[j])
+                j += 1
+            else:
+                result.append(left[i])
+                i += 1
+                j += 1
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return result
+
+    def _build_balanced(self, values: List[Any]) -> None:
+        """Replaces the tree's contents with a minimal-height tree of sorted, distinct values."""
+        self.root = self._build_subtree(values, 0, len(values) - 1, 1, len(values).bit_length())
+
+    def _build_subtree(self, values: List[Any], lo: int, hi: int,
+                       depth: int, height: int) -> Optional[Node]:
+        """
+        Builds the subtree for values[lo..hi] around its median.
+
+        Recursion depth is bounded by `height`, the final height of the tree
+        (about log2 n). Subclasses extend this to fill in their own metadata.
+        """
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._new_node(values[mid])
+        node.left = self._build_subtree(values, lo, mid - 1, depth + 1, height)
+        node.right = self._build_subtree(values, mid + 1, hi, depth + 1, height)
+        node.size = hi - lo + 1
         return node
 
+    def _new_node(self, data: Any) -> Node:
+        """Creates a node of the type used by this tree."""
+        return Node(data)
+
     def _find_min_node(self, node: Node) -> Node:
         """Helper to find the smallest node in a subtree."""
         current = node
@@ -132,62 +293,277 @@ class BinarySearchTree:
         """
         Performs an in-order traversal (left, root, right) of the tree.
 
+        Time Complexity: O(n), using an explicit stack of at most O(h) nodes.
         Returns:
             A list of nodes' data in sorted order.
         """
-        result = []
-        self._in_order_recursive(self.root, result)
-        return result
-    
-    def _in_order_recursive(self, node: Optional[Node], result: list) -> None:
-        """Recursive helper for in-order traversal."""
-        if node:
-            self._in_order_recursive(node.left, result)
-            result.append(node.data)
-            self._in_order_recursive(node.right, result)
+        return list(self.iter_in_order())
 
     def pre_order_traversal(self) -> list:
         """
         Performs a pre-order traversal (root, left, right) of the tree.
 
+        Time Complexity: O(n), using an explicit stack of at most O(h) nodes.
         Returns:
             A list of nodes' data in pre-order.
         """
-        result = []
-        self._pre_order_recursive(self.root, result)
-        return result
-    
-    def _pre_order_recursive(self, node: Optional[Node], result: list) -> None:
-        """Recursive helper for pre-order traversal."""
-        if node:
-            result.append(node.data)
-            self._pre_order_recursive(node.left, result)
-            self._pre_order_recursive(node.right, result)
+        return list(self.iter_pre_order())
 
     def post_order_traversal(self) -> list:
         """
         Performs a post-order traversal (left, right, root) of the tree.
 
+        Time Complexity: O(n), using an explicit stack of at most O(h) nodes.
         Returns:
             A list of nodes' data in post-order.
         """
-        result = []
-        self._post_order_recursive(self.root, result)
-        return result
-    
-    def _post_order_recursive(self, node: Optional[Node], result: list) -> None:
-        """Recursive helper for post-order traversal."""
-        if node:
-            self._post_order_recursive(node.left, result)
-            self._post_order_recursive(node.right, result)
-            result.append(node.data)
+        return list(self.iter_post_order())
+
+    def iter_in_order(self, reverse: bool = False) -> Iterator[Any]:
+        """
+        Lazily yields the tree's data in sorted order (or descending if `reverse`).
+
+        The tree must not be modified while the generator is in use.
+
+        Time Complexity: O(1) amortized per value, O(h) extra space.
+        Args:
+            reverse: If True, yield values from largest to smallest.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
+            yield node.data
+            node = node.left if reverse else node.right
+
+    def iter_pre_order(self) -> Iterator[Any]:
+        """
+        Lazily yields the tree's data in pre-order (root, left, right).
+
+        Time Complexity: O(1) amortized per value, O(h) extra space.
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            # Push right first so that the left subtree is visited first.
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_post_order(self) -> Iterator[Any]:
+        """
+        Lazily yields the tree's data in post-order (left, right, root).
+
+        Time Complexity: O(1) amortized per value, O(h) extra space.
+        """
+        stack = []
+        last_visited = None
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            peek = stack[-1]
+            # Descend into the right subtree unless we are coming back from it.
+            if peek.right is not None and last_visited is not peek.right:
+                node = peek.right
+            else:
+                yield peek.data
+                last_visited = stack.pop()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the tree's data in sorted order."""
+        return self.iter_in_order()
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterates over the tree's data in descending order."""
+        return self.iter_in_order(reverse=True)
+
+    def __contains__(self, data: Any) -> bool:
+        """
+        Checks whether a value is stored in the tree.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        """
+        return self.search(data) is not None
+
+    def iter_range(self, lo: Any = None, hi: Any = None) -> Iterator[Any]:
+        """
+        Lazily yields the values v with lo <= v <= hi in sorted order.
+
+        Only the O(h) nodes on the boundary paths are visited besides the
+        yielded ones, so reading the first page of a large range is cheap.
+
+        Time Complexity: O(h + k) for k yielded values.
+        Args:
+            lo: The inclusive lower bound, or None for no lower bound.
+            hi: The inclusive upper bound, or None for no upper bound.
+        """
+        stack = []
+        node = self.root
+        while True:
+            # Descend towards lo, keeping only the nodes that are in range.
+            while node is not None:
+                if lo is not None and node.data < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and node.data > hi:
+                return
+            yield node.data
+            node = node.right
+
+    def floor(self, data: Any) -> Optional[Any]:
+        """
+        Returns the largest value less than or equal to `data`, or None.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        """
+        return self._bound(data, below=True, inclusive=True)
+
+    def ceiling(self, data: Any) -> Optional[Any]:
+        """
+        Returns the smallest value greater than or equal to `data`, or None.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        """
+        return self._bound(data, below=False, inclusive=True)
+
+    def predecessor(self, data: Any) -> Optional[Any]:
+        """
+        Returns the largest value strictly less than `data`, or None.
+
+        `data` does not need to be present in the tree.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        """
+        return self._bound(data, below=True, inclusive=False)
+
+    def successor(self, data: Any) -> Optional[Any]:
+        """
+        Returns the smallest value strictly greater than `data`, or None.
+
+        `data` does not need to be present in the tree.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        """
+        return self._bound(data, below=False, inclusive=False)
+
+    def _bound(self, data: Any, below: bool, inclusive: bool) -> Optional[Any]:
+        """Shared root-to-leaf walk behind floor, ceiling, predecessor and successor."""
+        best = None
+        node = self.root
+        while node is not None:
+            if inclusive and node.data == data:
+                return node.data
+            if below:
+                if node.data < data:
+                    best = node.data
+                    node = node.right
+                else:
+                    node = node.left
+            else:
+                if node.data > data:
+                    best = node.data
+                    node = node.left
+                else:
+                    node = node.right
+        return best
 
     def __len__(self) -> int:
-        """Returns the number of nodes in the tree."""
-        return self._count_nodes_recursive(self.root)
+        """
+        Returns the number of nodes in the tree.
 
-    def _count_nodes_recursive(self, node: Optional[Node]) -> int:
-        """Recursive helper to count nodes."""
-        if node is None:
+        Time Complexity: O(1), read from the root's subtree size.
+        """
+        return self._size(self.root)
+
+    @staticmethod
+    def _size(node: Optional[Node]) -> int:
+        """Returns the size of a subtree, treating None as an empty subtree."""
+        return node.size if node is not None else 0
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest value in the tree (0-based).
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        Args:
+            k: The zero-based rank of the value to return. Negative values
+               count from the largest value, as with list indexing.
+        Returns:
+            The value with exactly k smaller values in the tree.
+        Raises:
+            IndexError: If k is out of range.
+        """
+        size = self._size(self.root)
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError("select index out of range")
+
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node.right
+            else:
+                return node.data
+
+    def rank(self, data: Any) -> int:
+        """
+        Returns the number of values in the tree strictly less than `data`.
+
+        The value itself does not need to be present in the tree.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        Args:
+            data: The value to rank.
+        Returns:
+            The count of smaller values, which is also the index `data` has
+            (or would have) in the in-order traversal.
+        """
+        return self._count_below(data, inclusive=False)
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """
+        Returns the number of values v in the tree with lo <= v <= hi.
+
+        Time Complexity: O(log n) on average, O(n) in the worst case.
+        Args:
+            lo: The inclusive lower bound.
+            hi: The inclusive upper bound.
+        Returns:
+            The count of values in the closed interval, or 0 if lo > hi.
+        """
+        if hi < lo:
             return 0
-        return 1 + self._count_nodes_recursive(node.left) + self._count_nodes_recursive(node.right)
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+    def _count_below(self, data: Any, inclusive: bool) -> int:
+        """Counts values less than (or, if inclusive, equal to) `data`."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                count += self._size(node.left) + 1
+                node = node.right
+            else:
+                count += self._size(node.left) + (1 if inclusive else 0)
+                break
+        return count
@@ -0,0 +1,297 @@
+"""
+This module contains the implementation of a Red-Black Tree, a self-balancing
+Binary Search Tree.
+
+Every node of a Red-Black tree is colored red or black, and the tree maintains
+two rules: a red node never has a red child, and every path from a node down to
+an empty subtree passes through the same number of black nodes. Together these
+keep the longest path at most twice the shortest, so the height is O(log n).
+Insertions and deletions restore the rules with recoloring and at most three
+rotations, which makes Red-Black trees cheaper to update than AVL trees while
+still guaranteeing O(log n) worst-case operations.
+"""
+from typing import Any, List, Optional
+
+from .binary_search_tree import BinarySearchTree, Node as BSTNode
+
+class Node(BSTNode):
+    """
+    A node in a Red-Black Tree.
+
+    Attributes:
+        data: The value stored in the node.
+        left: A pointer to the left child node.
+        right: A pointer to the right child node.
+        size: The number of nodes in the subtree rooted at this node.
+        parent: A pointer to the parent node (None for the root).
+        red: True if the node is red, False if it is black.
+    """
+    __slots__ = ("parent", "red")
+
+    def __init__(self, data: Any):
+        """Initializes a new red node."""
+        super().__init__(data)
+        self.parent: Optional['Node'] = None
+        self.red: bool = True
+
+class RedBlackTree(BinarySearchTree):
+    """
+    A Red-Black Tree sharing the BinarySearchTree API (insert, search, delete
+    and the traversals) with a worst-case O(log n) height guarantee.
+
+    Both insert and delete are iterative, walking parent pointers during the
+    fix-up phase instead of recursing.
+
+    Attributes:
+        root: The root node of the tree.
+    """
+    def insert(self, data: Any) -> None:
+        """
+        Inserts a new node with the given data into the tree and rebalances it.
+
+        Time Complexity: O(log n) in the worst case.
+        Args:
+            data: The value to be inserted.
+        """
+        parent = None
+        current = self.root
+        while current is not None:
+            parent = current
+            if data < current.data:
+                current = current.left
+            elif data > current.data:
+                current = current.right
+            else:
+                # Duplicates are not allowed in this implementation.
+                return
+
+        node = self._new_node(data)
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif data < parent.data:
+            parent.left = node
+        else:
+            parent.right = node
+
+        # Every ancestor of the new leaf gains one descendant.
+        while parent is not None:
+            parent.size += 1
+            parent = parent.parent
+
+        self._insert_fixup(node)
+
+    def _insert_fixup(self, node: Node) -> None:
+        """Restores the Red-Black properties after inserting a red node."""
+        while node.parent is not None and node.parent.red:
+            parent = node.parent
+            # The parent is red, so it is not the root and has a parent itself.
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self._is_red(uncle):
+                    # Case 1: red uncle, push the blackness down from the grandparent.
+                    parent.red = False
+                    uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                else:
+                    if node is parent.right:
+                        # Case 2: zig-zag, rotate into the straight-line case.
+                        node = parent
+                        self._rotate_left(node)
+                        parent = node.parent
+                    # Case 3: straight line, rotate the grandparent.
+                    parent.red = False
+                    grandparent.red = True
+                    self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if self._is_red(uncle):
+                    parent.red = False
+                    uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                else:
+                    if node is parent.left:
+                        node = parent
+                        self._rotate_right(node)
+                        parent = node.parent
+                    parent.red = False
+                    grandparent.red = True
+                    self._rotate_left(grandparent)
+
+        self.root.red = False
+
+    def delete(self, data: Any) -> None:
+        """
+        Deletes a node with the given data from the tree and rebalances it.
+
+        Time Complexity: O(log n) in the worst case.
+        Args:
+            data: The value to be deleted.
+        """
+        node = self.search(data)
+        if node is None:
+            return
+
+        # Every ancestor of the position being spliced out loses one descendant.
+        if node.left is not None and node.right is not None:
+            ancestor = self._find_min_node(node.right).parent
+        else:
+            ancestor = node.parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
+        removed_red = node.red
+        if node.left is None:
+            child, child_parent = node.right, node.parent
+            self._transplant(node, node.right)
+        elif node.right is None:
+            child, child_parent = node.left, node.parent
+            self._transplant(node, node.left)
+        else:
+            # Two children: splice the in-order successor into the node's place.
+            successor = self._find_min_node(node.right)
+            removed_red = successor.red
+            child = successor.right
+            if successor.parent is node:
+                child_parent = successor
+            else:
+                child_parent = successor.parent
+                self._transplant(successor, successor.right)
+                successor.right = node.right
+                successor.right.parent = successor
+            self._transplant(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.red = node.red
+            successor.size = node.size
+
+        if not removed_red:
+            self._delete_fixup(child, child_parent)
+
+    def _delete_fixup(self, node: Optional[Node], parent: Optional[Node]) -> None:
+        """
+        Restores the Red-Black properties after removing a black node.
+
+        `node` carries an extra unit of blackness and may be None, so its
+        parent is tracked explicitly.
+        """
+        while node is not self.root and not self._is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    # Case 1: red sibling, rotate to get a black sibling.
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_left(parent)
+                    sibling = parent.right
+                if not self._is_red(sibling.left) and not self._is_red(sibling.right):
+                    # Case 2: black sibling with black children, move the problem up.
+                    sibling.red = True
+                    node = parent
+                    parent = node.parent
+                else:
+                    if not self._is_red(sibling.right):
+                        # Case 3: sibling's near child is red, rotate it outward.
+                        sibling.left.red = False
+                        sibling.red = True
+                        self._rotate_right(sibling)
+                        sibling = parent.right
+                    # Case 4: sibling's far child is red, one rotation finishes.
+                    sibling.red = parent.red
+                    parent.red = False
+                    sibling.right.red = False
+                    self._rotate_left(parent)
+                    node = self.root
+                    parent = None
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_right(parent)
+                    sibling = parent.left
+                if not self._is_red(sibling.left) and not self._is_red(sibling.right):
+                    sibling.red = True
+                    node = parent
+                    parent = node.parent
+                else:
+                    if not self._is_red(sibling.left):
+                        sibling.right.red = False
+                        sibling.red = True
+                        self._rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.red = parent.red
+                    parent.red = False
+                    sibling.left.red = False
+                    self._rotate_right(parent)
+                    node = self.root
+                    parent = None
+
+        if node is not None:
+            node.red = False
+
+    def _new_node(self, data: Any) -> Node:
+        """Creates a red node."""
+        return Node(data)
+
+    def _build_subtree(self, values: List[Any], lo: int, hi: int,
+                       depth: int, height: int) -> Optional[Node]:
+        """
+        Builds a balanced subtree, linking parents and coloring the nodes.
+
+        A median split fills every level except possibly the deepest one, so
+        coloring only the deepest level red gives every path the same number
+        of black nodes.
+        """
+        node = super()._build_subtree(values, lo, hi, depth, height)
+        if node is not None:
+            node.red = depth == height and depth > 1
+            if node.left is not None:
+                node.left.parent = node
+            if node.right is not None:
+                node.right.parent = node
+        return node
+
+    @staticmethod
+    def _is_red(node: Optional[Node]) -> bool:
+        """Returns True if the node is red; empty subtrees count as black."""
+        return node is not None and node.red
+
+    def _transplant(self, old: Node, new: Optional[Node]) -> None:
+        """Replaces the subtree rooted at `old` with the subtree rooted at `new`."""
+        if old.parent is None:
+            self.root = new
+        elif old is old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+        if new is not None:
+            new.parent = old.parent
+
+    def _rotate_left(self, node: Node) -> None:
+        """Rotates the subtree rooted at `node` to the left."""
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        self._transplant(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        pivot.size = node.size
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_right(self, node: Node) -> None:
+        """Rotates the subtree rooted at `node` to the right."""
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        self._transplant(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        pivot.size = node.size
+        node.size = 1 + self._size(node.left) + self._size(node.right)
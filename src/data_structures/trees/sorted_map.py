@@ -0,0 +1,235 @@
+"""
+This module contains the implementation of a Sorted Map, a dictionary whose
+keys are kept in sorted order.
+
+The map stores its entries in an AVLTree, ordered by key. A single structure
+therefore serves both point lookups (get/set/delete in O(log n)) and ordered
+scans (iteration, range queries and order statistics), without keeping a
+separate dict alongside the tree.
+"""
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from .avl_tree import AVLTree
+
+_MISSING = object()
+
+class _Entry:
+    """
+    A key-value pair stored as the data of a tree node.
+
+    Entries compare by `sort_key` only, so the tree orders them by key and
+    the value never takes part in comparisons.
+    """
+    __slots__ = ("sort_key", "key", "value")
+
+    def __init__(self, sort_key: Any, key: Any, value: Any = None):
+        self.sort_key = sort_key
+        self.key = key
+        self.value = value
+
+    def __lt__(self, other: '_Entry') -> bool:
+        return self.sort_key < other.sort_key
+
+    def __gt__(self, other: '_Entry') -> bool:
+        return self.sort_key > other.sort_key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Entry) and self.sort_key == other.sort_key
+
+    __hash__ = None
+
+class SortedMap:
+    """
+    A mapping that keeps its keys in sorted order.
+
+    Attributes:
+        key: An optional function applied to each key to obtain its sort key.
+             Two keys whose sort keys compare equal refer to the same entry.
+    """
+    def __init__(self, items: Any = None, key: Optional[Callable[[Any], Any]] = None):
+        """
+        Initializes a sorted map, optionally from a mapping or (key, value) pairs.
+
+        Args:
+            items: A mapping or an iterable of (key, value) pairs to load.
+            key: An optional function mapping each key to its sort key.
+        """
+        self.key: Optional[Callable[[Any], Any]] = key
+        self._tree = AVLTree()
+        if items is not None:
+            self.update(items)
+
+    def _probe(self, key: Any) -> _Entry:
+        """Builds a value-less entry used to look a key up in the tree."""
+        return _Entry(key if self.key is None else self.key(key), key)
+
+    def _find(self, key: Any) -> Optional[_Entry]:
+        """Returns the entry stored under `key`, or None."""
+        node = self._tree.search(self._probe(key))
+        return node.data if node is not None else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries.
+
+        Time Complexity: O(1)
+        """
+        return len(self._tree)
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks whether `key` is in the map.
+
+        Time Complexity: O(log n)
+        """
+        return self._find(key) is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Returns the value stored under `key`.
+
+        Time Complexity: O(log n)
+
+        Raises:
+            KeyError: If the key is not in the map.
+        """
+        entry = self._find(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Stores `value` under `key`, replacing any previous value.
+
+        Time Complexity: O(log n)
+        """
+        probe = self._probe(key)
+        node = self._tree.search(probe)
+        if node is not None:
+            node.data.value = value
+        else:
+            probe.value = value
+            self._tree.insert(probe)
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Removes the entry stored under `key`.
+
+        Time Complexity: O(log n)
+
+        Raises:
+            KeyError: If the key is not in the map.
+        """
+        probe = self._probe(key)
+        if self._tree.search(probe) is None:
+            raise KeyError(key)
+        self._tree.delete(probe)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value stored under `key`, or `default` if it is missing.
+
+        Time Complexity: O(log n)
+        """
+        entry = self._find(key)
+        return entry.value if entry is not None else default
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value stored under `key`, storing `default` first if it is missing.
+
+        Time Complexity: O(log n)
+        """
+        probe = self._probe(key)
+        node = self._tree.search(probe)
+        if node is not None:
+            return node.data.value
+        probe.value = default
+        self._tree.insert(probe)
+        return default
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """
+        Removes `key` and returns its value.
+
+        Time Complexity: O(log n)
+
+        Raises:
+            KeyError: If the key is missing and no default is given.
+        """
+        probe = self._probe(key)
+        node = self._tree.search(probe)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.data.value
+        self._tree.delete(probe)
+        return value
+
+    def update(self, items: Any) -> None:
+        """
+        Stores every (key, value) pair from a mapping or an iterable of pairs.
+
+        Time Complexity: O(m log n) for m pairs.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        for key, value in items:
+            self[key] = value
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys in sorted order."""
+        for entry in self._tree:
+            yield entry.key
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterates over the keys in descending order."""
+        for entry in reversed(self._tree):
+            yield entry.key
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yields the keys in sorted order."""
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yields the values in key order."""
+        for entry in self._tree:
+            yield entry.value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields (key, value) pairs in key order."""
+        for entry in self._tree:
+            yield entry.key, entry.value
+
+    def iter_range(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields the (key, value) pairs with lo <= key <= hi in key order.
+
+        Time Complexity: O(log n + k) for k yielded pairs.
+        Args:
+            lo: The inclusive lower key bound, or None for no lower bound.
+            hi: The inclusive upper key bound, or None for no upper bound.
+        """
+        lo_probe = self._probe(lo) if lo is not None else None
+        hi_probe = self._probe(hi) if hi is not None else None
+        for entry in self._tree.iter_range(lo_probe, hi_probe):
+            yield entry.key, entry.value
+
+    def peekitem(self, index: int = -1) -> Tuple[Any, Any]:
+        """
+        Returns the (key, value) pair at a position in key order.
+
+        Time Complexity: O(log n)
+
+        Raises:
+            IndexError: If the map is empty or the index is out of range.
+        """
+        entry = self._tree.select(index)
+        return entry.key, entry.value
+
+    def __repr__(self) -> str:
+        """Provides a string representation for debugging."""
+        body = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"SortedMap({{{body}}})"
@@ -0,0 +1,227 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.data_structures.advanced.b_plus_tree import (
+    BPlusTree, MemoryPageStore, MmapPageStore, NO_PAGE, Page,
+)
+
+class TestBPlusTree(unittest.TestCase):
+    """
+    A unit test suite for the BPlusTree implementation.
+    """
+    def setUp(self):
+        """Set up a small-order tree so that splits happen early."""
+        self.tree = BPlusTree(order=4)
+
+    def assert_valid(self, tree):
+        """Checks key order, separator bounds, uniform leaf depth and the leaf chain."""
+        store = tree.store
+        leaf_depths = set()
+        leaves = []
+
+        def check(page_id, lo, hi, depth):
+            page = store.read(page_id)
+            self.assertLessEqual(len(page.keys), tree.order)
+            self.assertEqual(page.keys, sorted(page.keys))
+            for key in page.keys:
+                self.assertTrue(lo is None or key >= lo)
+                self.assertTrue(hi is None or key < hi)
+            if page.is_leaf:
+                leaf_depths.add(depth)
+                leaves.append(page_id)
+                return
+            self.assertEqual(len(page.children), len(page.keys) + 1)
+            bounds = [lo] + page.keys + [hi]
+            for i, child in enumerate(page.children):
+                check(child, bounds[i], bounds[i + 1], depth + 1)
+
+        check(store.root, None, None, 0)
+        self.assertEqual(len(leaf_depths), 1)
+        for left, right in zip(leaves, leaves[1:]):
+            self.assertEqual(store.read(left).next, right)
+        self.assertEqual(store.read(leaves[-1]).next, NO_PAGE)
+        self.assertEqual(len(list(tree)), len(tree))
+
+    def test_insert_and_get(self):
+        """Test insertion, replacement and lookup."""
+        for key in [50, 30, 70, 20, 40, 60, 80, 10]:
+            self.tree.insert(key, key * 10)
+        self.tree.insert(30, -1)
+        self.assertEqual(len(self.tree), 8)
+        self.assertEqual(self.tree.get(30), -1)
+        self.assertEqual(self.tree.search(70), 700)
+        self.assertIsNone(self.tree.search(35))
+        self.assertEqual(self.tree.get(35, "missing"), "missing")
+        self.assertIn(80, self.tree)
+        self.assertNotIn(90, self.tree)
+        self.assertEqual(list(self.tree), [10, 20, 30, 40, 50, 60, 70, 80])
+        self.assertGreater(self.tree.height(), 1)
+        self.assert_valid(self.tree)
+
+    def test_range_scan(self):
+        """Test inclusive range scans across leaf boundaries."""
+        for key in range(0, 100, 2):
+            self.tree.insert(key, str(key))
+        self.assertEqual([k for k, _ in self.tree.iter_range(11, 21)], [12, 14, 16, 18, 20])
+        self.assertEqual(list(self.tree.iter_range(96)), [(96, "96"), (98, "98")])
+        self.assertEqual(len(list(self.tree.iter_range(hi=9))), 5)
+        self.assertEqual(list(self.tree.iter_range(200, 300)), [])
+        self.assertEqual(len(list(self.tree.items())), 50)
+
+    def test_delete_is_lazy(self):
+        """Test that deletes remove keys without breaking the structure."""
+        for key in range(40):
+            self.tree.insert(key, key)
+        self.assertTrue(self.tree.delete(7))
+        self.assertFalse(self.tree.delete(7))
+        for key in range(10, 30):
+            self.tree.delete(key)
+        self.assertEqual(len(self.tree), 19)
+        self.assertNotIn(15, self.tree)
+        self.assertEqual([k for k, _ in self.tree.iter_range(5, 32)], [5, 6, 8, 9, 30, 31, 32])
+        self.tree.insert(15, 150)
+        self.assertEqual(self.tree.get(15), 150)
+        self.assert_valid(self.tree)
+
+    def test_random_operations_match_dict(self):
+        """Test random inserts and deletes against a dict."""
+        rng = random.Random(7)
+        reference = {}
+        for _ in range(3000):
+            key = rng.randrange(500)
+            if rng.random() < 0.7:
+                reference[key] = rng.random()
+                self.tree.insert(key, reference[key])
+            else:
+                self.assertEqual(self.tree.delete(key), reference.pop(key, None) is not None)
+        self.assertEqual(list(self.tree.items()), sorted(reference.items()))
+        self.assert_valid(self.tree)
+
+    def test_bulk_load(self):
+        """Test building a tree from sorted pairs."""
+        for count in [0, 1, 4, 5, 21, 26, 500]:
+            tree = BPlusTree(order=4)
+            tree.bulk_load((key, -key) for key in range(count))
+            self.assertEqual(len(tree), count)
+            self.assertEqual(list(tree.items()), [(key, -key) for key in range(count)])
+            if count:
+                self.assert_valid(tree)
+        tree = BPlusTree(order=10)
+        tree.bulk_load(((key, key) for key in range(1000)), fill_factor=0.5)
+        self.assertEqual(tree.get(777), 777)
+        tree.insert(1000, 1000)
+        self.assert_valid(tree)
+
+    def test_bulk_load_errors(self):
+        """Test the preconditions of bulk_load."""
+        with self.assertRaises(ValueError):
+            self.tree.bulk_load([(2, 0), (1, 0)])
+        tree = BPlusTree(order=4)
+        tree.insert(1, 1)
+        with self.assertRaises(ValueError):
+            tree.bulk_load([(2, 2)])
+        with self.assertRaises(ValueError):
+            BPlusTree(order=4).bulk_load([], fill_factor=0)
+
+    def test_bulk_load_out_of_order_leaves_tree_empty(self):
+        """Test that a failed bulk_load leaves an empty, usable tree."""
+        with self.assertRaises(ValueError):
+            self.tree.bulk_load([(1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (3, 3)])
+        self.assertEqual(len(self.tree), 0)
+        self.assertEqual(list(self.tree), [])
+        self.assertEqual(self.tree.height(), 1)
+        self.tree.insert(100, 1)
+        self.assertEqual(list(self.tree.items()), [(100, 1)])
+        self.assert_valid(self.tree)
+        self.tree.delete(100)
+        self.tree.bulk_load((key, key) for key in range(10))
+        self.assertEqual(list(self.tree), list(range(10)))
+
+    def test_bulk_load_after_deleting_everything(self):
+        """Test that bulk_load into an emptied tree reuses the store instead of leaking its pages."""
+        fresh = BPlusTree(order=4)
+        fresh.bulk_load((key, key) for key in range(30))
+        for key in range(50):
+            self.tree.insert(key, key)
+        for key in range(50):
+            self.tree.delete(key)
+        self.tree.bulk_load((key, key) for key in range(30))
+        self.assertEqual(list(self.tree.items()), [(key, key) for key in range(30)])
+        self.assert_valid(self.tree)
+        self.assertEqual(len(self.tree.store._pages), len(fresh.store._pages))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "reload.bpt")
+            with BPlusTree(MmapPageStore(path, page_size=256)) as tree:
+                for key in range(2000):
+                    tree.insert(key, key)
+                for key in range(2000):
+                    tree.delete(key)
+                tree.bulk_load((key, key) for key in range(10))
+            self.assertEqual(os.path.getsize(path), 256 * 16)
+            with BPlusTree(MmapPageStore(path)) as tree:
+                self.assertEqual(list(tree), list(range(10)))
+                self.assertEqual(tree.height(), 1)
+
+    def test_invalid_order(self):
+        """Test that too small or too large orders are rejected."""
+        with self.assertRaises(ValueError):
+            BPlusTree(order=2)
+        with tempfile.TemporaryDirectory() as directory:
+            store = MmapPageStore(os.path.join(directory, "index.bpt"), page_size=256)
+            with self.assertRaises(ValueError):
+                BPlusTree(store, order=store.max_order() + 1)
+            store.close()
+
+    def test_memory_store_is_default(self):
+        """Test the default store and order."""
+        tree = BPlusTree()
+        self.assertIsInstance(tree.store, MemoryPageStore)
+        self.assertEqual(tree.order, 64)
+        self.assertIsInstance(tree.store.read(tree.store.root), Page)
+
+    def test_mmap_store_persists(self):
+        """Test that an mmap-backed tree can be closed and reopened."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.bpt")
+            keys = list(range(-2000, 2000, 3))
+            random.Random(3).shuffle(keys)
+            with BPlusTree(MmapPageStore(path, page_size=512, cache_pages=8)) as tree:
+                self.assertEqual(tree.order, tree.store.max_order())
+                for key in keys:
+                    tree.insert(key, key * 2)
+                tree.delete(1)
+                self.assert_valid(tree)
+
+            with BPlusTree(MmapPageStore(path, cache_pages=8)) as reopened:
+                self.assertEqual(reopened.store.page_size, 512)
+                self.assertEqual(len(reopened), len(keys) - 1)
+                self.assertEqual(reopened.get(-2000), -4000)
+                self.assertIsNone(reopened.get(1))
+                self.assertEqual(list(reopened), sorted(set(keys) - {1}))
+                self.assert_valid(reopened)
+
+    def test_mmap_bulk_load(self):
+        """Test bulk loading into a file-backed store."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bulk.bpt")
+            with BPlusTree(MmapPageStore(path, page_size=256)) as tree:
+                tree.bulk_load((key, key + 1) for key in range(10000))
+            with BPlusTree(MmapPageStore(path)) as tree:
+                self.assertEqual(len(tree), 10000)
+                self.assertEqual([v for _, v in tree.iter_range(5000, 5002)], [5001, 5002, 5003])
+                self.assertEqual(tree.height(), 4)
+
+    def test_mmap_rejects_other_files(self):
+        """Test that a file without the page-file header is rejected."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "junk.bin")
+            with open(path, "wb") as handle:
+                handle.write(b"not a tree" * 100)
+            with self.assertRaises(ValueError):
+                MmapPageStore(path)
+
+if __name__ == '__main__':
+    unittest.main()
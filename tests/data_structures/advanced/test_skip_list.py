@@ -0,0 +1,130 @@
+import random
+import threading
+import unittest
+
+from src.data_structures.advanced.skip_list import SkipList, Node
+
+class TestSkipList(unittest.TestCase):
+    """
+    A unit test suite for the SkipList implementation.
+    """
+    def setUp(self):
+        """Set up a new, empty skip list for each test."""
+        self.skip = SkipList(seed=42)
+
+    def assert_valid(self, skip):
+        """Checks that every lane is sorted and that link widths add up."""
+        keys = list(skip)
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(len(keys), len(skip))
+        position_of = {key: index + 1 for index, key in enumerate(keys)}
+        for lane in range(skip.level):
+            node, position = skip.head, 0
+            while node is not None:
+                nxt = node.forward[lane]
+                target = position_of[nxt.key] if nxt is not None else len(keys) + 1
+                self.assertEqual(node.width[lane], target - position)
+                node, position = nxt, target
+
+    def test_insert_and_search(self):
+        """Test basic insertion, duplicates and search."""
+        for value in [50, 30, 70, 20, 40]:
+            self.assertTrue(self.skip.insert(value))
+        self.assertFalse(self.skip.insert(30))
+        self.assertIsInstance(self.skip.search(40), Node)
+        self.assertIsNone(self.skip.search(45))
+        self.assertIn(70, self.skip)
+        self.assertNotIn(99, self.skip)
+        self.assertEqual(list(self.skip), [20, 30, 40, 50, 70])
+        self.assert_valid(self.skip)
+
+    def test_delete(self):
+        """Test deleting present and missing keys."""
+        for value in range(20):
+            self.skip.insert(value)
+        self.assertTrue(self.skip.delete(0))
+        self.assertTrue(self.skip.delete(10))
+        self.assertTrue(self.skip.delete(19))
+        self.assertFalse(self.skip.delete(10))
+        self.assertEqual(len(self.skip), 17)
+        self.assert_valid(self.skip)
+        for value in list(self.skip):
+            self.skip.delete(value)
+        self.assertEqual(list(self.skip), [])
+        self.assertEqual(self.skip.level, 1)
+
+    def test_rank_and_select(self):
+        """Test order-statistic queries."""
+        for value in range(0, 100, 5):
+            self.skip.insert(value)
+        self.assertEqual(self.skip.rank(0), 0)
+        self.assertEqual(self.skip.rank(12), 3)
+        self.assertEqual(self.skip.rank(1000), 20)
+        self.assertEqual(self.skip.select(0), 0)
+        self.assertEqual(self.skip.select(7), 35)
+        self.assertEqual(self.skip.select(-1), 95)
+        with self.assertRaises(IndexError):
+            self.skip.select(20)
+
+    def test_iter_range(self):
+        """Test inclusive range scans with open and closed bounds."""
+        for value in range(10):
+            self.skip.insert(value)
+        self.assertEqual(list(self.skip.iter_range(3, 6)), [3, 4, 5, 6])
+        self.assertEqual(list(self.skip.iter_range(hi=2)), [0, 1, 2])
+        self.assertEqual(list(self.skip.iter_range(lo=8)), [8, 9])
+        self.assertEqual(list(self.skip.iter_range(20, 30)), [])
+
+    def test_random_operations(self):
+        """Test a random workload against a reference set."""
+        rng = random.Random(3)
+        reference = set()
+        for _ in range(3000):
+            value = rng.randrange(500)
+            if rng.random() < 0.6:
+                self.assertEqual(self.skip.insert(value), value not in reference)
+                reference.add(value)
+            else:
+                self.assertEqual(self.skip.delete(value), value in reference)
+                reference.discard(value)
+        self.assert_valid(self.skip)
+        ordered = sorted(reference)
+        self.assertEqual([self.skip.select(k) for k in range(len(ordered))], ordered)
+
+    def test_concurrent_readers_and_writer(self):
+        """Test that lock-free scans stay sorted while writers modify the list."""
+        skip = SkipList(thread_safe=True, seed=1)
+        for value in range(0, 2000, 2):
+            skip.insert(value)
+        errors = []
+        done = threading.Event()
+
+        def writer(values):
+            for value in values:
+                skip.insert(value)
+                skip.delete(value - 1)
+
+        def reader():
+            while not done.is_set():
+                keys = list(skip.iter_range(100, 1900))
+                if keys != sorted(keys) or len(set(keys)) != len(keys):
+                    errors.append(keys)
+                # Even keys below 1000 are never deleted.
+                if 500 not in skip:
+                    errors.append("lost key")
+
+        readers = [threading.Thread(target=reader) for _ in range(3)]
+        writers = [threading.Thread(target=writer, args=(range(start, 2000, 8),))
+                   for start in (1001, 1003, 1005, 1007)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assert_valid(skip)
+        expected = list(range(0, 1000, 2)) + list(range(1001, 2000, 2))
+        self.assertEqual(list(skip), expected)
@@ -0,0 +1,105 @@
+# tests\data_structures\fundamentals\linked_lists\test_array_linked_list.py
+
+"""
+to test run the below on the root dir
+pytest tests/data_structures/fundamentals/linked_lists/test_array_linked_list.py
+"""
+
+import unittest
+
+from src.data_structures.fundamentals.linked_lists.array_linked_list import ArrayLinkedList, NIL
+
+class TestArrayLinkedList(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new, empty list for each test."""
+        self.all = ArrayLinkedList()
+
+    def test_empty_list(self):
+        """Test the state of a new list. 🗑️"""
+        self.assertTrue(self.all.is_empty())
+        self.assertEqual(len(self.all), 0)
+        self.assertEqual(self.all.head, NIL)
+        self.assertEqual(self.all.tail, NIL)
+        self.assertEqual(list(self.all), [])
+
+    def test_append_and_prepend(self):
+        """Test adding values at both ends. ➕"""
+        self.all.append(2)
+        self.all.append(3)
+        self.all.prepend(1)
+        self.assertEqual(list(self.all), [1, 2, 3])
+        self.assertEqual(self.all.get(self.all.head), 1)
+        self.assertEqual(self.all.get(self.all.tail), 3)
+        self.assertEqual(len(self.all), 3)
+
+    def test_find_and_contains(self):
+        """Test value lookups. 🔎"""
+        self.all.append("a")
+        slot = self.all.append("b")
+        self.assertEqual(self.all.find("b"), slot)
+        self.assertIsNone(self.all.find("z"))
+        self.assertIn("a", self.all)
+        self.assertNotIn("z", self.all)
+
+    def test_insert_after(self):
+        """Test inserting after a slot in the middle and at the tail. 🩹"""
+        first = self.all.append(1)
+        self.all.append(3)
+        self.all.insert_after(first, 2)
+        last = self.all.insert_after(self.all.tail, 4)
+        self.assertEqual(list(self.all), [1, 2, 3, 4])
+        self.assertEqual(self.all.tail, last)
+
+    def test_insert_after_raises_error(self):
+        """Test that insert_after rejects None and dead slots. 🚨"""
+        with self.assertRaises(ValueError):
+            self.all.insert_after(None, 1)
+        slot = self.all.append(1)
+        self.all.remove(slot)
+        with self.assertRaises(ValueError):
+            self.all.insert_after(slot, 2)
+
+    def test_delete(self):
+        """Test deleting the head, a middle value, the tail and a missing value. ✂️"""
+        for value in range(5):
+            self.all.append(value)
+        self.all.delete(0)
+        self.all.delete(2)
+        self.all.delete(4)
+        self.all.delete(99)
+        self.assertEqual(list(self.all), [1, 3])
+        self.assertEqual(self.all.get(self.all.head), 1)
+        self.assertEqual(self.all.get(self.all.tail), 3)
+        self.all.delete(1)
+        self.all.delete(3)
+        self.assertTrue(self.all.is_empty())
+        self.assertEqual(self.all.head, NIL)
+        self.assertEqual(self.all.tail, NIL)
+
+    def test_slots_are_recycled(self):
+        """Test that freed slots are reused instead of growing the buffers. ♻️"""
+        slots = [self.all.append(value) for value in range(10)]
+        for slot in slots[:5]:
+            self.all.remove(slot)
+        for value in range(5):
+            self.all.append(value)
+        self.assertEqual(len(self.all._data), 10)
+        self.assertEqual(list(self.all), [5, 6, 7, 8, 9, 0, 1, 2, 3, 4])
+
+    def test_reverse(self):
+        """Test reversing the list and then modifying it. 🔄"""
+        for value in range(4):
+            self.all.append(value)
+        self.all.reverse()
+        self.assertEqual(list(self.all), [3, 2, 1, 0])
+        self.all.append(-1)
+        self.all.prepend(4)
+        self.all.delete(1)
+        self.assertEqual(list(self.all), [4, 3, 2, 0, -1])
+
+    def test_repr(self):
+        """Test the string representation. 📝"""
+        self.all.append(1)
+        self.all.append(2)
+        self.assertEqual(repr(self.all), "1 <-> 2")
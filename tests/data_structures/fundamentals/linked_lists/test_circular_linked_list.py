@@ -127,6 +127,167 @@ class TestCircularLinkedList(unittest.TestCase):
         values = [node.data for node in self.cll]
         self.assertEqual(values, [1, 2, 3])
 
+    def test_values_and_to_list(self):
+        """Test value iteration without touching nodes. 📋"""
+        self.assertEqual(self.cll.to_list(), [])
+        for value in [1, 2, 3]:
+            self.cll.append(value)
+        self.assertEqual(list(self.cll.values()), [1, 2, 3])
+        self.assertEqual(self.cll.to_list(), [1, 2, 3])
+
+    def test_extend(self):
+        """Test appending a batch of values in one pass. ➕➕"""
+        self.cll.extend([])
+        self.assertTrue(self.cll.is_empty())
+        self.cll.extend(range(3))
+        self.cll.append(3)
+        self.cll.extend(iter([4, 5]))
+        self.assertEqual(self.cll.to_list(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(len(self.cll), 6)
+        other = CircularLinkedList()
+        other.extend(self.cll)
+        self.assertEqual(other.to_list(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(self.cll[-1], 5)
+        self.assertIs(self.cll.find(5).next, self.cll.head)
+
+    def test_getitem(self):
+        """Test positive, negative and out-of-range indices. 🔢"""
+        self.cll.extend(range(10))
+        self.assertEqual(self.cll[0], 0)
+        self.assertEqual(self.cll[3], 3)
+        self.assertEqual(self.cll[8], 8)
+        self.assertEqual(self.cll[-1], 9)
+        self.assertEqual(self.cll[-10], 0)
+        with self.assertRaises(IndexError):
+            self.cll[10]
+        with self.assertRaises(IndexError):
+            self.cll[-11]
+
+    def test_slicing(self):
+        """Test that slices return a new list of the same type. ✂️"""
+        self.cll.extend(range(10))
+        part = self.cll[2:5]
+        self.assertIsInstance(part, CircularLinkedList)
+        self.assertEqual(part.to_list(), [2, 3, 4])
+        self.assertEqual(self.cll[::3].to_list(), [0, 3, 6, 9])
+        self.assertEqual(self.cll[::-2].to_list(), [9, 7, 5, 3, 1])
+        self.assertEqual(self.cll[-3:].to_list(), [7, 8, 9])
+        self.assertEqual(self.cll[5:2].to_list(), [])
+        self.assertEqual(len(self.cll), 10)
+
+    def test_indexed_find_contains_delete(self):
+        """Test that an indexed list answers lookups and deletes from its index. 🗂️"""
+        lst = CircularLinkedList(indexed=True)
+        lst.extend(["a", "b", "c"])
+        lst.append("d")
+        lst.prepend("z")
+        self.assertIn("c", lst)
+        self.assertNotIn("q", lst)
+        self.assertEqual(lst.find("b").data, "b")
+        self.assertIsNone(lst.find("q"))
+        for value in ["z", "c", "d", "q"]:
+            lst.delete(value)
+        self.assertEqual(lst.to_list(), ["a", "b"])
+        self.assertEqual(len(lst), 2)
+        self.assertNotIn("z", lst)
+        self.assertEqual(lst.find("b").next.data, "a")
+        lst.delete("a")
+        lst.delete("b")
+        self.assertTrue(lst.is_empty())
+        self.assertEqual(lst._index, {})
+
+    def test_indexed_matches_scanning(self):
+        """Test that indexed and scanning lists agree on a mixed workload. ⚖️"""
+        indexed = CircularLinkedList(indexed=True)
+        scanning = CircularLinkedList()
+        for lst in (indexed, scanning):
+            lst.extend(range(0, 20, 2))
+            lst.prepend(-1)
+            lst.append(99)
+            for value in (0, 99, -1, 10, 7):
+                lst.delete(value)
+        self.assertEqual(indexed.to_list(), scanning.to_list())
+        for value in range(-2, 101):
+            self.assertEqual(value in indexed, value in scanning)
+
+    def assert_ring(self, lst):
+        """Checks that the tail closes the ring and the index records every predecessor."""
+        nodes = list(lst)
+        self.assertEqual(len(nodes), len(lst))
+        if not nodes:
+            self.assertIsNone(lst.head)
+            self.assertIsNone(lst.tail)
+            return
+        self.assertIs(lst.tail, nodes[-1])
+        self.assertIs(lst.tail.next, lst.head)
+        if lst.indexed:
+            for prev, node in zip([nodes[-1]] + nodes[:-1], nodes):
+                self.assertIs(lst._index[node.data][node], prev)
+
+    def test_tail_tracking(self):
+        """Test that the tail follows appends, prepends and deletes. 🎯"""
+        for lst in (CircularLinkedList(), CircularLinkedList(indexed=True)):
+            lst.append(1)
+            self.assert_ring(lst)
+            lst.prepend(0)
+            lst.extend([2, 3])
+            self.assert_ring(lst)
+            lst.delete(3)
+            self.assert_ring(lst)
+            self.assertEqual(lst.tail.data, 2)
+            lst.delete(0)
+            self.assert_ring(lst)
+            self.assertEqual(lst.to_list(), [1, 2])
+            lst.delete(1)
+            lst.delete(2)
+            self.assert_ring(lst)
+
+    def test_advance(self):
+        """Test cycling through the ring with advance. 🔁"""
+        with self.assertRaises(IndexError):
+            self.cll.advance()
+        self.cll.extend(["a", "b", "c"])
+        self.assertEqual([self.cll.advance() for _ in range(7)], list("abcabca"))
+        self.assertEqual(self.cll.to_list(), ["b", "c", "a"])
+        self.cll.append("d")
+        self.assertEqual(self.cll.to_list(), ["b", "c", "a", "d"])
+        self.assert_ring(self.cll)
+
+    def test_rotate(self):
+        """Test moving the head forward and backward. 🔄"""
+        self.cll.rotate(3)
+        self.cll.extend(range(5))
+        self.cll.rotate(2)
+        self.assertEqual(self.cll.to_list(), [2, 3, 4, 0, 1])
+        self.cll.rotate(-1)
+        self.assertEqual(self.cll.to_list(), [1, 2, 3, 4, 0])
+        self.cll.rotate(10)
+        self.assertEqual(self.cll.to_list(), [1, 2, 3, 4, 0])
+        self.assertEqual(self.cll[-1], 0)
+        self.assert_ring(self.cll)
+
+    def test_pop_current(self):
+        """Test removing the head as a scheduler would. ⏏️"""
+        with self.assertRaises(IndexError):
+            self.cll.pop_current()
+        lst = CircularLinkedList(indexed=True)
+        lst.extend(range(6))
+        order = []
+        while lst:
+            lst.advance()
+            order.append(lst.pop_current())
+            self.assert_ring(lst)
+        self.assertEqual(order, [1, 3, 5, 2, 0, 4])
+        self.assertEqual(lst._index, {})
+
+    def test_node_is_slotted(self):
+        """Test that nodes use a compact __slots__ layout without a __dict__. 🧱"""
+        self.cll.append(1)
+        node = self.cll.find(1)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = True
+
 class TestRunner:
     """A custom test runner for a more visual and structured output."""
     def run_tests_with_visuals(self):
@@ -208,6 +208,169 @@ class TestDoublyLinkedList(unittest.TestCase):
         self.assertEqual(self.dll.tail.prev.data, "World")
         self._log_status("Test Multiple Data Types", "✅ PASSED")
 
+    def test_len_is_maintained(self):
+        """Test that the size counter follows every kind of update. 📏"""
+        node = self.dll.append(2)
+        self.dll.prepend(1)
+        self.dll.insert_after(node, 3)
+        self.assertEqual(len(self.dll), 3)
+        self.assertEqual(self.dll.size, 3)
+        self.dll.delete(99)
+        self.dll.remove_node(node)
+        self.assertEqual(len(self.dll), 2)
+        self._log_status("Test Length Maintained", "✅ PASSED")
+
+    def test_remove_node(self):
+        """Test removing nodes by reference from the head, middle and tail. ✂️"""
+        first = self.dll.append(1)
+        middle = self.dll.append(2)
+        last = self.dll.append(3)
+        self.assertEqual(self.dll.remove_node(middle), 2)
+        self.assertIs(first.next, last)
+        self.assertIs(last.prev, first)
+        self.assertIsNone(middle.next)
+        self.assertIsNone(middle.prev)
+        self.dll.remove_node(first)
+        self.assertIs(self.dll.head, last)
+        self.dll.remove_node(last)
+        self.assertTrue(self.dll.is_empty())
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+        with self.assertRaises(ValueError):
+            self.dll.remove_node(None)
+        self._log_status("Test Remove Node", "✅ PASSED")
+
+    def test_remove_node_twice(self):
+        """Test that a removed node cannot be removed, moved or inserted after. 🚫"""
+        for value in range(3):
+            self.dll.append(value)
+        node = self.dll.find(1)
+        self.dll.remove_node(node)
+        with self.assertRaises(ValueError):
+            self.dll.remove_node(node)
+        with self.assertRaises(ValueError):
+            self.dll.move_to_front(node)
+        with self.assertRaises(ValueError):
+            self.dll.move_to_end(node)
+        with self.assertRaises(ValueError):
+            self.dll.insert_after(node, 3)
+        self.assertEqual(self.dll.to_list(), [0, 2])
+        self.assertEqual(len(self.dll), 2)
+        self._log_status("Test Remove Node Twice", "✅ PASSED")
+
+    def test_move_to_front_and_end(self):
+        """Test moving nodes to either end of the list. 🔀"""
+        nodes = [self.dll.append(value) for value in range(4)]
+        self.dll.move_to_front(nodes[2])
+        self.assertEqual([node.data for node in self.dll], [2, 0, 1, 3])
+        self.dll.move_to_end(nodes[0])
+        self.assertEqual([node.data for node in self.dll], [2, 1, 3, 0])
+        self.dll.move_to_end(nodes[0])
+        self.dll.move_to_front(nodes[2])
+        self.dll.move_to_front(nodes[0])
+        self.assertEqual([node.data for node in self.dll], [0, 2, 1, 3])
+        self.assertIsNone(self.dll.head.prev)
+        self.assertIsNone(self.dll.tail.next)
+        self.assertEqual(self.dll.tail.prev.data, 1)
+        self.assertEqual(len(self.dll), 4)
+        with self.assertRaises(ValueError):
+            self.dll.move_to_front(None)
+        self._log_status("Test Move To Front/End", "✅ PASSED")
+
+    def test_values_and_to_list(self):
+        """Test value iteration without touching nodes. 📋"""
+        self.assertEqual(self.dll.to_list(), [])
+        for value in [1, 2, 3]:
+            self.dll.append(value)
+        self.assertEqual(list(self.dll.values()), [1, 2, 3])
+        self.assertEqual(self.dll.to_list(), [1, 2, 3])
+
+    def test_extend(self):
+        """Test appending a batch of values in one pass. ➕➕"""
+        self.dll.extend([])
+        self.assertTrue(self.dll.is_empty())
+        self.dll.extend(range(3))
+        self.dll.append(3)
+        self.dll.extend(iter([4, 5]))
+        self.assertEqual(self.dll.to_list(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(len(self.dll), 6)
+        other = DoublyLinkedList()
+        other.extend(self.dll)
+        self.assertEqual(other.to_list(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(self.dll.tail.data, 5)
+        self.assertEqual(self.dll.tail.prev.data, 4)
+        self.assertEqual(list(self.dll.values(reverse=True)), [5, 4, 3, 2, 1, 0])
+
+    def test_getitem(self):
+        """Test positive, negative and out-of-range indices. 🔢"""
+        self.dll.extend(range(10))
+        self.assertEqual(self.dll[0], 0)
+        self.assertEqual(self.dll[3], 3)
+        self.assertEqual(self.dll[8], 8)
+        self.assertEqual(self.dll[-1], 9)
+        self.assertEqual(self.dll[-10], 0)
+        with self.assertRaises(IndexError):
+            self.dll[10]
+        with self.assertRaises(IndexError):
+            self.dll[-11]
+
+    def test_slicing(self):
+        """Test that slices return a new list of the same type. ✂️"""
+        self.dll.extend(range(10))
+        part = self.dll[2:5]
+        self.assertIsInstance(part, DoublyLinkedList)
+        self.assertEqual(part.to_list(), [2, 3, 4])
+        self.assertEqual(self.dll[::3].to_list(), [0, 3, 6, 9])
+        self.assertEqual(self.dll[::-2].to_list(), [9, 7, 5, 3, 1])
+        self.assertEqual(self.dll[-3:].to_list(), [7, 8, 9])
+        self.assertEqual(self.dll[5:2].to_list(), [])
+        self.assertEqual(len(self.dll), 10)
+
+    def test_indexed_find_contains_delete(self):
+        """Test that an indexed list answers lookups and deletes from its index. 🗂️"""
+        lst = DoublyLinkedList(indexed=True)
+        lst.extend(["a", "b", "c"])
+        lst.append("d")
+        lst.prepend("z")
+        self.assertIn("c", lst)
+        self.assertNotIn("q", lst)
+        self.assertEqual(lst.find("b").data, "b")
+        self.assertIsNone(lst.find("q"))
+        for value in ["z", "c", "d", "q"]:
+            lst.delete(value)
+        self.assertEqual(lst.to_list(), ["a", "b"])
+        self.assertEqual(len(lst), 2)
+        self.assertNotIn("z", lst)
+        self.assertIsNone(lst.find("b").next)
+        lst.delete("a")
+        lst.delete("b")
+        self.assertTrue(lst.is_empty())
+        self.assertEqual(lst._index, {})
+
+    def test_indexed_matches_scanning(self):
+        """Test that indexed and scanning lists agree on a mixed workload. ⚖️"""
+        indexed = DoublyLinkedList(indexed=True)
+        scanning = DoublyLinkedList()
+        for lst in (indexed, scanning):
+            lst.extend(range(0, 20, 2))
+            lst.prepend(-1)
+            lst.append(99)
+            lst.insert_after(lst.find(4), 5)
+            lst.remove_node(lst.find(8))
+            for value in (0, 99, -1, 10, 7):
+                lst.delete(value)
+        self.assertEqual(indexed.to_list(), scanning.to_list())
+        for value in range(-2, 101):
+            self.assertEqual(value in indexed, value in scanning)
+
+    def test_node_is_slotted(self):
+        """Test that nodes use a compact __slots__ layout without a __dict__. 🧱"""
+        self.dll.append(1)
+        node = self.dll.find(1)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = True
+
 class TestRunner:
     """A class to run tests with visual feedback and delays."""
     
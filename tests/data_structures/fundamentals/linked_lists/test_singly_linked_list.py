@@ -187,6 +187,98 @@ class TestSinglyLinkedList(unittest.TestCase):
         self.assertIsNone(self.sll.tail)
         self.assertEqual(len(self.sll), 0)
 
+    def test_values_and_to_list(self):
+        """Test value iteration without touching nodes. 📋"""
+        self.assertEqual(self.sll.to_list(), [])
+        for value in [1, 2, 3]:
+            self.sll.append(value)
+        self.assertEqual(list(self.sll.values()), [1, 2, 3])
+        self.assertEqual(self.sll.to_list(), [1, 2, 3])
+
+    def test_extend(self):
+        """Test appending a batch of values in one pass. ➕➕"""
+        self.sll.extend([])
+        self.assertTrue(self.sll.is_empty())
+        self.sll.extend(range(3))
+        self.sll.append(3)
+        self.sll.extend(iter([4, 5]))
+        self.assertEqual(self.sll.to_list(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(len(self.sll), 6)
+        other = SinglyLinkedList()
+        other.extend(self.sll)
+        self.assertEqual(other.to_list(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(self.sll.tail.data, 5)
+        self.assertIsNone(self.sll.tail.next)
+
+    def test_getitem(self):
+        """Test positive, negative and out-of-range indices. 🔢"""
+        self.sll.extend(range(10))
+        self.assertEqual(self.sll[0], 0)
+        self.assertEqual(self.sll[3], 3)
+        self.assertEqual(self.sll[8], 8)
+        self.assertEqual(self.sll[-1], 9)
+        self.assertEqual(self.sll[-10], 0)
+        with self.assertRaises(IndexError):
+            self.sll[10]
+        with self.assertRaises(IndexError):
+            self.sll[-11]
+
+    def test_slicing(self):
+        """Test that slices return a new list of the same type. ✂️"""
+        self.sll.extend(range(10))
+        part = self.sll[2:5]
+        self.assertIsInstance(part, SinglyLinkedList)
+        self.assertEqual(part.to_list(), [2, 3, 4])
+        self.assertEqual(self.sll[::3].to_list(), [0, 3, 6, 9])
+        self.assertEqual(self.sll[::-2].to_list(), [9, 7, 5, 3, 1])
+        self.assertEqual(self.sll[-3:].to_list(), [7, 8, 9])
+        self.assertEqual(self.sll[5:2].to_list(), [])
+        self.assertEqual(len(self.sll), 10)
+
+    def test_indexed_find_contains_delete(self):
+        """Test that an indexed list answers lookups and deletes from its index. 🗂️"""
+        lst = SinglyLinkedList(indexed=True)
+        lst.extend(["a", "b", "c"])
+        lst.append("d")
+        lst.prepend("z")
+        self.assertIn("c", lst)
+        self.assertNotIn("q", lst)
+        self.assertEqual(lst.find("b").data, "b")
+        self.assertIsNone(lst.find("q"))
+        for value in ["z", "c", "d", "q"]:
+            lst.delete(value)
+        self.assertEqual(lst.to_list(), ["a", "b"])
+        self.assertEqual(len(lst), 2)
+        self.assertNotIn("z", lst)
+        self.assertIsNone(lst.find("b").next)
+        lst.delete("a")
+        lst.delete("b")
+        self.assertTrue(lst.is_empty())
+        self.assertEqual(lst._index, {})
+
+    def test_indexed_matches_scanning(self):
+        """Test that indexed and scanning lists agree on a mixed workload. ⚖️"""
+        indexed = SinglyLinkedList(indexed=True)
+        scanning = SinglyLinkedList()
+        for lst in (indexed, scanning):
+            lst.extend(range(0, 20, 2))
+            lst.prepend(-1)
+            lst.append(99)
+            lst.insert_after(lst.find(4), 5)
+            for value in (0, 99, -1, 10, 7):
+                lst.delete(value)
+        self.assertEqual(indexed.to_list(), scanning.to_list())
+        for value in range(-2, 101):
+            self.assertEqual(value in indexed, value in scanning)
+
+    def test_node_is_slotted(self):
+        """Test that nodes use a compact __slots__ layout without a __dict__. 🧱"""
+        self.sll.append(1)
+        node = self.sll.find(1)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = True
+
 # The following code is for running the tests with visual output.
 class TestRunner:
     """A class to run tests with visual feedback and delays."""
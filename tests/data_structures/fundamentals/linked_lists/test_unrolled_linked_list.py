@@ -0,0 +1,130 @@
+# tests\data_structures\fundamentals\linked_lists\test_unrolled_linked_list.py
+
+"""
+to test run the below on the root dir
+pytest tests/data_structures/fundamentals/linked_lists/test_unrolled_linked_list.py
+"""
+
+import random
+import unittest
+
+from src.data_structures.fundamentals.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+class TestUnrolledLinkedList(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new, empty list with small blocks for each test."""
+        self.ull = UnrolledLinkedList(capacity=4)
+
+    def assert_blocks(self):
+        """Checks block capacities, the half-full invariant and the tail pointer."""
+        node = self.ull.head
+        last = None
+        while node is not None:
+            self.assertLessEqual(len(node.items), self.ull.capacity)
+            if node.next is not None:
+                self.assertGreaterEqual(len(node.items), self.ull.capacity // 2)
+            last, node = node, node.next
+        self.assertIs(self.ull.tail, last)
+
+    def test_invalid_capacity(self):
+        """Test that blocks must hold at least two elements. 🚨"""
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(capacity=1)
+
+    def test_append_packs_blocks(self):
+        """Test that sequential appends fill blocks completely. ➕"""
+        self.ull.extend(range(10))
+        self.assertEqual(self.ull.to_list(), list(range(10)))
+        self.assertEqual(len(self.ull), 10)
+        self.assertEqual(len(self.ull.head.items), 4)
+        self.assertEqual(len(self.ull.tail.items), 2)
+        self.assert_blocks()
+
+    def test_prepend(self):
+        """Test prepending past a block boundary. ➡️"""
+        for value in range(6):
+            self.ull.prepend(value)
+        self.assertEqual(list(self.ull), [5, 4, 3, 2, 1, 0])
+        self.assert_blocks()
+
+    def test_indexing(self):
+        """Test reading and writing by position. 🔢"""
+        self.ull.extend(range(10))
+        self.assertEqual(self.ull[0], 0)
+        self.assertEqual(self.ull[5], 5)
+        self.assertEqual(self.ull[-1], 9)
+        self.ull[5] = 50
+        self.assertEqual(self.ull[5], 50)
+        with self.assertRaises(IndexError):
+            self.ull[10]
+        with self.assertRaises(IndexError):
+            UnrolledLinkedList()[0]
+
+    def test_insert_and_insert_after(self):
+        """Test positional inserts that split full blocks. 🩹"""
+        self.ull.extend([0, 1, 2, 3])
+        self.ull.insert(1, "a")
+        self.ull.insert_after(self.ull.find(3), "b")
+        self.ull.insert(100, "end")
+        self.ull.insert(-100, "start")
+        self.assertEqual(self.ull.to_list(), ["start", 0, "a", 1, 2, 3, "b", "end"])
+        with self.assertRaises(ValueError):
+            self.ull.insert_after(None, "x")
+        self.assert_blocks()
+
+    def test_delete_find_and_contains(self):
+        """Test value lookups and deletes that merge or borrow blocks. ✂️"""
+        self.ull.extend(range(12))
+        self.assertEqual(self.ull.find(7), 7)
+        self.assertIsNone(self.ull.find(99))
+        for value in [0, 1, 5, 11, 99]:
+            self.ull.delete(value)
+            self.assert_blocks()
+        self.assertEqual(self.ull.to_list(), [2, 3, 4, 6, 7, 8, 9, 10])
+        self.assertIn(6, self.ull)
+        self.assertNotIn(5, self.ull)
+        for value in self.ull.to_list():
+            self.ull.delete(value)
+        self.assertTrue(self.ull.is_empty())
+        self.assertIsNone(self.ull.head)
+        self.assertIsNone(self.ull.tail)
+
+    def test_pop(self):
+        """Test popping from either end and the middle. 🔄"""
+        self.ull.extend(range(9))
+        self.assertEqual(self.ull.pop(), 8)
+        self.assertEqual(self.ull.pop(0), 0)
+        self.assertEqual(self.ull.pop(3), 4)
+        self.assertEqual(self.ull.to_list(), [1, 2, 3, 5, 6, 7])
+        self.assert_blocks()
+
+    def test_random_operations(self):
+        """Test a random workload against a Python list. 🎲"""
+        rng = random.Random(5)
+        reference = []
+        for _ in range(2000):
+            choice = rng.random()
+            value = rng.randrange(50)
+            if choice < 0.3:
+                self.ull.append(value)
+                reference.append(value)
+            elif choice < 0.6:
+                index = rng.randrange(len(reference) + 1)
+                self.ull.insert(index, value)
+                reference.insert(index, value)
+            elif choice < 0.8:
+                self.ull.delete(value)
+                if value in reference:
+                    reference.remove(value)
+            elif reference:
+                index = rng.randrange(len(reference))
+                self.assertEqual(self.ull.pop(index), reference.pop(index))
+        self.assertEqual(self.ull.to_list(), reference)
+        self.assertEqual(len(self.ull), len(reference))
+        self.assert_blocks()
+
+    def test_repr(self):
+        """Test the string representation. 📝"""
+        self.ull.extend([1, 2])
+        self.assertEqual(repr(self.ull), "1 -> 2")
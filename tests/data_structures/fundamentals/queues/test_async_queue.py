@@ -0,0 +1,92 @@
+# tests\data_structures\fundamentals\queues\test_async_queue.py
+
+"""
+to test run the below on the root dir
+pytest tests/data_structures/fundamentals/queues/test_async_queue.py
+"""
+
+import asyncio
+import unittest
+
+from src.data_structures.fundamentals.queues.async_queue import AsyncDeque, AsyncQueue
+
+class TestAsyncQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fifo_and_nowait(self):
+        """Test FIFO order and the non-waiting methods. ➡️"""
+        aqueue = AsyncQueue(2)
+        await aqueue.put(1)
+        aqueue.put_nowait(2)
+        self.assertTrue(aqueue.full())
+        with self.assertRaises(asyncio.QueueFull):
+            aqueue.put_nowait(3)
+        self.assertEqual(await aqueue.get(), 1)
+        self.assertEqual(aqueue.get_nowait(), 2)
+        with self.assertRaises(asyncio.QueueEmpty):
+            aqueue.get_nowait()
+        self.assertTrue(aqueue.empty())
+
+    async def test_backpressure(self):
+        """Test that a producer is suspended until a consumer makes room. 🛑"""
+        aqueue = AsyncQueue(1)
+        await aqueue.put("first")
+        producer = asyncio.create_task(aqueue.put("second"))
+        await asyncio.sleep(0.01)
+        self.assertFalse(producer.done())
+        self.assertEqual(await aqueue.get(), "first")
+        await asyncio.wait_for(producer, 1)
+        self.assertEqual(len(aqueue), 1)
+
+    async def test_consumer_waits_for_items(self):
+        """Test that get waits for a later put. ⏳"""
+        aqueue = AsyncQueue(4)
+        consumer = asyncio.create_task(aqueue.get())
+        await asyncio.sleep(0.01)
+        self.assertFalse(consumer.done())
+        aqueue.put_nowait("item")
+        self.assertEqual(await asyncio.wait_for(consumer, 1), "item")
+
+    async def test_batched_pipeline(self):
+        """Test put_many and get_many through a small queue. 📦"""
+        aqueue = AsyncQueue(32)
+        total = 10000
+
+        async def consumer():
+            received = []
+            while len(received) < total:
+                received.extend(await aqueue.get_many(50))
+            return received
+
+        task = asyncio.create_task(consumer())
+        for start in range(0, total, 500):
+            await aqueue.put_many(range(start, start + 500))
+        self.assertEqual(await asyncio.wait_for(task, 5), list(range(total)))
+
+    async def test_cancelled_waiter(self):
+        """Test that a cancelled getter does not swallow an item. ✂️"""
+        aqueue = AsyncQueue(2)
+        cancelled = asyncio.create_task(aqueue.get())
+        waiting = asyncio.create_task(aqueue.get())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        aqueue.put_nowait("item")
+        self.assertEqual(await asyncio.wait_for(waiting, 1), "item")
+
+    async def test_deque_ends(self):
+        """Test both ends of an AsyncDeque. ↔️"""
+        adeque = AsyncDeque(3)
+        await adeque.put(2)
+        await adeque.put_front(1)
+        adeque.put_front_nowait(0)
+        with self.assertRaises(asyncio.QueueFull):
+            adeque.put_front_nowait(-1)
+        self.assertEqual(await adeque.get_back(), 2)
+        self.assertEqual(adeque.get_back_nowait(), 1)
+        self.assertEqual(await adeque.get(), 0)
+        with self.assertRaises(asyncio.QueueEmpty):
+            adeque.get_back_nowait()
+        self.assertEqual(repr(adeque), "AsyncDeque([], capacity=3)")
+
+if __name__ == '__main__':
+    unittest.main()
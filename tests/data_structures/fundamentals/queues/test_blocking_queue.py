@@ -0,0 +1,125 @@
+# tests\data_structures\fundamentals\queues\test_blocking_queue.py
+
+"""
+to test run the below on the root dir
+pytest tests/data_structures/fundamentals/queues/test_blocking_queue.py
+"""
+
+import queue
+import threading
+import time
+import unittest
+
+from src.data_structures.fundamentals.queues.blocking_queue import BlockingDeque, BlockingQueue
+
+class TestBlockingQueue(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new queue with room for three elements."""
+        self.queue = BlockingQueue(3)
+
+    def test_fifo_order(self):
+        """Test that elements come out in the order they went in. ➡️"""
+        for value in "abc":
+            self.queue.put(value)
+        self.assertTrue(self.queue.full())
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual([self.queue.get() for _ in range(3)], ["a", "b", "c"])
+        self.assertTrue(self.queue.empty())
+
+    def test_non_blocking_and_timeouts(self):
+        """Test queue.Full and queue.Empty for non-blocking and timed calls. ⏱️"""
+        with self.assertRaises(queue.Empty):
+            self.queue.get(block=False)
+        with self.assertRaises(queue.Empty):
+            self.queue.get(timeout=0.01)
+        with self.assertRaises(queue.Empty):
+            self.queue.get_many(5, timeout=0.01)
+        for value in range(3):
+            self.queue.put(value)
+        with self.assertRaises(queue.Full):
+            self.queue.put(3, block=False)
+        with self.assertRaises(queue.Full):
+            self.queue.put(3, timeout=0.01)
+        self.assertEqual(self.queue.put_many([3, 4], timeout=0.01), 0)
+
+    def test_backpressure(self):
+        """Test that a producer waits for a consumer when the queue is full. 🛑"""
+        for value in range(3):
+            self.queue.put(value)
+        done = threading.Event()
+
+        def producer():
+            self.queue.put(3)
+            done.set()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        time.sleep(0.05)
+        self.assertFalse(done.is_set())
+        self.assertEqual(self.queue.get(), 0)
+        thread.join(timeout=5)
+        self.assertTrue(done.is_set())
+        self.assertEqual(self.queue.get_many(10), [1, 2, 3])
+
+    def test_batched_producer_consumer(self):
+        """Test that batches through a small queue arrive complete and in order. 📦"""
+        pipe = BlockingQueue(64)
+        received = []
+        total = 20000
+
+        def consumer():
+            while len(received) < total:
+                received.extend(pipe.get_many(100))
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        for start in range(0, total, 1000):
+            self.assertEqual(pipe.put_many(range(start, start + 1000)), 1000)
+        thread.join(timeout=10)
+        self.assertEqual(received, list(range(total)))
+
+    def test_many_producers_and_consumers(self):
+        """Test several producer and consumer threads sharing one queue. 🧵"""
+        pipe = BlockingQueue(10)
+        results = []
+        lock = threading.Lock()
+
+        def producer(offset):
+            for value in range(offset, offset + 500):
+                pipe.put(value)
+
+        def consumer():
+            while True:
+                value = pipe.get()
+                if value is None:
+                    return
+                with lock:
+                    results.append(value)
+
+        producers = [threading.Thread(target=producer, args=(i * 500,)) for i in range(4)]
+        consumers = [threading.Thread(target=consumer) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        for _ in consumers:
+            pipe.put(None)
+        for thread in consumers:
+            thread.join()
+        self.assertEqual(sorted(results), list(range(2000)))
+
+    def test_deque_ends(self):
+        """Test put_front and get_back on a BlockingDeque. ↔️"""
+        deque_ = BlockingDeque(3)
+        deque_.put(2)
+        deque_.put_front(1)
+        deque_.put(3)
+        with self.assertRaises(queue.Full):
+            deque_.put_front(0, block=False)
+        self.assertEqual(deque_.get_back(), 3)
+        self.assertEqual(deque_.get(), 1)
+        self.assertEqual(repr(deque_), "BlockingDeque([2], capacity=3)")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# tests\data_structures\fundamentals\queues\test_ring_buffer.py
+
+"""
+to test run the below on the root dir
+pytest tests/data_structures/fundamentals/queues/test_ring_buffer.py
+"""
+
+import random
+import unittest
+from collections import deque
+
+from src.data_structures.fundamentals.queues.ring_buffer import RingBuffer
+
+class TestRingBuffer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new, empty bounded buffer for each test."""
+        self.ring = RingBuffer(capacity=4)
+
+    def test_initial_state(self):
+        """Test that a new buffer is empty. 🧪"""
+        self.assertEqual(len(self.ring), 0)
+        self.assertTrue(self.ring.is_empty())
+        self.assertFalse(self.ring.is_full())
+        self.assertEqual(self.ring.free(), 4)
+        with self.assertRaises(ValueError):
+            RingBuffer(capacity=0)
+
+    def test_both_ends(self):
+        """Test pushing and popping at both ends across the wrap-around. 🔄"""
+        self.ring.append(2)
+        self.ring.append(3)
+        self.ring.appendleft(1)
+        self.ring.appendleft(0)
+        self.assertTrue(self.ring.is_full())
+        self.assertEqual(self.ring.to_list(), [0, 1, 2, 3])
+        self.assertEqual((self.ring.peek(), self.ring.peek_back()), (0, 3))
+        self.assertEqual(self.ring[1], 1)
+        self.assertEqual(self.ring[-2], 2)
+        self.assertEqual(self.ring.popleft(), 0)
+        self.assertEqual(self.ring.pop(), 3)
+        self.ring.append(4)
+        self.assertEqual(list(self.ring), [1, 2, 4])
+
+    def test_full_and_empty_errors(self):
+        """Test overflow on a full buffer and underflow on an empty one. 🚫"""
+        for value in range(4):
+            self.ring.append(value)
+        with self.assertRaises(OverflowError):
+            self.ring.append(4)
+        with self.assertRaises(OverflowError):
+            self.ring.appendleft(4)
+        self.ring.clear()
+        with self.assertRaises(IndexError):
+            self.ring.pop()
+        with self.assertRaises(IndexError):
+            self.ring.popleft()
+        with self.assertRaises(IndexError):
+            _ = self.ring[0]
+        with self.assertRaises(OverflowError):
+            RingBuffer(2, [1, 2, 3])
+
+    def test_put_many_and_get_many(self):
+        """Test batched transfers, including partial fills and wrap-around. 📦"""
+        self.ring.append("a")
+        self.ring.popleft()
+        self.assertEqual(self.ring.put_many(range(6)), 4)
+        self.assertEqual(self.ring.get_many(3), [0, 1, 2])
+        self.assertEqual(self.ring.put_many([4, 5]), 2)
+        self.assertEqual(self.ring.get_many(), [3, 4, 5])
+        self.assertEqual(self.ring.get_many(5), [])
+        self.assertEqual(self.ring.put_many([]), 0)
+
+    def test_unbounded_growth(self):
+        """Test that an unbounded buffer grows while keeping the order. 📈"""
+        ring = RingBuffer(iterable=range(10))
+        for value in range(10, 40):
+            ring.append(value)
+            ring.appendleft(-value)
+        self.assertEqual(len(ring), 70)
+        self.assertIsNone(ring.free())
+        self.assertEqual(ring.to_list(), [-v for v in range(39, 9, -1)] + list(range(40)))
+        self.assertEqual(ring.put_many(range(100)), 100)
+        self.assertEqual(len(ring), 170)
+        self.assertEqual(repr(RingBuffer(3, [1])), "RingBuffer([1], capacity=3)")
+
+    def test_random_operations_match_deque(self):
+        """Test random operations against collections.deque. 🎲"""
+        rng = random.Random(5)
+        ring = RingBuffer(capacity=7)
+        reference = deque()
+        for step in range(3000):
+            action = rng.randrange(6)
+            if action == 0 and len(reference) < 7:
+                ring.append(step)
+                reference.append(step)
+            elif action == 1 and len(reference) < 7:
+                ring.appendleft(step)
+                reference.appendleft(step)
+            elif action == 2 and reference:
+                self.assertEqual(ring.pop(), reference.pop())
+            elif action == 3 and reference:
+                self.assertEqual(ring.popleft(), reference.popleft())
+            elif action == 4:
+                batch = list(range(step, step + rng.randrange(5)))
+                added = ring.put_many(batch)
+                reference.extend(batch[:added])
+            else:
+                count = rng.randrange(5)
+                self.assertEqual(ring.get_many(count),
+                                 [reference.popleft() for _ in range(min(count, len(reference)))])
+            self.assertEqual(ring.to_list(), list(reference))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# tests\data_structures\fundamentals\stacks\test_array_stack.py
+
+"""
+to test run the below on the root dir
+pytest tests/data_structures/fundamentals/stacks/test_array_stack.py
+"""
+
+import random
+import unittest
+
+from src.data_structures.fundamentals.stacks.array_stack import ArrayStack, MinMaxStack
+
+class TestArrayStack(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new, empty list-backed stack for each test."""
+        self.stack = ArrayStack(capacity=4)
+
+    def test_initial_state(self):
+        """Test that a new stack is empty. 🧪"""
+        self.assertEqual(len(self.stack), 0)
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.capacity, 4)
+        with self.assertRaises(IndexError):
+            self.stack.pop()
+        with self.assertRaises(IndexError):
+            self.stack.peek()
+        with self.assertRaises(ValueError):
+            ArrayStack(capacity=0)
+
+    def test_push_and_pop(self):
+        """Test LIFO order across buffer growth. 📚"""
+        for value in range(10):
+            self.stack.push(value)
+        self.assertEqual(self.stack.peek(), 9)
+        self.assertEqual(self.stack.capacity, 16)
+        self.assertEqual(self.stack.to_list(), list(range(10)))
+        self.assertEqual([self.stack.pop() for _ in range(10)], list(range(9, -1, -1)))
+        self.assertTrue(self.stack.is_empty())
+
+    def test_shrink_policy(self):
+        """Test that the buffer halves at a quarter full but not below its initial size. 📉"""
+        self.stack.push_many(range(64))
+        self.assertEqual(self.stack.capacity, 64)
+        while len(self.stack) > 17:
+            self.stack.pop()
+        self.assertEqual(self.stack.capacity, 64)
+        self.stack.pop()
+        self.assertEqual(self.stack.capacity, 32)
+        self.stack.pop_many(15)
+        self.assertEqual(self.stack.capacity, 4)
+        self.assertEqual(self.stack.to_list(), [0])
+
+        fixed = ArrayStack(range(64), capacity=4, shrink=False)
+        fixed.pop_many(63)
+        self.assertEqual(fixed.capacity, 64)
+        fixed.shrink_to_fit()
+        self.assertEqual(fixed.capacity, 4)
+        fixed.reserve(100)
+        self.assertEqual(fixed.capacity, 100)
+        self.assertEqual(fixed.to_list(), [0])
+
+    def test_bulk_operations(self):
+        """Test push_many and pop_many. 📦"""
+        self.stack.push_many(iter("abc"))
+        self.stack.push_many(["d", "e"])
+        self.assertEqual(self.stack.pop_many(2), ["e", "d"])
+        self.assertEqual(self.stack.pop_many(0), [])
+        with self.assertRaises(IndexError):
+            self.stack.pop_many(4)
+        with self.assertRaises(ValueError):
+            self.stack.pop_many(-1)
+        self.assertEqual(list(self.stack), ["a", "b", "c"])
+
+    def test_typed_buffer(self):
+        """Test a stack backed by a typed array. 🔢"""
+        stack = ArrayStack([1.5, 2.5], typecode="d")
+        stack.push(3)
+        stack.push_many([4.0, 5.0])
+        self.assertEqual(stack.pop(), 5.0)
+        self.assertEqual(stack.pop_many(2), [4.0, 3.0])
+        self.assertEqual(stack.to_list(), [1.5, 2.5])
+        self.assertEqual(repr(stack), "ArrayStack([1.5, 2.5], typecode='d')")
+        ints = ArrayStack(typecode="q")
+        with self.assertRaises(TypeError):
+            ints.push("x")
+        with self.assertRaises(TypeError):
+            ints.push_many([1, "x"])
+        self.assertTrue(ints.is_empty())
+        octets = ArrayStack(typecode="B")
+        with self.assertRaises(OverflowError):
+            octets.push(300)
+        with self.assertRaises(OverflowError):
+            octets.push_many([1, 256])
+        self.assertTrue(octets.is_empty())
+
+    def test_clear(self):
+        """Test that clear empties the stack and resets the buffer. 🧹"""
+        self.stack.push_many(range(100))
+        self.stack.clear()
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.capacity, 4)
+        self.assertEqual(repr(self.stack), "ArrayStack([])")
+
+    def test_random_operations(self):
+        """Test random operations against a Python list. 🎲"""
+        rng = random.Random(5)
+        for typecode in (None, "q"):
+            stack = ArrayStack(typecode=typecode, capacity=2)
+            reference = []
+            for _ in range(3000):
+                action = rng.random()
+                if action < 0.4:
+                    value = rng.randrange(1000)
+                    stack.push(value)
+                    reference.append(value)
+                elif action < 0.55:
+                    values = [rng.randrange(1000) for _ in range(rng.randrange(20))]
+                    stack.push_many(values)
+                    reference.extend(values)
+                elif action < 0.65:
+                    count = rng.randrange(len(reference) + 1)
+                    expected = reference[len(reference) - count:][::-1]
+                    del reference[len(reference) - count:]
+                    self.assertEqual(stack.pop_many(count), expected)
+                elif reference:
+                    self.assertEqual(stack.pop(), reference.pop())
+                self.assertEqual(len(stack), len(reference))
+                self.assertLessEqual(len(stack), stack.capacity)
+            self.assertEqual(stack.to_list(), reference)
+
+class TestMinMaxStack(unittest.TestCase):
+
+    def test_min_and_max(self):
+        """Test tracking the extremes through pushes and pops, with duplicates. 📏"""
+        stack = MinMaxStack()
+        with self.assertRaises(IndexError):
+            stack.min()
+        with self.assertRaises(IndexError):
+            stack.max()
+        for value in [5, 3, 3, 8, 1, 8]:
+            stack.push(value)
+        self.assertEqual((stack.min(), stack.max()), (1, 8))
+        self.assertEqual(stack.pop_many(2), [8, 1])
+        self.assertEqual((stack.min(), stack.max()), (3, 8))
+        stack.pop()
+        self.assertEqual((stack.min(), stack.max()), (3, 5))
+        stack.pop()
+        self.assertEqual((stack.min(), stack.max()), (3, 5))
+        stack.clear()
+        self.assertTrue(stack.is_empty())
+        with self.assertRaises(IndexError):
+            stack.min()
+
+    def test_random_operations(self):
+        """Test the extremes against min() and max() of a Python list. 🎲"""
+        rng = random.Random(8)
+        stack = MinMaxStack(typecode="q")
+        reference = []
+        for _ in range(2000):
+            if reference and rng.random() < 0.45:
+                if rng.random() < 0.2:
+                    count = rng.randrange(len(reference) + 1)
+                    stack.pop_many(count)
+                    del reference[len(reference) - count:]
+                else:
+                    self.assertEqual(stack.pop(), reference.pop())
+            else:
+                values = [rng.randrange(50) for _ in range(rng.randrange(1, 4))]
+                stack.push_many(values)
+                reference.extend(values)
+            if reference:
+                self.assertEqual((stack.min(), stack.max()), (min(reference), max(reference)))
+
+if __name__ == '__main__':
+    unittest.main()
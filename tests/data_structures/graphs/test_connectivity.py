@@ -0,0 +1,140 @@
+import random
+import unittest
+
+from src.data_structures.graphs.connectivity import (
+    condensation, connected_components, kosaraju_scc, kruskal_mst, tarjan_scc,
+)
+from src.data_structures.graphs.csr_graph import CSRGraph
+from src.data_structures.graphs.search import bfs
+from src.data_structures.graphs.topological import is_dag
+
+def prim_weight(n, edges):
+    """The weight of a minimum spanning forest by a quadratic Prim, for reference."""
+    weights = {}
+    for u, v, w in edges:
+        if u != v:
+            key = (min(u, v), max(u, v))
+            weights[key] = min(w, weights.get(key, w))
+    done = [False] * n
+    total = 0.0
+    for start in range(n):
+        if done[start]:
+            continue
+        best = {start: 0.0}
+        while best:
+            u = min(best, key=best.get)
+            total += best.pop(u)
+            done[u] = True
+            for (a, b), w in weights.items():
+                if u in (a, b):
+                    v = b if u == a else a
+                    if not done[v] and w < best.get(v, float("inf")):
+                        best[v] = w
+    return total
+
+class TestConnectivity(unittest.TestCase):
+    """
+    A unit test suite for the connected components and Kruskal implementations.
+    """
+    def test_connected_components(self):
+        """Test labels on a graph with isolated vertices and directed edges."""
+        graph = CSRGraph.from_edges([(0, 1), (2, 1), (3, 4)], num_vertices=6, use_numpy=False)
+        self.assertEqual(connected_components(graph), (3, [0, 0, 0, 1, 1, 2]))
+        self.assertEqual(connected_components(CSRGraph.from_edges([], use_numpy=False)), (0, []))
+
+    def test_components_match_bfs(self):
+        """Test labels against BFS reachability on a random undirected graph."""
+        rng = random.Random(3)
+        n = 400
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(300)]
+        graph = CSRGraph.from_edges(edges, n, directed=False, use_numpy=False)
+        count, labels = connected_components(graph)
+        seen = set()
+        components = 0
+        for v in range(n):
+            if v in seen:
+                continue
+            components += 1
+            members = {u for u, _ in bfs(graph, v)}
+            seen |= members
+            self.assertEqual({labels[u] for u in members}, {labels[v]})
+        self.assertEqual(count, components)
+
+    def test_kruskal(self):
+        """Test a minimum spanning tree of a small weighted graph."""
+        edges = [(0, 1, 4.0), (0, 2, 1.0), (1, 2, 2.0), (1, 3, 5.0), (2, 3, 8.0), (3, 3, 0.5)]
+        graph = CSRGraph.from_edges(edges, directed=False, weighted=True, use_numpy=False)
+        total, chosen = kruskal_mst(graph)
+        self.assertEqual(total, 8.0)
+        self.assertEqual(chosen, [(0, 2, 1.0), (1, 2, 2.0), (1, 3, 5.0)])
+        unweighted = CSRGraph.from_edges([(0, 1), (1, 2), (2, 0), (3, 4)], use_numpy=False)
+        total, chosen = kruskal_mst(unweighted)
+        self.assertEqual((total, len(chosen)), (3.0, 3))
+
+    def test_kruskal_matches_prim(self):
+        """Test spanning forest weights against a reference on random graphs."""
+        rng = random.Random(17)
+        for directed in (True, False):
+            n = 40
+            edges = [(rng.randrange(n), rng.randrange(n), float(rng.randrange(1, 50)))
+                     for _ in range(90)]
+            graph = CSRGraph.from_edges(edges, n, directed=directed, weighted=True, use_numpy=False)
+            total, chosen = kruskal_mst(graph)
+            self.assertAlmostEqual(total, prim_weight(n, edges))
+            self.assertEqual(len(chosen), n - connected_components(graph)[0])
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+    """
+    A unit test suite for the Tarjan, Kosaraju and condensation implementations.
+    """
+    def assert_topological_labels(self, graph, labels):
+        """Checks that every edge between components goes to a higher number."""
+        for u, v in graph.edges():
+            self.assertLessEqual(labels[u], labels[v])
+
+    def test_small_graph(self):
+        """Test both algorithms and the condensation on two cycles and a tail."""
+        graph = CSRGraph.from_edges([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (5, 0)],
+                                    use_numpy=False)
+        for scc in (tarjan_scc, kosaraju_scc):
+            self.assertEqual(scc(graph), (3, [1, 1, 1, 2, 2, 0]))
+        dag, labels = condensation(graph)
+        self.assertEqual(labels, [1, 1, 1, 2, 2, 0])
+        self.assertEqual(list(dag.edges()), [(0, 1), (1, 2)])
+
+    def test_deep_graphs(self):
+        """Test a ring and a chain far longer than the recursion limit."""
+        n = 100000
+        ring = CSRGraph.from_edges([(v, (v + 1) % n) for v in range(n)], use_numpy=False)
+        chain = CSRGraph.from_edges([(v, v + 1) for v in range(n - 1)], use_numpy=False)
+        for scc in (tarjan_scc, kosaraju_scc):
+            self.assertEqual(scc(ring)[0], 1)
+            count, labels = scc(chain)
+            self.assertEqual(count, n)
+            self.assertEqual(labels, list(range(n)))
+
+    def test_random_graphs_match_reachability(self):
+        """Test components against mutual reachability by BFS."""
+        rng = random.Random(23)
+        for _ in range(5):
+            n = 60
+            edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(90)]
+            graph = CSRGraph.from_edges(edges, n, use_numpy=False)
+            reach = [{v for v, _ in bfs(graph, u)} for u in range(n)]
+            expected = len({frozenset(v for v in reach[u] if u in reach[v]) for u in range(n)})
+            for scc in (tarjan_scc, kosaraju_scc):
+                count, labels = scc(graph)
+                self.assertEqual(count, expected)
+                for u in range(n):
+                    for v in range(n):
+                        self.assertEqual(labels[u] == labels[v], v in reach[u] and u in reach[v])
+                self.assert_topological_labels(graph, labels)
+            dag, labels = condensation(graph)
+            self.assertEqual(dag.num_vertices, expected)
+            self.assertTrue(is_dag(dag))
+            for u, v in edges:
+                if labels[u] != labels[v]:
+                    self.assertTrue(dag.has_edge(labels[u], labels[v]))
+
+if __name__ == '__main__':
+    unittest.main()
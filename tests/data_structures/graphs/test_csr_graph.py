@@ -0,0 +1,136 @@
+import random
+import unittest
+
+from src.data_structures.graphs import csr_graph
+from src.data_structures.graphs.csr_graph import CSRGraph, GraphBuilder
+
+class TestCSRGraph(unittest.TestCase):
+    """
+    A unit test suite for the CSRGraph and GraphBuilder implementation.
+    """
+    def assert_matches(self, graph, adjacency):
+        """Checks a graph against a dict of sorted neighbour lists."""
+        self.assertEqual(graph.num_vertices, len(adjacency))
+        self.assertEqual(graph.num_edges, sum(len(targets) for targets in adjacency.values()))
+        for v, targets in adjacency.items():
+            self.assertEqual(graph.degree(v), len(targets))
+            self.assertEqual(list(graph.neighbors(v)), sorted(targets))
+
+    def test_build_and_query(self):
+        """Test degrees, neighbours and edge lookups of a small graph."""
+        builder = GraphBuilder()
+        builder.add_edges([(0, 2), (0, 1), (1, 2), (3, 0)])
+        builder.add_vertex()
+        graph = builder.freeze(use_numpy=False)
+        self.assert_matches(graph, {0: [1, 2], 1: [2], 2: [], 3: [0], 4: []})
+        self.assertTrue(graph.has_edge(0, 2))
+        self.assertFalse(graph.has_edge(2, 0))
+        self.assertFalse(graph.has_edge(4, 0))
+        self.assertEqual(list(graph.edges()), [(0, 1), (0, 2), (1, 2), (3, 0)])
+        self.assertEqual(len(graph), 5)
+        self.assertFalse(graph.weighted)
+        with self.assertRaises(IndexError):
+            graph.degree(5)
+        with self.assertRaises(ValueError):
+            graph.weights(0)
+        with self.assertRaises(ValueError):
+            builder.add_edge(-1, 0)
+        self.assertEqual(repr(graph), "CSRGraph(5 vertices, 4 edges, directed)")
+
+    def test_neighbors_are_views(self):
+        """Test that neighbour slices share the graph's storage."""
+        graph = CSRGraph.from_edges([(0, 1), (0, 2)], use_numpy=False)
+        row = graph.neighbors(0)
+        self.assertIsInstance(row, memoryview)
+        self.assertIs(row.obj, graph._neighbors)
+        self.assertEqual(graph.nbytes, 4 * 8 + 2 * 4)
+
+    def test_views_are_read_only(self):
+        """Test that rows cannot be written through, which would unsort them."""
+        graph = CSRGraph.from_edges([(0, 1, 1.0), (0, 2, 2.0)], weighted=True, use_numpy=False)
+        with self.assertRaises(TypeError):
+            graph.neighbors(0)[0] = 7
+        with self.assertRaises(TypeError):
+            graph.weights(0)[0] = 7.0
+        _, targets, weights = graph.edge_arrays()
+        with self.assertRaises(TypeError):
+            targets[0] = 7
+        with self.assertRaises(TypeError):
+            weights[0] = 7.0
+        self.assertTrue(graph.has_edge(0, 1))
+
+    def test_weighted_and_undirected(self):
+        """Test weights, including for edges stored both ways."""
+        graph = CSRGraph.from_edges([(0, 1, 2.5), (1, 2, 4.0)], directed=False, weighted=True,
+                                    use_numpy=False)
+        self.assert_matches(graph, {0: [1], 1: [0, 2], 2: [1]})
+        self.assertEqual(list(graph.weights(1)), [2.5, 4.0])
+        self.assertEqual(graph.weight(2, 1), 4.0)
+        with self.assertRaises(KeyError):
+            graph.weight(0, 2)
+        self.assertEqual(sorted(graph.edges()), [(0, 1, 2.5), (1, 0, 2.5), (1, 2, 4.0), (2, 1, 4.0)])
+
+    def test_transpose(self):
+        """Test reversing every edge, with weights carried along."""
+        edges = [(0, 1, 1.0), (0, 2, 2.0), (2, 1, 3.0), (1, 1, 4.0)]
+        graph = CSRGraph.from_edges(edges, num_vertices=4, weighted=True, use_numpy=False)
+        reverse = graph.transpose()
+        self.assertEqual(sorted(reverse.edges()), sorted((v, u, w) for u, v, w in edges))
+        self.assertEqual(reverse.num_vertices, 4)
+        self.assertEqual(sorted(reverse.transpose().edges()), sorted(edges))
+
+    def test_edge_arrays(self):
+        """Test the parallel source, target and weight arrays."""
+        graph = CSRGraph.from_edges([(2, 0, 1.0), (0, 1, 2.0), (0, 2, 3.0)], num_vertices=4,
+                                    weighted=True, use_numpy=False)
+        sources, targets, weights = graph.edge_arrays()
+        self.assertEqual(list(zip(sources, targets, weights)), list(graph.edges()))
+        self.assertIs(targets.obj, graph._neighbors)
+
+    def test_invalid_arrays(self):
+        """Test that inconsistent arrays are rejected."""
+        with self.assertRaises(ValueError):
+            CSRGraph([0, 2], [1])
+        with self.assertRaises(ValueError):
+            CSRGraph([0, 1], [0], weights=[])
+        with self.assertRaises(ValueError):
+            GraphBuilder(-1)
+
+    def test_random_graph_matches_adjacency(self):
+        """Test a random multigraph against a dict of lists."""
+        rng = random.Random(4)
+        n = 200
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(2000)]
+        adjacency = {v: [] for v in range(n)}
+        for u, v in edges:
+            adjacency[u].append(v)
+        graph = CSRGraph.from_edges(edges, num_vertices=n, use_numpy=False)
+        self.assert_matches(graph, adjacency)
+        reverse = {v: [] for v in range(n)}
+        for u, v in edges:
+            reverse[v].append(u)
+        self.assert_matches(graph.transpose(), reverse)
+
+    @unittest.skipIf(csr_graph.np is None, "NumPy is not installed")
+    def test_numpy_backend_matches_arrays(self):
+        """Test that the NumPy and array backends build the same graph."""
+        rng = random.Random(6)
+        edges = [(rng.randrange(50), rng.randrange(50), rng.random()) for _ in range(500)]
+        plain = CSRGraph.from_edges(edges, weighted=True, use_numpy=False)
+        fast = CSRGraph.from_edges(edges, weighted=True, use_numpy=True)
+        self.assertTrue(fast.uses_numpy)
+        self.assertEqual(list(fast.edges()), list(plain.edges()))
+        self.assertEqual(list(fast.transpose().edges()), list(plain.transpose().edges()))
+        self.assertEqual(fast.degree(3), plain.degree(3))
+        with self.assertRaises(ValueError):
+            fast.neighbors(edges[0][0])[0] = 0
+
+    def test_numpy_required_when_requested(self):
+        """Test that asking for NumPy without it installed fails clearly."""
+        if csr_graph.np is not None:
+            self.skipTest("NumPy is installed")
+        with self.assertRaises(ImportError):
+            GraphBuilder().freeze(use_numpy=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import math
+import random
+import unittest
+
+from src.data_structures.graphs.csr_graph import CSRGraph
+from src.data_structures.graphs.search import (
+    astar, bfs, bidirectional_dijkstra, dfs, dijkstra, euclidean_heuristic,
+    manhattan_heuristic, multi_source_bfs, reconstruct_path, shortest_path,
+)
+
+def floyd_warshall(n, edges):
+    """All-pairs distances of a small weighted graph, for reference."""
+    dist = [[math.inf] * n for _ in range(n)]
+    for v in range(n):
+        dist[v][v] = 0.0
+    for u, v, w in edges:
+        dist[u][v] = min(dist[u][v], w)
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                if dist[i][k] + dist[k][j] < dist[i][j]:
+                    dist[i][j] = dist[i][k] + dist[k][j]
+    return dist
+
+def grid(width, height, rng):
+    """A weighted grid graph with the (x, y) coordinates of its vertices."""
+    edges = []
+    for y in range(height):
+        for x in range(width):
+            v = y * width + x
+            if x + 1 < width:
+                edges.append((v, v + 1, rng.uniform(1, 5)))
+            if y + 1 < height:
+                edges.append((v, v + width, rng.uniform(1, 5)))
+    coordinates = [(x, y) for y in range(height) for x in range(width)]
+    graph = CSRGraph.from_edges(edges, width * height, directed=False, weighted=True,
+                                use_numpy=False)
+    return graph, coordinates
+
+class TestSearch(unittest.TestCase):
+    """
+    A unit test suite for the graph search algorithms.
+    """
+    def setUp(self):
+        """Set up a small directed graph with a cycle and an unreachable vertex."""
+        self.graph = CSRGraph.from_edges([(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 1)],
+                                         num_vertices=6, use_numpy=False)
+
+    def assert_path(self, graph, path, distance):
+        """Checks that a path follows the graph's edges and has the given length."""
+        length = 0.0
+        for u, v in zip(path, path[1:]):
+            self.assertTrue(graph.has_edge(u, v))
+            length += graph.weight(u, v) if graph.weighted else 1.0
+        self.assertAlmostEqual(length, distance)
+
+    def test_bfs(self):
+        """Test breadth-first order and depths."""
+        self.assertEqual(list(bfs(self.graph, 0)), [(0, 0), (1, 1), (2, 1), (3, 2), (4, 3)])
+        self.assertEqual(list(bfs(self.graph, 5)), [(5, 0)])
+        with self.assertRaises(IndexError):
+            list(bfs(self.graph, 6))
+
+    def test_multi_source_bfs(self):
+        """Test depths and origins from several sources."""
+        result = {v: (depth, origin) for v, depth, origin in multi_source_bfs(self.graph, [0, 4, 4])}
+        self.assertEqual(result, {0: (0, 0), 4: (0, 4), 1: (1, 0), 2: (1, 0), 3: (2, 0)})
+
+    def test_dfs(self):
+        """Test depth-first preorder and early exit."""
+        self.assertEqual(list(dfs(self.graph, 0)), [0, 1, 3, 4, 2])
+        search = dfs(self.graph, 0)
+        self.assertEqual(next(search), 0)
+        self.assertEqual(next(search), 1)
+
+    def test_deep_graph(self):
+        """Test that a path far longer than the recursion limit is fine."""
+        n = 50000
+        path = CSRGraph.from_edges([(v, v + 1) for v in range(n - 1)], use_numpy=False)
+        self.assertEqual(sum(1 for _ in dfs(path, 0)), n)
+        self.assertEqual(list(bfs(path, 0))[-1], (n - 1, n - 1))
+
+    def test_dijkstra(self):
+        """Test distances, parents and early exit on a weighted graph."""
+        graph = CSRGraph.from_edges([(0, 1, 4.0), (0, 2, 1.0), (2, 1, 2.0), (1, 3, 1.0), (4, 0, 1.0)],
+                                    weighted=True, use_numpy=False)
+        distances, parents = dijkstra(graph, 0)
+        self.assertEqual(distances, {0: 0.0, 2: 1.0, 1: 3.0, 3: 4.0})
+        self.assertEqual(reconstruct_path(parents, 0, 3), [0, 2, 1, 3])
+        self.assertEqual(reconstruct_path(parents, 0, 4), [])
+        distances, _ = dijkstra(graph, 0, target=2)
+        self.assertEqual(distances, {0: 0.0, 2: 1.0})
+        self.assertEqual(shortest_path(graph, 0, 3), (4.0, [0, 2, 1, 3]))
+        self.assertEqual(shortest_path(graph, 0, 4), (math.inf, []))
+        negative = CSRGraph.from_edges([(0, 1, -1.0)], weighted=True, use_numpy=False)
+        with self.assertRaises(ValueError):
+            dijkstra(negative, 0)
+
+    def test_unweighted_paths(self):
+        """Test that unweighted edges count as 1."""
+        self.assertEqual(shortest_path(self.graph, 0, 4), (3.0, [0, 1, 3, 4]))
+        self.assertEqual(bidirectional_dijkstra(self.graph, 0, 4)[0], 3.0)
+        self.assertEqual(bidirectional_dijkstra(self.graph, 4, 0), (math.inf, []))
+        self.assertEqual(bidirectional_dijkstra(self.graph, 2, 2), (0.0, [2]))
+        self.assertEqual(astar(self.graph, 0, 5), (math.inf, []))
+
+    def test_random_graphs_match_floyd_warshall(self):
+        """Test every shortest-path search against all-pairs distances."""
+        rng = random.Random(12)
+        for _ in range(5):
+            n = 25
+            edges = [(rng.randrange(n), rng.randrange(n), float(rng.randrange(1, 10)))
+                     for _ in range(70)]
+            graph = CSRGraph.from_edges(edges, n, weighted=True, use_numpy=False)
+            reverse = graph.transpose()
+            expected = floyd_warshall(n, edges)
+            for source in range(0, n, 3):
+                distances, _ = dijkstra(graph, source)
+                for target in range(n):
+                    self.assertEqual(distances.get(target, math.inf), expected[source][target])
+                    for search in (astar(graph, source, target),
+                                   bidirectional_dijkstra(graph, source, target, reverse)):
+                        self.assertEqual(search[0], expected[source][target])
+                        if search[1]:
+                            self.assert_path(graph, search[1], search[0])
+
+    def test_heuristics_on_a_grid(self):
+        """Test that A* with admissible heuristics finds optimal paths on a grid."""
+        graph, coordinates = grid(15, 12, random.Random(2))
+        for source, target in [(0, 179), (14, 165), (100, 7)]:
+            expected, _ = shortest_path(graph, source, target)
+            for heuristic in (manhattan_heuristic(coordinates, target),
+                              euclidean_heuristic(coordinates, target)):
+                distance, path = astar(graph, source, target, heuristic)
+                self.assertAlmostEqual(distance, expected)
+                self.assertEqual((path[0], path[-1]), (source, target))
+                self.assert_path(graph, path, distance)
+            distance, path = bidirectional_dijkstra(graph, source, target)
+            self.assertAlmostEqual(distance, expected)
+            self.assert_path(graph, path, distance)
+
+if __name__ == '__main__':
+    unittest.main()
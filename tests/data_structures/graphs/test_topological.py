@@ -0,0 +1,158 @@
+import random
+import unittest
+
+from src.data_structures.graphs.csr_graph import CSRGraph
+from src.data_structures.graphs.topological import (
+    CycleError, IncrementalTopologicalOrder, find_cycle, is_dag, topological_generations,
+    topological_order, topological_sort,
+)
+
+def random_dag(n, m, rng):
+    """Random edges that all point from a lower to a higher vertex of a shuffled ranking."""
+    ranking = list(range(n))
+    rng.shuffle(ranking)
+    edges = set()
+    while len(edges) < m:
+        a, b = rng.sample(range(n), 2)
+        edges.add((ranking[min(a, b)], ranking[max(a, b)]))
+    return sorted(edges)
+
+class TestTopological(unittest.TestCase):
+    """
+    A unit test suite for topological sorting and cycle detection.
+    """
+    def assert_order(self, order, n, edges):
+        """Checks that an order lists every vertex once with every edge pointing forward."""
+        self.assertEqual(sorted(order), list(range(n)))
+        position = {v: i for i, v in enumerate(order)}
+        for u, v in edges:
+            self.assertLess(position[u], position[v])
+
+    def assert_cycle(self, graph, cycle):
+        """Checks that consecutive vertices of a cycle are joined by edges."""
+        self.assertTrue(cycle)
+        for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertTrue(graph.has_edge(u, v))
+
+    def test_kahn(self):
+        """Test orders, streaming and generations on a small DAG."""
+        edges = [(0, 2), (1, 2), (2, 3), (1, 4), (4, 3)]
+        graph = CSRGraph.from_edges(edges, num_vertices=6, use_numpy=False)
+        self.assertEqual(topological_sort(graph), [0, 1, 5, 2, 4, 3])
+        self.assert_order(list(topological_order(graph)), 6, edges)
+        self.assertEqual(list(topological_generations(graph)), [[0, 1, 5], [2, 4], [3]])
+        self.assertTrue(is_dag(graph))
+        self.assertIsNone(find_cycle(graph))
+
+    def test_cycles(self):
+        """Test that cycles are reported with the offending vertices."""
+        graph = CSRGraph.from_edges([(0, 1), (1, 2), (2, 3), (3, 1), (4, 0)], use_numpy=False)
+        self.assertFalse(is_dag(graph))
+        self.assert_cycle(graph, find_cycle(graph))
+        streamed = []
+        with self.assertRaises(CycleError) as context:
+            for v in topological_order(graph):
+                streamed.append(v)
+        self.assertEqual(streamed, [4, 0])
+        self.assertEqual(sorted(context.exception.cycle), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            list(topological_generations(graph))
+        loop = CSRGraph.from_edges([(0, 0)], use_numpy=False)
+        self.assertEqual(find_cycle(loop), [0])
+
+    def test_deep_chain(self):
+        """Test a chain far deeper than the recursion limit."""
+        n = 100000
+        chain = CSRGraph.from_edges([(v + 1, v) for v in range(n - 1)], use_numpy=False)
+        self.assertEqual(topological_sort(chain), list(range(n - 1, -1, -1)))
+        self.assertTrue(is_dag(chain))
+        ring = CSRGraph.from_edges([(v, (v + 1) % n) for v in range(n)], use_numpy=False)
+        self.assertEqual(len(find_cycle(ring)), n)
+
+    def test_random_dags(self):
+        """Test Kahn orders and generations on random DAGs."""
+        rng = random.Random(31)
+        for _ in range(5):
+            n = 60
+            edges = random_dag(n, 150, rng)
+            graph = CSRGraph.from_edges(edges, n, use_numpy=False)
+            self.assert_order(topological_sort(graph), n, edges)
+            generations = list(topological_generations(graph))
+            self.assert_order([v for batch in generations for v in batch], n, edges)
+            level = {v: i for i, batch in enumerate(generations) for v in batch}
+            for u, v in edges:
+                self.assertLess(level[u], level[v])
+
+class TestIncrementalTopologicalOrder(unittest.TestCase):
+    """
+    A unit test suite for the IncrementalTopologicalOrder implementation.
+    """
+    def assert_valid(self, dag):
+        """Checks the order against every edge and the position index."""
+        order = dag.order()
+        self.assertEqual(sorted(order), list(range(len(dag))))
+        for v in order:
+            self.assertEqual(order[dag.position(v)], v)
+            for w in dag._successors[v]:
+                self.assertLess(dag.position(v), dag.position(w))
+
+    def test_backward_edges_reorder(self):
+        """Test that an edge against the current order moves the affected vertices."""
+        dag = IncrementalTopologicalOrder(5)
+        dag.add_edge(0, 1)
+        dag.add_edge(3, 0)
+        self.assert_valid(dag)
+        dag.add_edge(4, 3)
+        dag.add_edge(2, 4)
+        self.assert_valid(dag)
+        self.assertEqual(dag.order(), [2, 4, 3, 0, 1])
+        dag.add_edge(2, 4)
+        self.assertEqual(dag.num_edges, 4)
+        self.assertTrue(dag.has_edge(4, 3))
+        self.assertEqual(repr(dag), "IncrementalTopologicalOrder(5 vertices, 4 edges)")
+
+    def test_cycle_is_rejected(self):
+        """Test that an edge closing a cycle leaves the graph unchanged."""
+        dag = IncrementalTopologicalOrder(4)
+        dag.add_edge(0, 1)
+        dag.add_edge(1, 2)
+        before = dag.order()
+        with self.assertRaises(CycleError) as context:
+            dag.add_edge(2, 0)
+        self.assertEqual(context.exception.cycle, [0, 1, 2])
+        with self.assertRaises(CycleError):
+            dag.add_edge(3, 3)
+        self.assertEqual(dag.order(), before)
+        self.assertFalse(dag.has_edge(2, 0))
+        self.assertEqual(dag.num_edges, 2)
+        dag.remove_edge(1, 2)
+        dag.add_edge(2, 0)
+        self.assert_valid(dag)
+        with self.assertRaises(KeyError):
+            dag.remove_edge(1, 2)
+        with self.assertRaises(IndexError):
+            dag.add_edge(0, 4)
+
+    def test_random_insertions(self):
+        """Test random insertions against a cycle check on the full graph."""
+        rng = random.Random(44)
+        n = 50
+        dag = IncrementalTopologicalOrder()
+        for _ in range(n):
+            dag.add_vertex()
+        edges = set()
+        for _ in range(400):
+            u, v = rng.randrange(n), rng.randrange(n)
+            candidate = CSRGraph.from_edges(sorted(edges | {(u, v)}), n, use_numpy=False)
+            if is_dag(candidate):
+                dag.add_edge(u, v)
+                edges.add((u, v))
+            else:
+                with self.assertRaises(CycleError):
+                    dag.add_edge(u, v)
+            self.assertEqual(dag.num_edges, len(edges))
+        self.assert_valid(dag)
+        self.assertGreater(len(edges), 100)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from src.data_structures.graphs.union_find import KeyedUnionFind, UnionFind
+
+class TestUnionFind(unittest.TestCase):
+    """
+    A unit test suite for the UnionFind implementation.
+    """
+    def setUp(self):
+        """Set up ten singleton components for each test."""
+        self.forest = UnionFind(10)
+
+    def test_initial_state(self):
+        """Test that every element starts alone."""
+        self.assertEqual(len(self.forest), 10)
+        self.assertEqual(self.forest.count, 10)
+        self.assertEqual(self.forest.find(7), 7)
+        self.assertEqual(self.forest.component_size(3), 1)
+        self.assertEqual(len(UnionFind()), 0)
+        with self.assertRaises(ValueError):
+            UnionFind(-1)
+        with self.assertRaises(IndexError):
+            self.forest.find(10)
+        with self.assertRaises(IndexError):
+            self.forest.find(-1)
+
+    def test_union_and_connected(self):
+        """Test merging components and tracking their sizes and count."""
+        self.assertTrue(self.forest.union(0, 1))
+        self.assertTrue(self.forest.union(2, 3))
+        self.assertTrue(self.forest.union(1, 3))
+        self.assertFalse(self.forest.union(0, 2))
+        self.assertTrue(self.forest.connected(0, 3))
+        self.assertFalse(self.forest.connected(0, 4))
+        self.assertEqual(self.forest.component_size(2), 4)
+        self.assertEqual(self.forest.count, 7)
+        self.assertEqual(self.forest.components()[0], [0, 1, 2, 3])
+        new = self.forest.add()
+        self.assertEqual((new, self.forest.count, len(self.forest)), (10, 8, 11))
+        self.assertEqual(repr(self.forest), "UnionFind(11 elements, 8 components)")
+
+    def test_union_many(self):
+        """Test batch unions over parallel edge arrays."""
+        self.assertEqual(self.forest.union_many([0, 1, 2, 5, 0], [1, 2, 0, 6, 2]), 3)
+        self.assertEqual(self.forest.count, 7)
+        self.assertEqual(self.forest.component_size(0), 3)
+        with self.assertRaises(ValueError):
+            self.forest.union_many([0], [])
+        with self.assertRaises(IndexError):
+            self.forest.union_many([0], [-2])
+
+    def test_paths_stay_short(self):
+        """Test that ranks bound tree height, and finds compress paths."""
+        forest = UnionFind(1 << 12)
+        for step in range(12):
+            width = 1 << step
+            for start in range(0, 1 << 12, 2 * width):
+                forest.union(start, start + width)
+        self.assertEqual(forest.count, 1)
+        self.assertLessEqual(max(forest._rank), 12)
+        forest.find(4095)
+        root = forest.find(0)
+        self.assertEqual(forest._parent[4095], root)
+
+    def test_random_unions_match_labels(self):
+        """Test random unions against a naive relabelling reference."""
+        rng = random.Random(21)
+        n = 300
+        forest = UnionFind(n)
+        labels = list(range(n))
+        for _ in range(400):
+            a, b = rng.randrange(n), rng.randrange(n)
+            merged = labels[a] != labels[b]
+            self.assertEqual(forest.union(a, b), merged)
+            if merged:
+                old = labels[b]
+                labels = [labels[a] if label == old else label for label in labels]
+            x, y = rng.randrange(n), rng.randrange(n)
+            self.assertEqual(forest.connected(x, y), labels[x] == labels[y])
+        self.assertEqual(forest.count, len(set(labels)))
+        for x in range(0, n, 7):
+            self.assertEqual(forest.component_size(x), labels.count(labels[x]))
+
+class TestKeyedUnionFind(unittest.TestCase):
+    """
+    A unit test suite for the KeyedUnionFind implementation.
+    """
+    def test_keys(self):
+        """Test unions of arbitrary keys, added on the fly."""
+        forest = KeyedUnionFind(["a", "b"])
+        self.assertEqual(forest.count, 2)
+        self.assertTrue(forest.union("a", ("x", 1)))
+        self.assertEqual(forest.union_many([("b", "c"), ("c", "d"), ("d", "b")]), 2)
+        self.assertIn("d", forest)
+        self.assertNotIn("e", forest)
+        self.assertTrue(forest.connected("b", "d"))
+        self.assertFalse(forest.connected("a", "b"))
+        self.assertIn(forest.find(("x", 1)), {"a", ("x", 1)})
+        self.assertEqual(forest.component_size("c"), 3)
+        self.assertEqual(forest.components(), [["a", ("x", 1)], ["b", "c", "d"]])
+        self.assertEqual((len(forest), forest.count), (5, 2))
+        with self.assertRaises(KeyError):
+            forest.find("e")
+        with self.assertRaises(KeyError):
+            forest.connected("a", "e")
+        forest.add("a")
+        self.assertEqual(len(forest), 5)
+
+if __name__ == '__main__':
+    unittest.main()
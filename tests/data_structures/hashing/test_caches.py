@@ -0,0 +1,240 @@
+import unittest
+
+from src.data_structures.hashing.caches import Cache, LFUCache, LRUCache, TTLCache, memoize
+
+class FakeClock:
+    """A manually advanced clock for TTL tests."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLRUCache(unittest.TestCase):
+    """
+    A unit test suite for the LRUCache implementation.
+    """
+    def test_evicts_least_recently_used(self):
+        """Test that a hit protects an entry from eviction."""
+        cache = LRUCache(max_entries=3)
+        for key in "abc":
+            cache[key] = key.upper()
+        self.assertEqual(cache.get("a"), "A")
+        cache["d"] = "D"
+        self.assertNotIn("b", cache)
+        self.assertEqual(list(cache), ["c", "a", "d"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_counters(self):
+        """Test the hit, miss and eviction counters."""
+        cache = LRUCache(max_entries=2)
+        cache.put(1, "one")
+        cache.get(1)
+        cache.get(2)
+        with self.assertRaises(KeyError):
+            _ = cache[3]
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+        self.assertIn("hits=1", repr(cache))
+
+    def test_overwrite_and_pop(self):
+        """Test replacing a value, pop and clear."""
+        cache = LRUCache(max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        cache["c"] = 3
+        self.assertEqual(sorted(cache), ["a", "c"])
+        self.assertEqual(cache.pop("a"), 10)
+        self.assertIsNone(cache.pop("a", None))
+        with self.assertRaises(KeyError):
+            del cache["a"]
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_byte_limit(self):
+        """Test eviction by total size and rejection of oversized values."""
+        cache = LRUCache(max_entries=None, max_bytes=10, sizeof=lambda key, value: len(value))
+        cache["a"] = "xxxx"
+        cache["b"] = "xxxx"
+        cache["c"] = "xxxx"
+        self.assertEqual(sorted(cache), ["b", "c"])
+        self.assertEqual(cache.current_bytes, 8)
+        cache["b"] = "x"
+        self.assertEqual(cache.current_bytes, 5)
+        cache["d"] = "x" * 11
+        self.assertNotIn("d", cache)
+        cache["b"] = "x" * 11
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.current_bytes, 4)
+
+    def test_invalid_limits(self):
+        """Test that unusable limits are rejected."""
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=None)
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=0)
+
+    def test_policy_must_implement_every_hook(self):
+        """Test that a policy missing a hook fails on creation, not on its first eviction."""
+        class Incomplete(Cache):
+            def _link(self, entry):
+                return None
+
+        with self.assertRaises(TypeError):
+            Cache()
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+class TestLFUCache(unittest.TestCase):
+    """
+    A unit test suite for the LFUCache implementation.
+    """
+    def test_evicts_least_frequently_used(self):
+        """Test that the entry with the fewest accesses is evicted."""
+        cache = LFUCache(max_entries=3)
+        for key in "abc":
+            cache[key] = key
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache["d"] = "d"
+        self.assertNotIn("c", cache)
+        self.assertEqual(cache.frequency("a"), 3)
+        self.assertEqual(cache.frequency("d"), 1)
+        cache["e"] = "e"
+        self.assertNotIn("d", cache)
+        self.assertEqual(sorted(cache), ["a", "b", "e"])
+
+    def test_ties_break_by_recency(self):
+        """Test that equally frequent entries are evicted oldest first."""
+        cache = LFUCache(max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache.get("b")
+        cache["c"] = 3
+        self.assertEqual(sorted(cache), ["b", "c"])
+
+    def test_pop_lowest_bucket(self):
+        """Test eviction after pop emptied the lowest frequency bucket."""
+        cache = LFUCache(max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("b")
+        cache.pop("a")
+        cache["c"] = 3
+        cache.get("c")
+        cache.get("c")
+        cache["d"] = 4
+        self.assertEqual(sorted(cache), ["c", "d"])
+
+    def test_overwrite_counts_as_access(self):
+        """Test that an overwrite moves an entry up a bucket, even when the cache is full."""
+        cache = LFUCache(max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        self.assertEqual(cache.frequency("a"), 2)
+        cache["c"] = 3
+        self.assertEqual(sorted(cache), ["a", "c"])
+        self.assertEqual(cache["a"], 10)
+        self.assertEqual(cache.frequency("a"), 3)
+
+    def test_oversized_overwrite(self):
+        """Test that an overwrite too large to cache removes the key cleanly."""
+        cache = LFUCache(max_entries=None, max_bytes=10, sizeof=lambda key, value: value)
+        cache["a"] = 4
+        cache["b"] = 4
+        cache["a"] = 20
+        self.assertNotIn("a", cache)
+        cache["c"] = 4
+        cache["d"] = 4
+        self.assertEqual(sorted(cache), ["c", "d"])
+
+class TestTTLCache(unittest.TestCase):
+    """
+    A unit test suite for the TTLCache implementation.
+    """
+    def setUp(self):
+        """Set up a cache driven by a fake clock."""
+        self.clock = FakeClock()
+        self.cache = TTLCache(ttl=10, max_entries=3, timer=self.clock)
+
+    def test_entries_expire(self):
+        """Test that entries disappear after their lifetime."""
+        self.cache["a"] = 1
+        self.clock.now = 5
+        self.cache["b"] = 2
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("b"), 2)
+        self.assertEqual(self.cache.expirations, 1)
+        self.clock.now = 20
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.expirations, 2)
+
+    def test_overwrite_restarts_lifetime(self):
+        """Test that writing a key again extends its lifetime."""
+        self.cache["a"] = 1
+        self.cache["b"] = 2
+        self.clock.now = 8
+        self.cache["a"] = 3
+        self.clock.now = 12
+        self.assertNotIn("b", self.cache)
+        self.assertEqual(self.cache["a"], 3)
+
+    def test_full_cache_evicts_soonest_expiry(self):
+        """Test eviction order when the cache is full."""
+        for step, key in enumerate("abcd"):
+            self.clock.now = step
+            self.cache[key] = step
+        self.assertEqual(sorted(self.cache), ["b", "c", "d"])
+        self.assertEqual(self.cache.evictions, 1)
+        self.clock.now = 11.5
+        self.cache["e"] = 4
+        self.assertEqual(sorted(self.cache), ["c", "d", "e"])
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_invalid_ttl(self):
+        """Test that a non-positive lifetime is rejected."""
+        with self.assertRaises(ValueError):
+            TTLCache(ttl=0)
+
+class TestMemoize(unittest.TestCase):
+    """
+    A unit test suite for the memoize decorator.
+    """
+    def test_bare_decorator(self):
+        """Test memoizing with the default LRU cache."""
+        calls = []
+
+        @memoize
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache.hits, 2)
+        self.assertEqual(square.__name__, "square")
+
+    def test_custom_cache_and_none_results(self):
+        """Test memoizing into a given cache, including None results."""
+        calls = []
+
+        @memoize(cache=LFUCache(max_entries=2))
+        def lookup(key):
+            calls.append(key)
+            return None
+
+        lookup("a")
+        lookup("a")
+        self.assertEqual(calls, ["a"])
+        self.assertIsInstance(lookup.cache, LFUCache)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import random
+import unittest
+
+from src.data_structures.hashing.robin_hood_map import RobinHoodHashMap
+
+class Collider:
+    """A key whose hash is chosen by the test, to force long probe runs."""
+    def __init__(self, name, h):
+        self.name = name
+        self.h = h
+
+    def __hash__(self):
+        return self.h
+
+    def __eq__(self, other):
+        return isinstance(other, Collider) and self.name == other.name
+
+class TestRobinHoodHashMap(unittest.TestCase):
+    """
+    A unit test suite for the RobinHoodHashMap implementation.
+    """
+    def setUp(self):
+        """Set up a new, empty map for each test."""
+        self.map = RobinHoodHashMap()
+
+    def assert_valid(self, mapping):
+        """Checks that every entry is reachable and that probe runs are unbroken."""
+        for table in mapping._tables():
+            for i, h in enumerate(table.hashes):
+                if h == -1:
+                    continue
+                # Every slot between home and the entry must be occupied.
+                home = h >> table.shift
+                j = home
+                while j != i:
+                    self.assertNotEqual(table.hashes[j], -1)
+                    j = (j + 1) & table.mask
+        count = sum(1 for _ in mapping.items())
+        self.assertEqual(count, len(mapping))
+        for key, value in mapping.items():
+            self.assertIs(mapping[key], value)
+
+    def test_set_get_and_delete(self):
+        """Test the basic mapping operations."""
+        self.map["a"] = 1
+        self.map["b"] = 2
+        self.map["a"] = 3
+        self.assertEqual(len(self.map), 2)
+        self.assertEqual(self.map["a"], 3)
+        self.assertEqual(self.map.get("c", 0), 0)
+        self.assertIn("b", self.map)
+        self.assertNotIn("c", self.map)
+        del self.map["a"]
+        self.assertNotIn("a", self.map)
+        with self.assertRaises(KeyError):
+            _ = self.map["a"]
+        with self.assertRaises(KeyError):
+            del self.map["a"]
+        self.assertEqual(self.map.pop("b"), 2)
+        self.assertEqual(self.map.pop("b", None), None)
+        self.assertEqual(len(self.map), 0)
+
+    def test_setdefault_update_and_views(self):
+        """Test setdefault, update, the iteration helpers and repr."""
+        self.assertEqual(self.map.setdefault("x", []), [])
+        self.map.setdefault("x", None).append(1)
+        self.assertEqual(self.map["x"], [1])
+        self.map.update({"y": 2})
+        self.map.update([("z", 3)])
+        self.assertEqual(sorted(self.map), ["x", "y", "z"])
+        self.assertEqual(sorted(self.map.keys()), ["x", "y", "z"])
+        self.assertEqual(sorted(self.map.items(), key=str)[1:], [("y", 2), ("z", 3)])
+        self.assertIn(3, list(self.map.values()))
+        self.assertEqual(repr(RobinHoodHashMap({1: "one"})), "RobinHoodHashMap({1: 'one'})")
+        self.map.clear()
+        self.assertEqual(len(self.map), 0)
+        self.assertEqual(list(self.map), [])
+
+    def test_incremental_resize(self):
+        """Test that growth migrates entries gradually while staying consistent."""
+        mapping = RobinHoodHashMap(capacity=8)
+        saw_resizing = False
+        for key in range(1000):
+            mapping[key] = key * key
+            if mapping.resizing:
+                saw_resizing = True
+                self.assertEqual(mapping[key // 2], (key // 2) ** 2)
+                self.assert_valid(mapping)
+        self.assertTrue(saw_resizing)
+        self.assertGreaterEqual(mapping.capacity, 1024)
+        self.assertEqual(len(mapping), 1000)
+        self.assertTrue(all(mapping[key] == key * key for key in range(1000)))
+
+    def test_deletes_during_resize(self):
+        """Test that removals from the old table do not lose entries."""
+        mapping = RobinHoodHashMap(capacity=64)
+        for key in range(54):
+            mapping[key] = key
+        mapping[54] = 54
+        self.assertTrue(mapping.resizing)
+        for key in range(0, 54, 3):
+            del mapping[key]
+            self.assert_valid(mapping)
+        expected = {key for key in range(55) if key % 3 or key >= 54}
+        self.assertEqual(set(mapping), expected)
+
+    def test_colliding_keys(self):
+        """Test long probe runs with keys sharing the same home slot."""
+        keys = [Collider(f"k{i}", 5 if i % 2 else 6) for i in range(40)]
+        for key in keys:
+            self.map[key] = key.name
+        self.assert_valid(self.map)
+        for key in keys[::3]:
+            del self.map[key]
+        self.assert_valid(self.map)
+        for i, key in enumerate(keys):
+            self.assertEqual(key in self.map, i % 3 != 0)
+
+    def test_random_operations_match_dict(self):
+        """Test random writes and deletes against a dict."""
+        rng = random.Random(11)
+        mapping = RobinHoodHashMap(max_load=0.9)
+        reference = {}
+        for step in range(20000):
+            key = rng.randrange(3000) if step % 2 else f"s{rng.randrange(3000)}"
+            if rng.random() < 0.6:
+                mapping[key] = step
+                reference[key] = step
+            else:
+                self.assertEqual(mapping.pop(key, None), reference.pop(key, None))
+        self.assertEqual(dict(mapping.items()), reference)
+        self.assert_valid(mapping)
+        self.assertLess(max(mapping.probe_lengths()), 32)
+
+    def test_invalid_load_factor(self):
+        """Test that an unusable load factor is rejected."""
+        with self.assertRaises(ValueError):
+            RobinHoodHashMap(max_load=1.0)
+        with self.assertRaises(ValueError):
+            RobinHoodHashMap(max_load=0)
+
+if __name__ == '__main__':
+    unittest.main()
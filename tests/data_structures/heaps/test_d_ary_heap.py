@@ -0,0 +1,87 @@
+import heapq
+import random
+import unittest
+
+from src.data_structures.heaps.d_ary_heap import DAryHeap
+
+class TestDAryHeap(unittest.TestCase):
+    """
+    A unit test suite for the DAryHeap implementation.
+    """
+    def assert_heap(self, heap):
+        """Checks that no element is smaller than its parent."""
+        items = list(heap)
+        for index in range(1, len(items)):
+            self.assertFalse(items[index] < items[(index - 1) // heap.d])
+
+    def test_push_pop_and_peek(self):
+        """Test basic operations for several arities."""
+        for d in [2, 3, 4, 8]:
+            heap = DAryHeap(d=d)
+            for value in [5, 3, 8, 1, 9, 2]:
+                heap.push(value)
+            self.assert_heap(heap)
+            self.assertEqual(heap.peek(), 1)
+            self.assertEqual(len(heap), 6)
+            self.assertEqual([heap.pop() for _ in range(6)], [1, 2, 3, 5, 8, 9])
+            self.assertTrue(heap.is_empty())
+
+    def test_empty_errors(self):
+        """Test errors on an empty heap."""
+        heap = DAryHeap()
+        with self.assertRaises(IndexError):
+            heap.pop()
+        with self.assertRaises(IndexError):
+            heap.peek()
+        with self.assertRaises(IndexError):
+            heap.replace(1)
+        with self.assertRaises(ValueError):
+            DAryHeap(d=1)
+
+    def test_heapify(self):
+        """Test building a heap from an iterable."""
+        values = [random.randrange(1000) for _ in range(500)]
+        for d in [2, 3, 5]:
+            heap = DAryHeap(values, d=d)
+            self.assert_heap(heap)
+            self.assertEqual(list(heap.drain()), sorted(values))
+        self.assertEqual(list(DAryHeap([7]).drain()), [7])
+
+    def test_pushpop_and_replace(self):
+        """Test the combined operations against heapq."""
+        values = [random.randrange(100) for _ in range(50)]
+        ours = DAryHeap(values, d=3)
+        theirs = list(values)
+        heapq.heapify(theirs)
+        for value in range(0, 100, 7):
+            self.assertEqual(ours.pushpop(value), heapq.heappushpop(theirs, value))
+            self.assertEqual(ours.replace(value), heapq.heapreplace(theirs, value))
+        self.assertEqual(list(ours.drain()), sorted(theirs))
+        self.assertEqual(DAryHeap().pushpop(4), 4)
+
+    def test_merge(self):
+        """Test merging small batches, large batches and other heaps."""
+        heap = DAryHeap(range(0, 1000, 2), d=4)
+        heap.merge([1, 3])
+        self.assert_heap(heap)
+        heap.merge(DAryHeap(range(5, 1000, 2)))
+        self.assert_heap(heap)
+        self.assertEqual(list(heap.drain()), list(range(1000)))
+
+    def test_random_operations_match_heapq(self):
+        """Test random operations against heapq."""
+        rng = random.Random(3)
+        ours = DAryHeap(d=4)
+        theirs = []
+        for _ in range(3000):
+            if theirs and rng.random() < 0.4:
+                self.assertEqual(ours.pop(), heapq.heappop(theirs))
+            else:
+                value = (rng.randrange(100), rng.random())
+                ours.push(value)
+                heapq.heappush(theirs, value)
+            self.assertEqual(ours.peek() if theirs else None, theirs[0] if theirs else None)
+        self.assertIn("d=4", repr(ours))
+
+if __name__ == '__main__':
+    unittest.main()
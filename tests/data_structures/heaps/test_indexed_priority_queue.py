@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from src.data_structures.heaps.indexed_priority_queue import Handle, IndexedPriorityQueue
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    """
+    A unit test suite for the IndexedPriorityQueue implementation.
+    """
+    def setUp(self):
+        """Set up a new, empty queue for each test."""
+        self.pq = IndexedPriorityQueue()
+
+    def assert_valid(self, pq):
+        """Checks the heap property and every handle's recorded position."""
+        handles = list(pq)
+        for index, handle in enumerate(handles):
+            self.assertEqual(handle.index, index)
+            if index:
+                self.assertFalse(handle < handles[(index - 1) // pq.d])
+
+    def test_push_and_pop(self):
+        """Test ordering, FIFO ties and peek."""
+        self.pq.push(3, "c")
+        self.pq.push(1, "a")
+        self.pq.push(2, "b1")
+        handle = self.pq.push(2, "b2")
+        self.assertIsInstance(handle, Handle)
+        self.assertEqual(self.pq.peek(), (1, "a"))
+        self.assertEqual([self.pq.pop() for _ in range(4)], [(1, "a"), (2, "b1"), (2, "b2"), (3, "c")])
+        with self.assertRaises(IndexError):
+            self.pq.pop()
+        with self.assertRaises(IndexError):
+            self.pq.peek()
+
+    def test_decrease_key(self):
+        """Test moving an entry to the front."""
+        handles = {name: self.pq.push(priority, name) for priority, name in [(5, "x"), (7, "y"), (9, "z")]}
+        self.pq.decrease_key(handles["z"], 1)
+        self.assert_valid(self.pq)
+        self.assertEqual(self.pq.pop(), (1, "z"))
+        with self.assertRaises(ValueError):
+            self.pq.decrease_key(handles["y"], 8)
+        with self.assertRaises(ValueError):
+            self.pq.decrease_key(handles["z"], 0)
+
+    def test_update_and_remove(self):
+        """Test raising and lowering priorities and removing entries."""
+        handles = [self.pq.push(value, value) for value in range(20)]
+        self.pq.update(handles[0], 100)
+        self.pq.update(handles[19], -1)
+        self.assert_valid(self.pq)
+        self.assertEqual(self.pq.remove(handles[10]), 10)
+        self.assertNotIn(handles[10], self.pq)
+        self.assertEqual(handles[10].index, -1)
+        with self.assertRaises(ValueError):
+            self.pq.remove(handles[10])
+        self.assert_valid(self.pq)
+        order = [self.pq.pop()[1] for _ in range(len(self.pq))]
+        self.assertEqual(order, [19] + [v for v in range(1, 19) if v != 10] + [0])
+
+    def test_foreign_handle(self):
+        """Test that handles of another queue are rejected."""
+        other = IndexedPriorityQueue()
+        handle = other.push(1, "other")
+        self.pq.push(1, "mine")
+        self.assertNotIn(handle, self.pq)
+        with self.assertRaises(ValueError):
+            self.pq.update(handle, 0)
+        with self.assertRaises(ValueError):
+            IndexedPriorityQueue(d=1)
+
+    def test_random_operations(self):
+        """Test random operations against a sorted reference for several arities."""
+        rng = random.Random(9)
+        for d in [2, 4]:
+            pq = IndexedPriorityQueue(d=d)
+            live = {}
+            for step in range(2000):
+                action = rng.random()
+                if action < 0.4 or not live:
+                    live[step] = pq.push(rng.randrange(1000), step)
+                elif action < 0.6:
+                    key = rng.choice(list(live))
+                    pq.update(live[key], rng.randrange(1000))
+                elif action < 0.75:
+                    key = rng.choice(list(live))
+                    pq.remove(live.pop(key))
+                else:
+                    expected = min(live.values(), key=lambda h: (h.priority, h._order))
+                    priority, item = pq.pop()
+                    self.assertEqual((priority, item), (expected.priority, expected.item))
+                    del live[item]
+                self.assertEqual(len(pq), len(live))
+            self.assert_valid(pq)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import sys
+import threading
+import time
+import unittest
+
+from src.data_structures.fundamentals.linked_lists.doubly_linked_list import DoublyLinkedList
+from src.data_structures.synchronized import (
+    ReadWriteLock, SynchronizedBinarySearchTree, SynchronizedCircularLinkedList,
+    SynchronizedDoublyLinkedList, SynchronizedSinglyLinkedList, synchronized,
+)
+from src.data_structures.trees.avl_tree import AVLTree
+
+def run_threads(count, target):
+    """Starts `count` threads running target(thread_index) and joins them."""
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+class TestReadWriteLock(unittest.TestCase):
+    """
+    A unit test suite for the ReadWriteLock implementation.
+    """
+    def test_readers_share_the_lock(self):
+        """Test that several readers can hold the lock together."""
+        lock = ReadWriteLock()
+        inside = []
+        barrier = threading.Barrier(3, timeout=5)
+
+        def reader(_):
+            with lock.read_locked():
+                inside.append(1)
+                barrier.wait()
+
+        run_threads(3, reader)
+        self.assertEqual(len(inside), 3)
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader waits while a writer holds the lock."""
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_write()
+
+        def reader():
+            with lock.read_locked():
+                events.append("read")
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        events.append("write done")
+        lock.release_write()
+        thread.join()
+        self.assertEqual(events, ["write done", "read"])
+
+class TestSynchronizedStructures(unittest.TestCase):
+    """
+    A unit test suite for the thread-safe wrappers.
+    """
+    def setUp(self):
+        """Switch threads very often to provoke races."""
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.interval)
+
+    def assert_list_consistent(self, wrapper):
+        """Checks that size, node count and tail agree."""
+        with wrapper.read() as lst:
+            nodes = list(lst)
+            self.assertEqual(len(nodes), lst.size)
+            if hasattr(lst, "tail"):
+                self.assertIs(lst.tail, nodes[-1] if nodes else None)
+
+    def test_concurrent_appends_are_not_lost(self):
+        """Test that appends from many threads all land."""
+        for wrapper in [SynchronizedSinglyLinkedList(), SynchronizedDoublyLinkedList(),
+                        SynchronizedCircularLinkedList()]:
+            run_threads(8, lambda i: [wrapper.append((i, n)) for n in range(200)])
+            self.assertEqual(len(wrapper), 1600)
+            self.assert_list_consistent(wrapper)
+            for i in range(8):
+                mine = [n for t, n in wrapper.values() if t == i]
+                self.assertEqual(mine, list(range(200)))
+
+    def test_mixed_writers_and_readers(self):
+        """Test appends, prepends and deletes racing with snapshot readers."""
+        wrapper = SynchronizedDoublyLinkedList(indexed=True)
+        wrapper.extend(range(100))
+        errors = []
+
+        def worker(i):
+            for n in range(300):
+                key = (i, n)
+                if i % 2:
+                    wrapper.append(key)
+                    wrapper.delete(key)
+                else:
+                    values = list(wrapper.values())
+                    if len(values) < 100:
+                        errors.append(len(values))
+
+        run_threads(6, worker)
+        self.assertEqual(errors, [])
+        self.assertEqual(wrapper.to_list(), list(range(100)))
+        self.assert_list_consistent(wrapper)
+
+    def test_compound_update(self):
+        """Test a check-then-act sequence made atomic with write()."""
+        wrapper = SynchronizedSinglyLinkedList()
+
+        def worker(_):
+            for key in range(50):
+                with wrapper.write() as lst:
+                    if lst.find(key) is None:
+                        lst.append(key)
+
+        run_threads(6, worker)
+        self.assertEqual(wrapper.to_list(), list(range(50)))
+
+    def test_tree_wrapper(self):
+        """Test concurrent inserts and deletes on a wrapped balanced tree."""
+        wrapper = synchronized(AVLTree())
+        self.assertIsInstance(wrapper, SynchronizedBinarySearchTree)
+
+        def worker(i):
+            for key in range(i, 2000, 4):
+                wrapper.insert(key)
+            for key in range(i, 2000, 8):
+                wrapper.delete(key)
+
+        run_threads(4, worker)
+        expected = [key for key in range(2000) if key % 8 >= 4]
+        self.assertEqual(list(wrapper), expected)
+        self.assertEqual(len(wrapper), len(expected))
+        self.assertEqual(wrapper.select(0), 4)
+        self.assertEqual(list(wrapper.iter_range(10, 16)), [12, 13, 14, 15])
+        self.assertEqual(wrapper.in_order_traversal(), expected)
+
+    def test_wrap_and_repr(self):
+        """Test wrapping existing structures, type checks and repr."""
+        lst = DoublyLinkedList()
+        lst.extend([1, 2])
+        wrapper = synchronized(lst)
+        self.assertEqual(repr(wrapper), "SynchronizedDoublyLinkedList(1 <-> 2)")
+        self.assertIn(2, wrapper)
+        self.assertEqual(wrapper[-1], 2)
+        self.assertEqual(SynchronizedDoublyLinkedList.append.__doc__, DoublyLinkedList.append.__doc__)
+        with self.assertRaises(TypeError):
+            SynchronizedSinglyLinkedList.wrap(lst)
+        with self.assertRaises(TypeError):
+            synchronized([1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
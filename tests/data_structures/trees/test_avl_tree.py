@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from src.data_structures.trees.avl_tree import AVLTree, Node
+
+class TestAVLTree(unittest.TestCase):
+    """
+    A unit test suite for the AVLTree implementation.
+    """
+    def setUp(self):
+        """Set up a new, empty tree for each test."""
+        self.avl = AVLTree()
+
+    def assert_balanced(self, node):
+        """Checks heights and balance factors recursively, returning the height."""
+        if node is None:
+            return 0
+        left = self.assert_balanced(node.left)
+        right = self.assert_balanced(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, 1 + max(left, right))
+        self.assertEqual(node.size, 1 + (node.left.size if node.left else 0)
+                         + (node.right.size if node.right else 0))
+        return node.height
+
+    def test_insert_and_search(self):
+        """Test basic insertion and search functionality."""
+        for value in [50, 30, 70, 20, 40]:
+            self.avl.insert(value)
+        self.assertIsInstance(self.avl.search(50), Node)
+        self.assertIsNotNone(self.avl.search(20))
+        self.assertIsNone(self.avl.search(99))
+        self.assertEqual(len(self.avl), 5)
+
+    def test_duplicates_are_ignored(self):
+        """Test that inserting an existing value leaves the tree unchanged."""
+        self.avl.insert(1)
+        self.avl.insert(1)
+        self.assertEqual(self.avl.in_order_traversal(), [1])
+
+    def test_rotations(self):
+        """Test the four rotation cases produce the expected root."""
+        for values in ([1, 2, 3], [3, 2, 1], [3, 1, 2], [1, 3, 2]):
+            tree = AVLTree()
+            for value in values:
+                tree.insert(value)
+            self.assertEqual(tree.root.data, 2)
+            self.assertEqual(tree.pre_order_traversal(), [2, 1, 3])
+
+    def test_sorted_input_stays_logarithmic(self):
+        """Test that a sorted stream produces a tree of logarithmic height."""
+        for value in range(4096):
+            self.avl.insert(value)
+        self.assertLessEqual(self.avl.root.height, 13)
+        self.assert_balanced(self.avl.root)
+        self.assertEqual(self.avl.in_order_traversal(), list(range(4096)))
+
+    def test_delete(self):
+        """Test deleting leaves, inner nodes and the root keeps the tree balanced."""
+        for value in range(1, 16):
+            self.avl.insert(value)
+        self.avl.delete(self.avl.root.data)
+        self.avl.delete(1)
+        self.avl.delete(12)
+        self.avl.delete(99)
+        self.assert_balanced(self.avl.root)
+        self.assertEqual(self.avl.in_order_traversal(),
+                         [2, 3, 4, 5, 6, 7, 9, 10, 11, 13, 14, 15])
+
+    def test_random_operations(self):
+        """Test a random mix of inserts and deletes against a reference set."""
+        rng = random.Random(7)
+        reference = set()
+        for _ in range(2000):
+            value = rng.randrange(300)
+            if rng.random() < 0.6:
+                self.avl.insert(value)
+                reference.add(value)
+            else:
+                self.avl.delete(value)
+                reference.discard(value)
+        self.assert_balanced(self.avl.root)
+        self.assertEqual(self.avl.in_order_traversal(), sorted(reference))
+        ordered = sorted(reference)
+        self.assertEqual(len(self.avl), len(ordered))
+        self.assertEqual([self.avl.select(k) for k in range(len(ordered))], ordered)
+        self.assertEqual(self.avl.rank(150), sum(1 for v in ordered if v < 150))
+
+    def test_bulk_load(self):
+        """Test that bulk-loaded trees are valid AVL trees that stay balanced."""
+        for size in range(1, 70):
+            tree = AVLTree.from_sorted(range(size))
+            self.assert_balanced(tree.root)
+            self.assertIsInstance(tree.root, Node)
+        tree = AVLTree.from_iterable([9, 2, 7, 4])
+        tree.update(range(20, 40))
+        tree.insert(5)
+        tree.delete(20)
+        self.assert_balanced(tree.root)
+        self.assertEqual(list(tree), [2, 4, 5, 7, 9] + list(range(21, 40)))
+
+    def test_node_is_slotted(self):
+        """Test that nodes use a compact __slots__ layout without a __dict__."""
+        self.avl.insert(1)
+        self.assertFalse(hasattr(self.avl.root, "__dict__"))
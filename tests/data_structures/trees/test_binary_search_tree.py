@@ -109,3 +109,146 @@ class TestBinarySearchTree(unittest.TestCase):
         self.bst.insert(30)
         self.bst.delete(99)
         self.assertEqual(len(self.bst.in_order_traversal()), 2)
+
+    def test_degenerate_tree_does_not_recurse(self):
+        """Test that a tree deeper than the recursion limit supports every operation."""
+        size = sys.getrecursionlimit() + 2000
+        for value in range(size):
+            self.bst.insert(value)
+        self.assertEqual(len(self.bst), size)
+        self.assertIsNotNone(self.bst.search(size - 1))
+        self.assertEqual(self.bst.in_order_traversal(), list(range(size)))
+        self.assertEqual(self.bst.pre_order_traversal(), list(range(size)))
+        self.assertEqual(self.bst.post_order_traversal(), list(range(size - 1, -1, -1)))
+        self.bst.delete(size - 1)
+        self.bst.delete(0)
+        self.assertIsNone(self.bst.search(size - 1))
+        self.assertEqual(len(self.bst), size - 2)
+
+    def test_delete_successor_with_right_child(self):
+        """Test deleting a node whose in-order successor has a right child."""
+        for value in [50, 30, 70, 60, 80, 65]:
+            self.bst.insert(value)
+        self.bst.delete(50)
+        self.assertEqual(self.bst.root.data, 60)
+        self.assertEqual(self.bst.pre_order_traversal(), [60, 30, 70, 65, 80])
+
+    def test_len_tracks_inserts_and_deletes(self):
+        """Test that subtree sizes keep len() correct through updates."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.bst.insert(50)
+        self.assertEqual(len(self.bst), 7)
+        self.bst.delete(50)
+        self.bst.delete(20)
+        self.bst.delete(99)
+        self.assertEqual(len(self.bst), 5)
+        self.assertEqual(self.bst.root.size, 5)
+
+    def test_select(self):
+        """Test k-th smallest lookups, including negative and invalid indices."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual([self.bst.select(k) for k in range(7)], [20, 30, 40, 50, 60, 70, 80])
+        self.assertEqual(self.bst.select(-1), 80)
+        with self.assertRaises(IndexError):
+            self.bst.select(7)
+        with self.assertRaises(IndexError):
+            BinarySearchTree().select(0)
+
+    def test_rank_and_count_range(self):
+        """Test rank and inclusive range counts for present and absent values."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual(self.bst.rank(20), 0)
+        self.assertEqual(self.bst.rank(50), 3)
+        self.assertEqual(self.bst.rank(55), 4)
+        self.assertEqual(self.bst.rank(100), 7)
+        self.assertEqual(self.bst.count_range(30, 70), 5)
+        self.assertEqual(self.bst.count_range(31, 69), 3)
+        self.assertEqual(self.bst.count_range(70, 30), 0)
+
+    def test_lazy_iteration(self):
+        """Test forward, reversed and membership iteration protocols."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst), [20, 30, 40, 50, 60, 70, 80])
+        self.assertEqual(list(reversed(self.bst)), [80, 70, 60, 50, 40, 30, 20])
+        self.assertEqual(next(iter(self.bst)), 20)
+        self.assertIn(40, self.bst)
+        self.assertNotIn(45, self.bst)
+        self.assertEqual(list(BinarySearchTree()), [])
+
+    def test_iter_range(self):
+        """Test inclusive range scans with open and closed bounds."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst.iter_range(30, 60)), [30, 40, 50, 60])
+        self.assertEqual(list(self.bst.iter_range(31, 59)), [40, 50])
+        self.assertEqual(list(self.bst.iter_range(hi=35)), [20, 30])
+        self.assertEqual(list(self.bst.iter_range(lo=65)), [70, 80])
+        self.assertEqual(list(self.bst.iter_range(81, 90)), [])
+        self.assertEqual(list(self.bst.iter_range()), self.bst.in_order_traversal())
+
+    def test_floor_ceiling_successor_predecessor(self):
+        """Test neighbour lookups for present, absent and out-of-range values."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual(self.bst.floor(45), 40)
+        self.assertEqual(self.bst.floor(40), 40)
+        self.assertIsNone(self.bst.floor(10))
+        self.assertEqual(self.bst.ceiling(45), 50)
+        self.assertEqual(self.bst.ceiling(50), 50)
+        self.assertIsNone(self.bst.ceiling(90))
+        self.assertEqual(self.bst.successor(50), 60)
+        self.assertEqual(self.bst.successor(45), 50)
+        self.assertIsNone(self.bst.successor(80))
+        self.assertEqual(self.bst.predecessor(50), 40)
+        self.assertIsNone(self.bst.predecessor(20))
+
+    def test_from_sorted_builds_minimal_height(self):
+        """Test that bulk loading sorted values gives a perfectly balanced tree."""
+        tree = BinarySearchTree.from_sorted(range(1023))
+        self.assertEqual(len(tree), 1023)
+        self.assertEqual(tree.root.data, 511)
+        self.assertEqual(list(tree), list(range(1023)))
+        self.assertEqual(tree.select(100), 100)
+        node = tree.root
+        depth = 0
+        while node is not None:
+            depth += 1
+            node = node.left
+        self.assertEqual(depth, 10)
+
+    def test_from_sorted_validation(self):
+        """Test duplicate collapsing and rejection of unsorted input."""
+        self.assertEqual(list(BinarySearchTree.from_sorted([1, 1, 2, 3, 3])), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            BinarySearchTree.from_sorted([1, 3, 2])
+        self.assertIsNone(BinarySearchTree.from_sorted([]).root)
+
+    def test_from_iterable(self):
+        """Test bulk loading unsorted values with duplicates."""
+        tree = BinarySearchTree.from_iterable([5, 3, 9, 3, 1, 7])
+        self.assertEqual(list(tree), [1, 3, 5, 7, 9])
+        self.assertEqual(tree.root.data, 5)
+
+    def test_update_and_merge(self):
+        """Test bulk inserts through both the incremental and rebuild paths."""
+        self.bst.update(range(0, 100, 2))
+        self.assertEqual(len(self.bst), 50)
+        self.bst.update([1])
+        self.assertIn(1, self.bst)
+        other = BinarySearchTree.from_iterable(range(0, 100, 3))
+        self.bst.merge(other)
+        expected = sorted(set(range(0, 100, 2)) | {1} | set(range(0, 100, 3)))
+        self.assertEqual(list(self.bst), expected)
+        self.assertEqual(self.bst.root.size, len(expected))
+        self.assertEqual(len(other), 34)
+
+    def test_node_is_slotted(self):
+        """Test that nodes use a compact __slots__ layout without a __dict__."""
+        self.bst.insert(1)
+        self.assertFalse(hasattr(self.bst.root, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.bst.root.extra = True
@@ -0,0 +1,108 @@
+import random
+import unittest
+
+from src.data_structures.trees.red_black_tree import RedBlackTree, Node
+
+class TestRedBlackTree(unittest.TestCase):
+    """
+    A unit test suite for the RedBlackTree implementation.
+    """
+    def setUp(self):
+        """Set up a new, empty tree for each test."""
+        self.rbt = RedBlackTree()
+
+    def assert_valid(self, node, parent=None):
+        """Checks colors, parent pointers and black heights, returning the black height."""
+        if node is None:
+            return 1
+        self.assertIs(node.parent, parent)
+        if node.red:
+            self.assertFalse(node.left is not None and node.left.red)
+            self.assertFalse(node.right is not None and node.right.red)
+        left = self.assert_valid(node.left, node)
+        right = self.assert_valid(node.right, node)
+        self.assertEqual(left, right)
+        self.assertEqual(node.size, 1 + (node.left.size if node.left else 0)
+                         + (node.right.size if node.right else 0))
+        return left + (0 if node.red else 1)
+
+    def test_insert_and_search(self):
+        """Test basic insertion and search functionality."""
+        for value in [50, 30, 70, 20, 40]:
+            self.rbt.insert(value)
+        self.assertIsInstance(self.rbt.search(40), Node)
+        self.assertIsNone(self.rbt.search(99))
+        self.assertFalse(self.rbt.root.red)
+        self.assert_valid(self.rbt.root)
+
+    def test_duplicates_are_ignored(self):
+        """Test that inserting an existing value leaves the tree unchanged."""
+        self.rbt.insert(1)
+        self.rbt.insert(1)
+        self.assertEqual(self.rbt.in_order_traversal(), [1])
+
+    def test_sorted_input_stays_logarithmic(self):
+        """Test that a sorted stream keeps the Red-Black invariants."""
+        for value in range(4096):
+            self.rbt.insert(value)
+        black_height = self.assert_valid(self.rbt.root)
+        self.assertLessEqual(black_height, 14)
+        self.assertEqual(self.rbt.in_order_traversal(), list(range(4096)))
+
+    def test_delete(self):
+        """Test deleting leaves, inner nodes and the root keeps the invariants."""
+        for value in range(1, 16):
+            self.rbt.insert(value)
+        self.rbt.delete(self.rbt.root.data)
+        self.rbt.delete(1)
+        self.rbt.delete(15)
+        self.rbt.delete(99)
+        self.assert_valid(self.rbt.root)
+        self.assertEqual(self.rbt.in_order_traversal(),
+                         [2, 3, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14])
+
+    def test_delete_until_empty(self):
+        """Test that deleting every value leaves an empty tree."""
+        for value in range(100):
+            self.rbt.insert(value)
+        for value in range(100):
+            self.rbt.delete(value)
+            self.assert_valid(self.rbt.root)
+        self.assertIsNone(self.rbt.root)
+
+    def test_random_operations(self):
+        """Test a random mix of inserts and deletes against a reference set."""
+        rng = random.Random(11)
+        reference = set()
+        for _ in range(3000):
+            value = rng.randrange(300)
+            if rng.random() < 0.6:
+                self.rbt.insert(value)
+                reference.add(value)
+            else:
+                self.rbt.delete(value)
+                reference.discard(value)
+        self.assert_valid(self.rbt.root)
+        self.assertEqual(self.rbt.in_order_traversal(), sorted(reference))
+        ordered = sorted(reference)
+        self.assertEqual(len(self.rbt), len(ordered))
+        self.assertEqual([self.rbt.select(k) for k in range(len(ordered))], ordered)
+        self.assertEqual(self.rbt.rank(150), sum(1 for v in ordered if v < 150))
+
+    def test_bulk_load(self):
+        """Test that bulk-loaded trees satisfy the Red-Black invariants."""
+        for size in range(1, 300):
+            tree = RedBlackTree.from_sorted(range(size))
+            self.assertFalse(tree.root.red)
+            self.assert_valid(tree.root)
+        tree = RedBlackTree.from_iterable([9, 2, 7, 4])
+        tree.update(range(20, 40))
+        tree.insert(5)
+        tree.delete(20)
+        self.assert_valid(tree.root)
+        self.assertEqual(list(tree), [2, 4, 5, 7, 9] + list(range(21, 40)))
+
+    def test_node_is_slotted(self):
+        """Test that nodes use a compact __slots__ layout without a __dict__."""
+        self.rbt.insert(1)
+        self.assertFalse(hasattr(self.rbt.root, "__dict__"))
@@ -0,0 +1,77 @@
+import unittest
+
+from src.data_structures.trees.sorted_map import SortedMap
+
+class TestSortedMap(unittest.TestCase):
+    """
+    A unit test suite for the SortedMap implementation.
+    """
+    def setUp(self):
+        """Set up a new map with a few entries for each test."""
+        self.map = SortedMap({"banana": 2, "apple": 1, "cherry": 3})
+
+    def test_get_and_set(self):
+        """Test item access, replacement and missing keys."""
+        self.assertEqual(self.map["apple"], 1)
+        self.map["apple"] = 10
+        self.assertEqual(self.map["apple"], 10)
+        self.assertEqual(len(self.map), 3)
+        with self.assertRaises(KeyError):
+            self.map["durian"]
+        self.assertIsNone(self.map.get("durian"))
+        self.assertEqual(self.map.get("durian", 0), 0)
+        self.assertIn("cherry", self.map)
+        self.assertNotIn("durian", self.map)
+
+    def test_delete_and_pop(self):
+        """Test removing entries with del and pop."""
+        del self.map["banana"]
+        self.assertNotIn("banana", self.map)
+        with self.assertRaises(KeyError):
+            del self.map["banana"]
+        self.assertEqual(self.map.pop("apple"), 1)
+        self.assertEqual(self.map.pop("apple", None), None)
+        with self.assertRaises(KeyError):
+            self.map.pop("apple")
+        self.assertEqual(list(self.map.items()), [("cherry", 3)])
+
+    def test_setdefault(self):
+        """Test setdefault stores only missing keys."""
+        self.assertEqual(self.map.setdefault("apple", 99), 1)
+        self.assertEqual(self.map.setdefault("date", []), [])
+        self.map.setdefault("date", []).append(4)
+        self.assertEqual(self.map["date"], [4])
+
+    def test_ordered_views(self):
+        """Test that keys, values and items come back in key order."""
+        self.map["aardvark"] = 0
+        self.assertEqual(list(self.map), ["aardvark", "apple", "banana", "cherry"])
+        self.assertEqual(list(self.map.values()), [0, 1, 2, 3])
+        self.assertEqual(list(reversed(self.map)), ["cherry", "banana", "apple", "aardvark"])
+        self.assertEqual(list(self.map.iter_range("apple", "banana")),
+                         [("apple", 1), ("banana", 2)])
+        self.assertEqual(self.map.peekitem(0), ("aardvark", 0))
+        self.assertEqual(self.map.peekitem(), ("cherry", 3))
+
+    def test_key_function(self):
+        """Test ordering and lookups through a key function."""
+        words = SortedMap(key=str.lower)
+        words["Banana"] = 1
+        words["apple"] = 2
+        words["BANANA"] = 3
+        self.assertEqual(len(words), 2)
+        self.assertEqual(list(words.items()), [("apple", 2), ("Banana", 3)])
+        self.assertEqual(words["banana"], 3)
+
+    def test_many_keys(self):
+        """Test a large number of sorted insertions and deletions."""
+        numbers = SortedMap((i, i * i) for i in range(2000))
+        for i in range(0, 2000, 2):
+            del numbers[i]
+        self.assertEqual(len(numbers), 1000)
+        self.assertEqual(list(numbers)[:3], [1, 3, 5])
+        self.assertEqual(numbers[1999], 1999 * 1999)
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual(repr(SortedMap({2: "b", 1: "a"})), "SortedMap({1: 'a', 2: 'b'})")